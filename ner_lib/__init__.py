@@ -1,51 +1,83 @@
 """NER Library - Named Entity Recognition and Resolution."""
 
-from ner_lib.resolver import EntityResolver
-from ner_lib.models.entity import Entity, Mention, Alias
-from ner_lib.models.candidate import MatchResult, Candidate, NextSteps
-from ner_lib.config import Config, DEFAULT_CONFIG
-
-# New functions - Job 1: Named Entity Recognition
-from ner_lib.recognition import recognize_entities
-
-# New functions - Job 2: Get Aliases
-from ner_lib.aliases import get_aliases, clear_caches
-
-# New functions - Jobs 3-6: Canonicalization
-from ner_lib.canonicalization import (
-    canonicalize_entity,
-    canonicalize_relationship,
-    canonicalize_property_name,
-    canonicalize_property_value
-)
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.2.0"
 __author__ = "Gaurav Dadhich"
 __license__ = "MIT"
 __url__ = "https://github.com/dadhichgaurav1/advanced-text-processing"
 
-__all__ = [
+# Public names -> defining module. They are imported on first attribute
+# access (PEP 562), so `import ner_lib` does not load spaCy, NLTK or the
+# resolver stack until something that needs them is used.
+_LAZY_IMPORTS = {
     # Core resolver
-    "EntityResolver",
+    "EntityResolver": "ner_lib.resolver",
     
     # Models
-    "Entity",
-    "Mention",
-    "Alias",
-    "MatchResult",
-    "Candidate",
-    "NextSteps",
+    "Entity": "ner_lib.models.entity",
+    "Mention": "ner_lib.models.entity",
+    "Alias": "ner_lib.models.entity",
+    "MatchResult": "ner_lib.models.candidate",
+    "Candidate": "ner_lib.models.candidate",
+    "NextSteps": "ner_lib.models.candidate",
     
     # Configuration
-    "Config",
-    "DEFAULT_CONFIG",
+    "Config": "ner_lib.config",
+    "DEFAULT_CONFIG": "ner_lib.config",
+    
+    # New functions - Job 1: Named Entity Recognition
+    "recognize_entities": "ner_lib.recognition",
+    "recognize_entities_batch": "ner_lib.recognition",
+    "group_by_type": "ner_lib.recognition",
+    "entities_to_soa": "ner_lib.recognition",
+    
+    # New functions - Job 2: Get Aliases
+    "get_aliases": "ner_lib.aliases",
+    "clear_caches": "ner_lib.aliases",
+    
+    # New functions - Jobs 3-6: Canonicalization
+    "canonicalize_entity": "ner_lib.canonicalization",
+    "canonicalize_relationship": "ner_lib.canonicalization",
+    "canonicalize_property_name": "ner_lib.canonicalization",
+    "canonicalize_property_value": "ner_lib.canonicalization",
+    "canonicalize_batch": "ner_lib.canonicalization",
+}
+
+if TYPE_CHECKING:
+    from ner_lib.resolver import EntityResolver
+    from ner_lib.models.entity import Entity, Mention, Alias
+    from ner_lib.models.candidate import MatchResult, Candidate, NextSteps
+    from ner_lib.config import Config, DEFAULT_CONFIG
+    from ner_lib.recognition import (
+        recognize_entities,
+        recognize_entities_batch,
+        group_by_type,
+        entities_to_soa
+    )
+    from ner_lib.aliases import get_aliases, clear_caches
+    from ner_lib.canonicalization import (
+        canonicalize_entity,
+        canonicalize_relationship,
+        canonicalize_property_name,
+        canonicalize_property_value,
+        canonicalize_batch
+    )
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """Import a public name from its module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    # New functions
-    "recognize_entities",
-    "get_aliases",
-    "clear_caches",
-    "canonicalize_entity",
-    "canonicalize_relationship",
-    "canonicalize_property_name",
-    "canonicalize_property_value",
-]
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
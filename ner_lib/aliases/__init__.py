@@ -2,11 +2,12 @@
 
 from ner_lib.aliases.alias_retrieval import get_aliases, clear_caches
 from ner_lib.aliases.wikidata_client import WikidataClient
-from ner_lib.aliases.synonym_provider import SynonymProvider
+from ner_lib.aliases.synonym_provider import SynonymProvider, build_synonym_trie
 
 __all__ = [
     "get_aliases",
     "clear_caches",
     "WikidataClient",
-    "SynonymProvider"
+    "SynonymProvider",
+    "build_synonym_trie"
 ]
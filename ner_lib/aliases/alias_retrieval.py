@@ -1,6 +1,7 @@
 """Main alias retrieval function coordinating all sources."""
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import logging
 from ner_lib.config import DEFAULT_CONFIG
 from ner_lib.aliases.wikidata_client import WikidataClient
@@ -91,7 +92,8 @@ def get_aliases(
                 _synonym_provider = SynonymProvider(
                     use_spacy_wordnet=config.synonyms.use_spacy_wordnet,
                     use_nltk_fallback=config.synonyms.use_nltk_fallback,
-                    filter_by_pos=config.synonyms.filter_by_pos
+                    filter_by_pos=config.synonyms.filter_by_pos,
+                    trie_path=config.synonyms.trie_path
                 )
             
             # Determine POS tag based on input type
@@ -102,15 +104,11 @@ def get_aliases(
             }
             pos_tag = pos_tag_map.get(input_type)
             
-            # Get synonyms from WordNet
-            synonyms = _synonym_provider.get_synonyms(
-                word=input_text,
-                pos_tag=pos_tag,
-                max_synonyms=config.synonyms.max_synonyms
-            )
+            # Get synonyms from WordNet (memoized)
+            synonyms = _cached_synonyms(input_text, pos_tag, config.synonyms.max_synonyms)
             
             return {
-                "aliases": synonyms,
+                "aliases": list(synonyms),
                 "description": f"Synonyms for {input_type.replace('-', ' ')}",
                 "source": "wordnet",
                 "success": True
@@ -127,6 +125,29 @@ def get_aliases(
         }
 
 
+@lru_cache(maxsize=4096)
+def _cached_synonyms(word: str, pos_tag: Optional[str], max_synonyms: int) -> Tuple[str, ...]:
+    """
+    WordNet synonyms from the shared synonym provider, memoized.
+    
+    Relationship and property canonicalization look up the same few words
+    over and over; repeats become a dict hit instead of a WordNet lookup.
+    
+    Args:
+        word: Word to find synonyms for
+        pos_tag: Part-of-speech filter ('VERB', 'NOUN', ...)
+        max_synonyms: Maximum number of synonyms
+    
+    Returns:
+        Tuple of synonyms (immutable, so cached results cannot be modified)
+    """
+    return tuple(_synonym_provider.get_synonyms(
+        word=word,
+        pos_tag=pos_tag,
+        max_synonyms=max_synonyms
+    ))
+
+
 def clear_caches():
     """Clear all caches for Wikidata and synonym providers."""
     global _wikidata_client, _synonym_provider
@@ -135,7 +156,8 @@ def clear_caches():
         _wikidata_client.cache.clear()
         logger.info("Cleared Wikidata cache")
     
-    # Synonym provider doesn't have a cache, but we can reinitialize
+    # Drop memoized synonyms and reinitialize the provider on next use
+    _cached_synonyms.cache_clear()
     _synonym_provider = None
     
     logger.info("Cleared all caches")
@@ -1,10 +1,65 @@
 """Synonym provider using spacy-wordnet and NLTK WordNet."""
 
-from typing import List, Optional, Set
+from typing import Iterable, List, Optional, Set
 import logging
 
+try:
+    import marisa_trie
+    MARISA_AVAILABLE = True
+except ImportError:
+    MARISA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Trie key part for lookups without a POS filter
+_ANY_POS = "*"
+
+
+def _trie_key(word: str, wordnet_pos: Optional[str]) -> str:
+    """Synonym trie key for a WordNet lookup (wn.synsets lowercases its input)."""
+    return f"{wordnet_pos or _ANY_POS}:{word.replace(' ', '_').lower()}"
+
+
+def build_synonym_trie(path: str, lemma_names: Optional[Iterable[str]] = None) -> int:
+    """
+    Export NLTK WordNet synonyms to a memory-mappable marisa-trie file.
+    
+    Every lemma is stored with the synonyms NLTK returns for it with and
+    without each POS filter, so a trie hit gives the same answer as the
+    NLTK lookup. Load the file with SynonymProvider(trie_path=path).
+    
+    Args:
+        path: Output file
+        lemma_names: Lemmas to export (default: all WordNet lemmas)
+    
+    Returns:
+        Number of keys written
+    """
+    if not MARISA_AVAILABLE:
+        raise ImportError("marisa-trie is required to build a synonym trie. Install with: pip install marisa-trie")
+    
+    from nltk.corpus import wordnet as wn
+    
+    if lemma_names is None:
+        lemma_names = wn.all_lemma_names()
+    
+    records = []
+    for lemma_name in lemma_names:
+        for wordnet_pos in (None, wn.NOUN, wn.VERB, wn.ADJ, wn.ADV):
+            synonyms = {
+                lemma.name().replace('_', ' ').lower()
+                for synset in wn.synsets(lemma_name, pos=wordnet_pos)
+                for lemma in synset.lemmas()
+            }
+            if synonyms:
+                records.append((
+                    _trie_key(lemma_name, wordnet_pos),
+                    "\t".join(sorted(synonyms)).encode('utf-8')
+                ))
+    
+    marisa_trie.BytesTrie(records).save(path)
+    return len(records)
+
 
 class SynonymProvider:
     """Provides synonyms using spacy-wordnet and NLTK WordNet fallback."""
@@ -13,7 +68,8 @@ class SynonymProvider:
         self,
         use_spacy_wordnet: bool = True,
         use_nltk_fallback: bool = True,
-        filter_by_pos: bool = True
+        filter_by_pos: bool = True,
+        trie_path: Optional[str] = None
     ):
         """
         Initialize synonym provider.
@@ -22,11 +78,22 @@ class SynonymProvider:
             use_spacy_wordnet: Use spacy-wordnet for synonyms
             use_nltk_fallback: Use NLTK WordNet as fallback
             filter_by_pos: Filter synonyms by part-of-speech
+            trie_path: Synonym trie written by build_synonym_trie(); it is
+                memory-mapped and answers NLTK lookups before WordNet is
+                consulted (words not in the trie still go to NLTK)
         """
         self.use_spacy_wordnet = use_spacy_wordnet
         self.use_nltk_fallback = use_nltk_fallback
         self.filter_by_pos = filter_by_pos
         
+        self.trie = None
+        if trie_path:
+            if MARISA_AVAILABLE:
+                self.trie = marisa_trie.BytesTrie().mmap(trie_path)
+                logger.info(f"Memory-mapped synonym trie: {trie_path}")
+            else:
+                logger.warning("marisa-trie not available, ignoring trie_path. Install with: pip install marisa-trie")
+        
         # Initialize spacy-wordnet if available
         self.spacy_wordnet_available = False
         if use_spacy_wordnet:
@@ -106,7 +173,7 @@ class SynonymProvider:
                 logger.debug(f"spacy-wordnet error for '{word}': {e}")
         
         # Use NLTK fallback if needed
-        if self.nltk_available and self.use_nltk_fallback:
+        if (self.trie is not None or self.nltk_available) and self.use_nltk_fallback:
             if not synonyms or len(synonyms) < max_synonyms:
                 try:
                     syns = self._get_nltk_synonyms(word, pos_tag)
@@ -167,12 +234,19 @@ class SynonymProvider:
         word: str,
         pos_tag: Optional[str] = None
     ) -> Set[str]:
-        """Get synonyms using NLTK WordNet."""
-        from nltk.corpus import wordnet as wn
-        
+        """Get synonyms using NLTK WordNet (or the synonym trie, if loaded)."""
         # Convert POS tag to WordNet POS
         wordnet_pos = self._convert_pos_to_wordnet(pos_tag) if pos_tag else None
         
+        if self.trie is not None:
+            values = self.trie.get(_trie_key(word, wordnet_pos))
+            if values:
+                return set(values[0].decode('utf-8').split("\t"))
+            if not self.nltk_available:
+                return set()
+        
+        from nltk.corpus import wordnet as wn
+        
         synonyms = set()
         
         # Try with underscores (for multi-word expressions like "rely_on")
@@ -192,14 +266,12 @@ class SynonymProvider:
         return synonyms
     
     def _convert_pos_to_wordnet(self, pos_tag: str) -> Optional[str]:
-        """Convert spaCy POS tag to WordNet POS."""
-        from nltk.corpus import wordnet as wn
-        
+        """Convert spaCy POS tag to WordNet POS (wn.VERB, wn.NOUN, ...)."""
         pos_map = {
-            'VERB': wn.VERB,
-            'NOUN': wn.NOUN,
-            'ADJ': wn.ADJ,
-            'ADV': wn.ADV
+            'VERB': 'v',
+            'NOUN': 'n',
+            'ADJ': 'a',
+            'ADV': 'r'
         }
         
         return pos_map.get(pos_tag.upper())
@@ -1,6 +1,8 @@
 """Faiss-based ANN search for candidate generation."""
 
 from typing import List, Optional, Tuple
+import math
+import os
 import numpy as np
 
 try:
@@ -9,6 +11,22 @@ try:
 except ImportError:
     FAISS_AVAILABLE = False
 
+_THREADS_INITIALIZED = False
+
+
+def _init_threads():
+    """
+    Let Faiss use every core for search (done once per process).
+    
+    An explicit OMP_NUM_THREADS setting is left in charge.
+    """
+    global _THREADS_INITIALIZED
+    
+    if not _THREADS_INITIALIZED:
+        if "OMP_NUM_THREADS" not in os.environ:
+            faiss.omp_set_num_threads(os.cpu_count() or 1)
+        _THREADS_INITIALIZED = True
+
 
 class FaissIndex:
     """Faiss-based ANN index for entity embeddings."""
@@ -17,42 +35,117 @@ class FaissIndex:
         self,
         embedding_dim: int,
         index_type: str = "flat",
-        metric: str = "cosine"
+        metric: str = "cosine",
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        ef_search: int = 64
     ):
         """
         Initialize Faiss index.
         
         Args:
             embedding_dim: Dimension of embeddings
-            index_type: Type of index ('flat' or 'ivf')
+            index_type: Type of index ('flat', 'ivf') or a Faiss
+                index_factory string (see factory_string_for)
             metric: Distance metric ('cosine' or 'l2')
+            nlist: Number of IVF cells (defaults to 4*sqrt(n) at build time)
+            nprobe: Number of IVF cells visited per query
+            ef_search: efSearch of an HNSW coarse quantizer
         """
         if not FAISS_AVAILABLE:
             raise ImportError("faiss not installed. Install with: pip install faiss-cpu")
         
+        _init_threads()
+        
         self.embedding_dim = embedding_dim
         self.index_type = index_type
         self.metric = metric
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.ef_search = ef_search
         
-        # Create index
-        if metric == "cosine":
-            # For cosine similarity, use inner product on normalized vectors
-            if index_type == "flat":
-                self.index = faiss.IndexFlatIP(embedding_dim)
-            else:
-                # IVF index for larger datasets
-                quantizer = faiss.IndexFlatIP(embedding_dim)
-                self.index = faiss.IndexIVFFlat(quantizer, embedding_dim, 100)
-        else:
-            # L2 distance
-            if index_type == "flat":
-                self.index = faiss.IndexFlatL2(embedding_dim)
-            else:
-                quantizer = faiss.IndexFlatL2(embedding_dim)
-                self.index = faiss.IndexIVFFlat(quantizer, embedding_dim, 100)
+        # Flat indices are created up front; IVF and factory indices need
+        # the dataset size to pick nlist, so they are created in build_index
+        self.index = self._create_index(0) if index_type == "flat" else None
         
         self.entity_ids: List[str] = []
         self.is_trained = False
+        self.read_only = False  # set for memory-mapped indices
+    
+    @staticmethod
+    def factory_string_for(
+        n_vectors: int,
+        ivf_min_vectors: int = 10_000,
+        ivfpq_min_vectors: int = 1_000_000,
+        pq_m: int = 64
+    ) -> str:
+        """
+        Pick a Faiss index_factory string for a dataset size.
+        
+        Flat search is exact but O(N*d) per query; IVF restricts the scan
+        to nprobe cells, and OPQ + PQ additionally compresses the vectors
+        with an HNSW graph over the IVF centroids.
+        
+        Args:
+            n_vectors: Number of vectors to index
+            ivf_min_vectors: Use IVF from this many vectors
+            ivfpq_min_vectors: Use OPQ/IVF-HNSW/PQ from this many vectors
+            pq_m: Number of PQ sub-quantizers
+        
+        Returns:
+            Factory string, e.g. 'IVF400,Flat'
+        """
+        nlist = max(1, int(4 * math.sqrt(n_vectors)))
+        if n_vectors < ivf_min_vectors:
+            return "Flat"
+        if n_vectors < ivfpq_min_vectors:
+            return f"IVF{nlist},Flat"
+        return f"OPQ{pq_m}_{2 * pq_m},IVF{nlist}_HNSW32,PQ{pq_m}"
+    
+    def _create_index(self, n_vectors: int):
+        """Create the underlying Faiss index for n_vectors."""
+        # For cosine similarity, use inner product on normalized vectors
+        if self.metric == "cosine":
+            faiss_metric = faiss.METRIC_INNER_PRODUCT
+            quantizer = faiss.IndexFlatIP(self.embedding_dim)
+        else:
+            faiss_metric = faiss.METRIC_L2
+            quantizer = faiss.IndexFlatL2(self.embedding_dim)
+        
+        if self.index_type == "flat":
+            return quantizer
+        
+        if self.index_type != "ivf":
+            return faiss.index_factory(self.embedding_dim, self.index_type, faiss_metric)
+        
+        # IVF index for larger datasets
+        nlist = self.nlist or max(1, int(4 * math.sqrt(n_vectors)))
+        return faiss.IndexIVFFlat(quantizer, self.embedding_dim, nlist, faiss_metric)
+    
+    def set_search_params(self, nprobe: Optional[int] = None, ef_search: Optional[int] = None):
+        """
+        Set query-time search parameters (no effect on flat indices).
+        
+        Args:
+            nprobe: Number of IVF cells visited per query
+            ef_search: efSearch of an HNSW coarse quantizer
+        """
+        if nprobe is not None:
+            self.nprobe = nprobe
+        if ef_search is not None:
+            self.ef_search = ef_search
+        
+        if self.index is None:
+            return
+        
+        ivf = faiss.try_extract_index_ivf(self.index)
+        if ivf is None:
+            return
+        
+        ivf.nprobe = self.nprobe
+        quantizer = faiss.downcast_index(ivf.quantizer)
+        if isinstance(quantizer, faiss.IndexHNSW):
+            quantizer.hnsw.efSearch = self.ef_search
     
     def build_index(self, entity_ids: List[str], embeddings: np.ndarray):
         """
@@ -60,7 +153,8 @@ class FaissIndex:
         
         Args:
             entity_ids: List of entity IDs
-            embeddings: Array of shape (n_entities, embedding_dim)
+            embeddings: Array of shape (n_entities, embedding_dim). A float32
+                C-contiguous array is L2-normalized in place for cosine.
         """
         if embeddings.shape[0] != len(entity_ids):
             raise ValueError("Number of embeddings must match number of entity IDs")
@@ -68,19 +162,107 @@ class FaissIndex:
         if embeddings.shape[1] != self.embedding_dim:
             raise ValueError(f"Embedding dimension mismatch: {embeddings.shape[1]} != {self.embedding_dim}")
         
-        # Normalize embeddings if using cosine similarity
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        
+        # Normalize embeddings once, in place, if using cosine similarity
+        # (inner product on unit vectors equals cosine)
         if self.metric == "cosine":
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            embeddings = embeddings / np.maximum(norms, 1e-10)
+            faiss.normalize_L2(embeddings)
         
-        # Train IVF index if needed
-        if self.index_type == "ivf" and not self.is_trained:
-            self.index.train(embeddings.astype(np.float32))
-            self.is_trained = True
+        # Create and train IVF index if needed
+        if self.index is None:
+            self.index = self._create_index(len(entity_ids))
+            self.set_search_params()
+        if not self.index.is_trained:
+            self.index.train(embeddings)
+        self.is_trained = True
         
         # Add vectors
-        self.index.add(embeddings.astype(np.float32))
-        self.entity_ids = entity_ids
+        self.index.add(embeddings)
+        self.entity_ids = list(entity_ids)
+    
+    def add(self, entity_ids: List[str], embeddings: np.ndarray):
+        """
+        Add entities to a built index without rebuilding it.
+        
+        IVF indices keep the cells they were trained with, so recall can
+        degrade if many entities are added far from the original data.
+        
+        Args:
+            entity_ids: Entity IDs to add
+            embeddings: Array of shape (len(entity_ids), embedding_dim)
+        """
+        if self.index is None or not self.index.is_trained:
+            raise ValueError("Index has not been built")
+        if self.read_only:
+            raise ValueError("Cannot add to a memory-mapped index")
+        
+        if embeddings.shape[0] != len(entity_ids):
+            raise ValueError("Number of embeddings must match number of entity IDs")
+        
+        embeddings = np.array(embeddings, dtype=np.float32)
+        if self.metric == "cosine":
+            faiss.normalize_L2(embeddings)
+        
+        self.index.add(embeddings)
+        self.entity_ids.extend(entity_ids)
+    
+    def save(self, directory: str):
+        """
+        Persist the index and entity IDs to a directory.
+        
+        Writes 'faiss.index' and 'ids.npy'.
+        
+        Args:
+            directory: Target directory (created if missing)
+        """
+        if self.index is None:
+            raise ValueError("Index has not been built")
+        
+        os.makedirs(directory, exist_ok=True)
+        faiss.write_index(self.index, os.path.join(directory, "faiss.index"))
+        np.save(os.path.join(directory, "ids.npy"), np.asarray(self.entity_ids, dtype=str))
+    
+    @classmethod
+    def load(
+        cls,
+        directory: str,
+        mmap: bool = True,
+        nprobe: int = 16,
+        ef_search: int = 64
+    ) -> "FaissIndex":
+        """
+        Load an index written by save().
+        
+        With mmap=True the index is memory-mapped read-only, so worker
+        processes loading the same file share physical pages.
+        
+        Args:
+            directory: Directory containing 'faiss.index' and 'ids.npy'
+            mmap: Memory-map files instead of reading them into RAM
+            nprobe: Number of IVF cells visited per query
+            ef_search: efSearch of an HNSW coarse quantizer
+        
+        Returns:
+            Loaded FaissIndex
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError("faiss not installed. Install with: pip install faiss-cpu")
+        
+        io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        index = faiss.read_index(os.path.join(directory, "faiss.index"), io_flags)
+        entity_ids = np.load(os.path.join(directory, "ids.npy")).tolist()
+        
+        metric = "cosine" if index.metric_type == faiss.METRIC_INNER_PRODUCT else "l2"
+        index_type = "flat" if faiss.try_extract_index_ivf(index) is None else "ivf"
+        
+        instance = cls(embedding_dim=index.d, index_type=index_type, metric=metric)
+        instance.index = index
+        instance.entity_ids = entity_ids
+        instance.is_trained = index.is_trained
+        instance.read_only = mmap
+        instance.set_search_params(nprobe=nprobe, ef_search=ef_search)
+        return instance
     
     def search(
         self,
@@ -100,30 +282,30 @@ class FaissIndex:
         if len(self.entity_ids) == 0:
             return [], []
         
-        # Reshape query to (1, embedding_dim)
-        query = query_embedding.reshape(1, -1)
+        # Copy query to a (1, embedding_dim) float32 array
+        query = np.array(query_embedding, dtype=np.float32).reshape(1, -1)
         
         # Normalize if using cosine similarity
         if self.metric == "cosine":
-            norm = np.linalg.norm(query)
-            if norm > 0:
-                query = query / norm
+            faiss.normalize_L2(query)
         
         # Search
         top_k = min(top_k, len(self.entity_ids))
-        distances, indices = self.index.search(query.astype(np.float32), top_k)
+        distances, indices = self.index.search(query, top_k)
         
         # Convert to entity IDs and scores
-        entity_ids = [self.entity_ids[idx] for idx in indices[0]]
+        # IVF indices pad with -1 when fewer than top_k vectors are probed
+        valid = indices[0] >= 0
+        entity_ids = [self.entity_ids[idx] for idx in indices[0][valid]]
         
         # Convert distances to similarity scores
         if self.metric == "cosine":
             # Inner product is already similarity (0-1 for normalized vectors)
-            scores = distances[0].tolist()
+            scores = distances[0][valid].tolist()
         else:
             # Convert L2 distance to similarity
             # Similarity = 1 / (1 + distance)
-            scores = [1.0 / (1.0 + d) for d in distances[0]]
+            scores = [1.0 / (1.0 + d) for d in distances[0][valid]]
         
         return entity_ids, scores
     
@@ -146,26 +328,26 @@ class FaissIndex:
             return [[] for _ in range(len(query_embeddings))], [[] for _ in range(len(query_embeddings))]
         
         # Normalize if using cosine
-        queries = query_embeddings.copy()
+        queries = np.array(query_embeddings, dtype=np.float32)
         if self.metric == "cosine":
-            norms = np.linalg.norm(queries, axis=1, keepdims=True)
-            queries = queries / np.maximum(norms, 1e-10)
+            faiss.normalize_L2(queries)
         
         # Search
         top_k = min(top_k, len(self.entity_ids))
-        distances, indices = self.index.search(queries.astype(np.float32), top_k)
+        distances, indices = self.index.search(queries, top_k)
         
         # Convert results
         all_entity_ids = []
         all_scores = []
         
         for i in range(len(queries)):
-            entity_ids = [self.entity_ids[idx] for idx in indices[i]]
+            valid = indices[i] >= 0
+            entity_ids = [self.entity_ids[idx] for idx in indices[i][valid]]
             
             if self.metric == "cosine":
-                scores = distances[i].tolist()
+                scores = distances[i][valid].tolist()
             else:
-                scores = [1.0 / (1.0 + d) for d in distances[i]]
+                scores = [1.0 / (1.0 + d) for d in distances[i][valid]]
             
             all_entity_ids.append(entity_ids)
             all_scores.append(scores)
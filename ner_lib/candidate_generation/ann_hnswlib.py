@@ -76,9 +76,33 @@ class HNSWIndex:
         labels = np.arange(n_entities)
         self.index.add_items(embeddings.astype(np.float32), labels)
         
-        self.entity_ids = entity_ids
+        self.entity_ids = list(entity_ids)
         self.initialized = True
     
+    def add(self, entity_ids: List[str], embeddings: np.ndarray):
+        """
+        Add entities to a built index without rebuilding it.
+        
+        Args:
+            entity_ids: Entity IDs to add
+            embeddings: Array of shape (len(entity_ids), embedding_dim)
+        """
+        if not self.initialized:
+            raise ValueError("Index has not been built")
+        
+        if embeddings.shape[0] != len(entity_ids):
+            raise ValueError("Number of embeddings must match number of entity IDs")
+        
+        # Grow capacity geometrically so repeated adds stay amortized O(1)
+        start = len(self.entity_ids)
+        required = start + len(entity_ids)
+        if required > self.index.get_max_elements():
+            self.index.resize_index(max(required, 2 * self.index.get_max_elements()))
+        
+        labels = np.arange(start, required)
+        self.index.add_items(embeddings.astype(np.float32), labels)
+        self.entity_ids.extend(entity_ids)
+    
     def search(
         self,
         query_embedding: np.ndarray,
@@ -149,6 +149,11 @@ class CombinedBlocker:
         self.prefix_blocker.add_entity(entity_id, canonical_name, aliases)
         self.token_blocker.add_entity(entity_id, canonical_name, aliases)
     
+    def clear(self):
+        """Remove all entities from all blockers."""
+        self.prefix_blocker.prefix_map.clear()
+        self.token_blocker.token_map.clear()
+    
     def get_candidates(self, mention: str) -> List[str]:
         """
         Get union of candidates from all blockers.
@@ -6,10 +6,12 @@ from ner_lib.canonicalization.property_canonicalization import (
     canonicalize_property_name,
     canonicalize_property_value
 )
+from ner_lib.canonicalization.batch_canonicalization import canonicalize_batch
 
 __all__ = [
     "canonicalize_entity",
     "canonicalize_relationship",
     "canonicalize_property_name",
-    "canonicalize_property_value"
+    "canonicalize_property_value",
+    "canonicalize_batch"
 ]
@@ -0,0 +1,69 @@
+"""Batched canonicalization sharing one spaCy pass."""
+
+from typing import Dict, List, Optional, Sequence
+import logging
+from ner_lib.utils.nlp import get_spacy_model
+from ner_lib.canonicalization.relationship_canonicalization import canonicalize_relationship
+from ner_lib.canonicalization.property_canonicalization import (
+    canonicalize_property_name,
+    canonicalize_property_value
+)
+
+logger = logging.getLogger(__name__)
+
+# Canonicalizer for each kind (same names as get_aliases input types)
+_CANONICALIZERS = {
+    "relationship": canonicalize_relationship,
+    "property-name": canonicalize_property_name,
+    "property-value": canonicalize_property_value
+}
+
+
+def canonicalize_batch(
+    texts: Sequence[str],
+    kinds: Sequence[str],
+    config: Optional[Dict] = None,
+    batch_size: int = 32
+) -> List[Dict]:
+    """
+    Canonicalize many relationships / property names / property values.
+    
+    All texts are parsed in one nlp.pipe pass instead of one spaCy call
+    each; every text is then canonicalized as by the function for its kind.
+    
+    Args:
+        texts: Texts to canonicalize
+        kinds: Kind of each text - "relationship", "property-name" or
+            "property-value"
+        config: Optional configuration override
+        batch_size: Number of texts per spaCy batch
+    
+    Returns:
+        List of canonicalization results, in input order
+    
+    Example:
+        >>> results = canonicalize_batch(
+        ...     ["executing", "fastest"],
+        ...     ["relationship", "property-name"]
+        ... )
+        >>> print([r['lemma'] for r in results])
+        ['execute', 'fast']
+    """
+    if len(texts) != len(kinds):
+        raise ValueError(f"Got {len(texts)} texts but {len(kinds)} kinds")
+    
+    invalid = set(kinds) - _CANONICALIZERS.keys()
+    if invalid:
+        raise ValueError(f"Invalid kinds {sorted(invalid)}. Must be one of: {list(_CANONICALIZERS)}")
+    
+    try:
+        docs = list(get_spacy_model().pipe(texts, batch_size=batch_size))
+    except Exception as e:
+        # Let each canonicalizer report the failure in its own result
+        logger.error(f"Error parsing canonicalization batch: {e}")
+        docs = [None] * len(texts)
+    
+    return [
+        _CANONICALIZERS[kind](text, config=config, doc=doc)
+        for text, kind, doc in zip(texts, kinds, docs)
+    ]
@@ -1,11 +1,14 @@
 """Canonicalization for property names and values."""
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 import logging
 from ner_lib.config import DEFAULT_CONFIG
 from ner_lib.aliases.alias_retrieval import get_aliases
 from ner_lib.utils.nlp import get_spacy_model
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
 logger = logging.getLogger(__name__)
 
 # Global semantic matcher instances (lazy loaded)
@@ -15,7 +18,8 @@ _property_matcher = None
 
 def canonicalize_property_name(
     property_name: str,
-    config: Optional[Dict] = None
+    config: Optional[Dict] = None,
+    doc: Optional["Doc"] = None
 ) -> Dict:
     """
     Canonicalize a property name using syntax-aware parsing (noun chunks).
@@ -29,16 +33,18 @@ def canonicalize_property_name(
     Args:
         property_name: Property name (e.g., "date of birth", "first name")
         config: Optional configuration override
+        doc: Already-parsed spaCy Doc of property_name (see canonicalize_batch)
     
     Returns:
         Dictionary containing canonical form and metadata.
     """
-    return _canonicalize_noun_phrase(property_name, "property-name", config)
+    return _canonicalize_noun_phrase(property_name, "property-name", config, doc)
 
 
 def canonicalize_property_value(
     property_value: str,
-    config: Optional[Dict] = None
+    config: Optional[Dict] = None,
+    doc: Optional["Doc"] = None
 ) -> Dict:
     """
     Canonicalize a property value using syntax-aware parsing.
@@ -52,17 +58,19 @@ def canonicalize_property_value(
     Args:
         property_value: Property value (e.g., "United States", "blue cars")
         config: Optional configuration override
+        doc: Already-parsed spaCy Doc of property_value (see canonicalize_batch)
     
     Returns:
         Dictionary containing canonical form and metadata.
     """
-    return _canonicalize_noun_phrase(property_value, "property-value", config)
+    return _canonicalize_noun_phrase(property_value, "property-value", config, doc)
 
 
 def _canonicalize_noun_phrase(
     text: str,
     input_type: str,
-    config: Optional[Dict] = None
+    config: Optional[Dict] = None,
+    doc: Optional["Doc"] = None
 ) -> Dict:
     """Shared logic for noun phrase canonicalization."""
     
@@ -75,8 +83,8 @@ def _canonicalize_noun_phrase(
                     config.semantic_matching.canonical_properties)
         
     try:
-        nlp = get_spacy_model()
-        doc = nlp(text)
+        if doc is None:
+            doc = get_spacy_model()(text)
         
         # Step 1: Identify best noun chunk or use subtree of root noun
         root = None
@@ -1,11 +1,14 @@
 """Canonicalization for relationships/verbs."""
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 import logging
 from ner_lib.config import DEFAULT_CONFIG
 from ner_lib.aliases.alias_retrieval import get_aliases
 from ner_lib.utils.nlp import get_spacy_model
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
 logger = logging.getLogger(__name__)
 
 # Global semantic matcher instances (lazy loaded)
@@ -15,7 +18,8 @@ _property_matcher = None
 
 def canonicalize_relationship(
     relationship: str,
-    config: Optional[Dict] = None
+    config: Optional[Dict] = None,
+    doc: Optional["Doc"] = None
 ) -> Dict:
     """
     Canonicalize a relationship/verb using syntax-aware parsing.
@@ -30,6 +34,7 @@ def canonicalize_relationship(
     Args:
         relationship: Relationship text (e.g., "is running", "relies on")
         config: Optional configuration override
+        doc: Already-parsed spaCy Doc of relationship (see canonicalize_batch)
     
     Returns:
         Dictionary containing:
@@ -50,10 +55,9 @@ def canonicalize_relationship(
                     config.semantic_matching.canonical_relationships)
     
     try:
-        nlp = get_spacy_model()
-        
         # Step 1: Tokenize and Parse
-        doc = nlp(relationship)
+        if doc is None:
+            doc = get_spacy_model()(relationship)
         
         # Step 2: Find root verb or auxiliary
         # Priority: ROOT verb > First Verb > First Aux > ROOT
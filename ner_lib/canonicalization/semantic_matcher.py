@@ -61,9 +61,11 @@ class SemanticMatcher:
         """Lazy compute canonical embeddings."""
         if self._canonical_embeddings is None and self.canonical_terms:
             logger.info(f"Computing embeddings for {len(self.canonical_terms)} canonical terms...")
+            # Stored unit-normalized so each query is a single matmul
             self._canonical_embeddings = self.model.encode(
                 self.canonical_terms,
                 convert_to_numpy=True,
+                normalize_embeddings=True,
                 show_progress_bar=False
             )
             logger.info(f"Embeddings computed: shape {self._canonical_embeddings.shape}")
@@ -95,11 +97,12 @@ class SemanticMatcher:
             input_embedding = self.model.encode(
                 [input_text],
                 convert_to_numpy=True,
+                normalize_embeddings=True,
                 show_progress_bar=False
             )
             
-            # Compute cosine similarity
-            similarities = self._cosine_similarity(input_embedding, self.canonical_embeddings)
+            # Both sides are unit-normalized: cosine is a dot product
+            similarities = input_embedding @ self.canonical_embeddings.T
             
             # Get best match
             best_idx = similarities[0].argmax()
@@ -140,11 +143,12 @@ class SemanticMatcher:
             input_embedding = self.model.encode(
                 [input_text],
                 convert_to_numpy=True,
+                normalize_embeddings=True,
                 show_progress_bar=False
             )
             
-            # Compute cosine similarity
-            similarities = self._cosine_similarity(input_embedding, self.canonical_embeddings)
+            # Both sides are unit-normalized: cosine is a dot product
+            similarities = input_embedding @ self.canonical_embeddings.T
             
             # Get top-k indices
             top_k_indices = similarities[0].argsort()[-k:][::-1]
@@ -29,12 +29,50 @@ class ModeBWeights(BaseModel):
     contextual_boost: float = Field(default=0.20, description="Contextual signals boost (additive)")
 
 
+class ModeBConfig(BaseModel):
+    """Configuration for Mode B resolution."""
+    
+    parallel_min_candidates: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Score candidates on a thread pool from this many candidates (None: always serial; "
+            "per-candidate scoring is GIL-bound Python, so the pool usually slows it down)"
+        )
+    )
+    max_workers: Optional[int] = Field(
+        default=None, ge=1, description="Thread pool size (defaults to 2 * CPU count)"
+    )
+    fast_path_exact: bool = Field(
+        default=True, description="Return exact matches without ANN search or scoring other candidates"
+    )
+    semantic_pooling: str = Field(
+        default="canonical",
+        description="Entity embedding for the semantic signal: 'canonical' (canonical name) or 'mean' (alias centroid)"
+    )
+
+
 class ANNConfig(BaseModel):
     """Configuration for ANN search."""
     
     top_k: int = Field(default=10, ge=1, description="Number of candidates to retrieve")
     index_type: str = Field(default="faiss", description="ANN library to use: 'faiss' or 'hnswlib'")
     metric: str = Field(default="cosine", description="Distance metric: 'cosine' or 'l2'")
+    embedding_dtype: str = Field(
+        default="fp16",
+        description="Storage dtype of cached entity embeddings: 'fp32' (opt-in full precision), 'fp16' or 'int8'"
+    )
+    
+    # Faiss-specific
+    faiss_ivf_min_entities: int = Field(
+        default=10_000, ge=1, description="Switch from a flat index to IVF at this many entities"
+    )
+    faiss_ivfpq_min_entities: int = Field(
+        default=1_000_000, ge=1, description="Switch from IVF to OPQ/IVF-HNSW/PQ at this many entities"
+    )
+    faiss_nprobe: int = Field(default=16, ge=1, description="IVF cells visited per query")
+    faiss_ef_search: int = Field(default=64, ge=1, description="efSearch of the HNSW coarse quantizer")
+    faiss_pq_m: int = Field(default=64, ge=1, description="PQ sub-quantizers (must divide embedding dim)")
     
     # HNSW-specific
     hnsw_ef_construction: int = Field(default=200, ge=1, description="HNSW construction parameter")
@@ -51,6 +89,19 @@ class ModelConfig(BaseModel):
     )
     embedding_dim: Optional[int] = Field(default=None, description="Embedding dimension (auto-detected if None)")
     device: str = Field(default="cpu", description="Device for model inference: 'cpu' or 'cuda'")
+    backend: str = Field(
+        default="torch",
+        description="SentenceTransformer inference backend: 'torch', 'onnx' (ONNX Runtime) or 'openvino'"
+    )
+    model_file: Optional[str] = Field(
+        default=None,
+        description="Exported model file for the onnx/openvino backends (e.g. 'onnx/model_qint8_avx512_vnni.onnx')"
+    )
+    precision: str = Field(
+        default="fp32",
+        description="Model weight precision: 'fp32' or 'fp16' (fp16 is applied on CUDA only)"
+    )
+    encode_batch_size: int = Field(default=64, description="Batch size for embedding inference")
 
 
 class NormalizationConfig(BaseModel):
@@ -89,6 +140,10 @@ class SynonymConfig(BaseModel):
     use_spacy_wordnet: bool = Field(default=True, description="Use spacy-wordnet for synonyms")
     use_nltk_fallback: bool = Field(default=True, description="Use NLTK WordNet as fallback")
     filter_by_pos: bool = Field(default=True, description="Filter synonyms by part-of-speech")
+    trie_path: Optional[str] = Field(
+        default=None,
+        description="Memory-mapped synonym trie from build_synonym_trie() (requires marisa-trie)"
+    )
 
 
 class SemanticMatchingConfig(BaseModel):
@@ -108,6 +163,7 @@ class Config(BaseModel):
     
     thresholds: ThresholdsConfig = Field(default_factory=ThresholdsConfig)
     mode_b_weights: ModeBWeights = Field(default_factory=ModeBWeights)
+    mode_b: ModeBConfig = Field(default_factory=ModeBConfig)
     ann: ANNConfig = Field(default_factory=ANNConfig)
     models: ModelConfig = Field(default_factory=ModelConfig)
     normalization: NormalizationConfig = Field(default_factory=NormalizationConfig)
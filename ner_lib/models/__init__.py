@@ -3,4 +3,32 @@
 from ner_lib.models.entity import Entity, Alias, Mention
 from ner_lib.models.candidate import Candidate, SameCandidate, MatchResult
 
-__all__ = ["Entity", "Alias", "Mention", "Candidate", "SameCandidate", "MatchResult"]
+# Wire-format serialization (requires msgspec)
+try:
+    from ner_lib.models.wire import (
+        MatchResultWire,
+        to_wire,
+        encode_match_result,
+        decode_match_result,
+    )
+    WIRE_AVAILABLE = True
+except ImportError:
+    WIRE_AVAILABLE = False
+    MatchResultWire = None
+    to_wire = None
+    encode_match_result = None
+    decode_match_result = None
+
+__all__ = [
+    "Entity",
+    "Alias",
+    "Mention",
+    "Candidate",
+    "SameCandidate",
+    "MatchResult",
+    "MatchResultWire",
+    "to_wire",
+    "encode_match_result",
+    "decode_match_result",
+    "WIRE_AVAILABLE",
+]
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from enum import Enum
 
-from ner_lib.models.entity import Entity, Mention
+from ner_lib.models.entity import Entity, Mention, _SLOTS
 
 
 class NextSteps(Enum):
@@ -14,14 +14,24 @@ class NextSteps(Enum):
     NEW_ENTITY = "new_entity"  # No match, create as new entity
 
 
-@dataclass
+# Pre-bound members for hot paths (avoids Enum attribute lookups)
+_NS_NONE, _NS_REVIEW, _NS_NEW = NextSteps.NONE, NextSteps.HUMAN_REVIEW, NextSteps.NEW_ENTITY
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Citation:
-    """Citation for a signal or method used."""
+    """Citation for a signal or method used (immutable, so instances can be shared)."""
     
     source: str  # Library name (e.g., "spaCy", "RapidFuzz")
     method: str  # Method name (e.g., "PhraseMatcher", "token_set_ratio")
     component: str  # Component name (e.g., "exact_lookup", "fuzzy_matching")
     confidence_contribution: float = 0.0  # How much this contributed to final score
+    
+    def with_contribution(self, contribution: float) -> "Citation":
+        """Return this citation with a different confidence contribution."""
+        if contribution == self.confidence_contribution:
+            return self
+        return Citation(self.source, self.method, self.component, contribution)
 
 
 @dataclass
@@ -38,8 +48,7 @@ class Candidate:
         """Add a signal score."""
         self.signals[signal_name] = score
         if citation:
-            citation.confidence_contribution = score
-            self.citations.append(citation)
+            self.citations.append(citation.with_contribution(score))
 
 
 @dataclass
@@ -50,18 +59,18 @@ class MatchResult:
     matched_entity: Optional[Entity] = None
     confidence: float = 0.0
     citations: List[Citation] = field(default_factory=list)
-    next_steps: NextSteps = NextSteps.NONE
+    next_steps: NextSteps = _NS_NONE
     candidates: List[Candidate] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
     
     def __post_init__(self):
         """Determine next steps based on confidence and matched entity."""
         if self.matched_entity and self.confidence >= 0.7:
-            self.next_steps = NextSteps.NONE
+            self.next_steps = _NS_NONE
         elif self.matched_entity and self.confidence >= 0.45:
-            self.next_steps = NextSteps.HUMAN_REVIEW
+            self.next_steps = _NS_REVIEW
         elif not self.matched_entity:
-            self.next_steps = NextSteps.NEW_ENTITY
+            self.next_steps = _NS_NEW
 
 
 @dataclass
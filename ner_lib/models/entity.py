@@ -3,20 +3,39 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
+import itertools
+import secrets
+import sys
+import time
 import uuid
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 instances keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Process-local ID generator: one random epoch per process plus a counter.
+# IDs only need to be unique within storage, so this avoids a urandom read
+# and a 36-char uuid4 format on every entity/alias construction.
+_ID_EPOCH = secrets.token_hex(4)
+_ID_COUNTER = itertools.count()
+
+
+def _next_id() -> str:
+    """Generate a process-unique internal ID."""
+    return f"{_ID_EPOCH}-{next(_ID_COUNTER)}"
+
+
+@dataclass(**_SLOTS)
 class Entity:
     """Represents a canonical entity."""
     
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_id)
     canonical_name: str = ""
     normalized_name: str = ""
     aliases: List[str] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    last_seen: Optional[datetime] = None
+    created_at: int = field(default_factory=time.time_ns)  # epoch nanoseconds
+    last_seen: Optional[int] = None  # epoch nanoseconds
     
     def __post_init__(self):
         """Validate and normalize."""
@@ -27,18 +46,46 @@ class Entity:
         if not self.normalized_name:
             from ner_lib.normalization.text import normalize_entity_name
             self.normalized_name = normalize_entity_name(self.canonical_name)
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.created_at / 1e9)
+    
+    @property
+    def last_seen_dt(self) -> Optional[datetime]:
+        """Last-seen time as a local datetime (None if never seen)."""
+        if self.last_seen is None:
+            return None
+        return datetime.fromtimestamp(self.last_seen / 1e9)
+    
+    @classmethod
+    def with_uuid(cls, **kwargs) -> "Entity":
+        """
+        Create an entity with a random UUID4 ID.
+        
+        Use this for externally-visible IDs that must be globally unique
+        across processes.
+        
+        Args:
+            **kwargs: Entity field values (except id)
+        
+        Returns:
+            New entity
+        """
+        return cls(id=str(uuid.uuid4()), **kwargs)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Alias:
     """Represents an alias for an entity."""
     
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_id)
     name: str = ""
     normalized_name: str = ""
     entity_id: str = ""
     confidence: float = 1.0
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: int = field(default_factory=time.time_ns)  # epoch nanoseconds
     source: str = "manual"  # manual, matched, imported
     
     def __post_init__(self):
@@ -54,9 +101,14 @@ class Alias:
         if not self.normalized_name:
             from ner_lib.normalization.text import normalize_entity_name
             self.normalized_name = normalize_entity_name(self.name)
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.created_at / 1e9)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Mention:
     """Represents an incoming entity mention to be resolved."""
     
@@ -0,0 +1,100 @@
+"""Wire-format mirrors of match results for JSON I/O boundaries."""
+
+from typing import Dict, List, Optional
+
+import msgspec
+
+from ner_lib.models.candidate import MatchResult, Candidate, Citation
+
+
+class CitationWire(msgspec.Struct, frozen=True, array_like=True):
+    """Serialized form of a Citation."""
+    
+    source: str
+    method: str
+    component: str
+    confidence_contribution: float = 0.0
+
+
+class CandidateWire(msgspec.Struct, frozen=True, array_like=True):
+    """Serialized form of a Candidate."""
+    
+    entity_id: str
+    final_score: float = 0.0
+    signals: Dict[str, float] = {}
+
+
+class MatchResultWire(msgspec.Struct, frozen=True, array_like=True):
+    """Serialized form of a MatchResult."""
+    
+    mention: str
+    entity_id: Optional[str]
+    confidence: float
+    next_steps: str
+    citations: List[CitationWire] = []
+    candidates: List[CandidateWire] = []
+
+
+_ENCODER = msgspec.json.Encoder()
+_DECODER = msgspec.json.Decoder(MatchResultWire)
+
+
+def _citation_to_wire(citation: Citation) -> CitationWire:
+    return CitationWire(
+        citation.source,
+        citation.method,
+        citation.component,
+        citation.confidence_contribution
+    )
+
+
+def _candidate_to_wire(candidate: Candidate) -> CandidateWire:
+    return CandidateWire(candidate.entity_id, candidate.final_score, dict(candidate.signals))
+
+
+def to_wire(result: MatchResult) -> MatchResultWire:
+    """
+    Convert a MatchResult to its wire struct.
+    
+    Fields are copied explicitly rather than through dataclasses.asdict.
+    
+    Args:
+        result: Match result
+    
+    Returns:
+        Wire struct
+    """
+    return MatchResultWire(
+        result.mention.text,
+        result.matched_entity.id if result.matched_entity else None,
+        result.confidence,
+        result.next_steps.value,
+        [_citation_to_wire(c) for c in result.citations],
+        [_candidate_to_wire(c) for c in result.candidates]
+    )
+
+
+def encode_match_result(result: MatchResult) -> bytes:
+    """
+    Serialize a MatchResult to JSON bytes.
+    
+    Args:
+        result: Match result
+    
+    Returns:
+        JSON-encoded bytes
+    """
+    return _ENCODER.encode(to_wire(result))
+
+
+def decode_match_result(buf: bytes) -> MatchResultWire:
+    """
+    Decode (and validate) JSON bytes into a MatchResultWire.
+    
+    Args:
+        buf: JSON bytes produced by encode_match_result
+    
+    Returns:
+        Wire struct
+    """
+    return _DECODER.decode(buf)
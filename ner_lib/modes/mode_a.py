@@ -1,14 +1,18 @@
 """Mode A: Sequential pipeline with early stopping."""
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ner_lib.models.entity import Mention, Entity
-from ner_lib.models.candidate import MatchResult, Candidate, SameCandidate, NextSteps, Citation
+from ner_lib.models.candidate import (
+    MatchResult, Candidate, SameCandidate, Citation, _NS_NONE, _NS_REVIEW, _NS_NEW
+)
 from ner_lib.config import Config
 from ner_lib.storage import StorageBackend
+from ner_lib.normalization.text import create_acronym
 from ner_lib.signals import (
-    ExactMatcher, quick_fuzzy_score, quick_acronym_check,
-    EmbeddingModel, semantic_similarity_score
+    ExactMatcher, token_set_ratio_batch, token_set_ratio_matrix, quick_acronym_check,
+    EmbeddingModel, semantic_similarity_score, rescale_cosine
 )
+from ner_lib.signals.acronym import ACRONYM_MATCH_SCORE, TOKEN_SUBSET_SCORE
 from ner_lib.candidate_generation import HashMapLookup, CombinedBlocker, FaissIndex, HNSWIndex, FAISS_AVAILABLE, HNSWLIB_AVAILABLE
 
 
@@ -36,6 +40,12 @@ class ModeAResolver:
         self.exact_matcher = ExactMatcher()
         self.embedding_model = embedding_model
         self.ann_index = None
+        self._acronym_map: Dict[str, str] = {}  # acronym -> entity_id
+        
+        # cdist choices for the fuzzy step, derived from the storage's
+        # (cached) normalized_names() list
+        self._fuzzy_names: Optional[List[str]] = None
+        self._fuzzy_choices: Sequence[Union[str, bytes]] = ()
         
         # Build indices from storage
         self._build_indices()
@@ -45,12 +55,11 @@ class ModeAResolver:
         entities = self.storage.get_all_entities()
         
         # Build exact matcher
+        self.exact_matcher.add_batch(entities)
+        
+        # Acronym map (first entity wins, matching scan order)
         for entity in entities:
-            self.exact_matcher.add_entity(
-                entity.id,
-                entity.canonical_name,
-                entity.aliases
-            )
+            self._acronym_map.setdefault(create_acronym(entity.canonical_name), entity.id)
     
     def build_ann_index(self, embedding_model: EmbeddingModel):
         """
@@ -73,9 +82,18 @@ class ModeAResolver:
         
         # Create ANN index
         if self.config.ann.index_type == "faiss" and FAISS_AVAILABLE:
+            # Flat search is O(N*d) per query; use IVF / IVF-PQ for large KBs
             self.ann_index = FaissIndex(
                 embedding_dim=embedding_model.embedding_dim,
-                metric=self.config.ann.metric
+                index_type=FaissIndex.factory_string_for(
+                    len(entities),
+                    ivf_min_vectors=self.config.ann.faiss_ivf_min_entities,
+                    ivfpq_min_vectors=self.config.ann.faiss_ivfpq_min_entities,
+                    pq_m=self.config.ann.faiss_pq_m
+                ),
+                metric=self.config.ann.metric,
+                nprobe=self.config.ann.faiss_nprobe,
+                ef_search=self.config.ann.faiss_ef_search
             )
         elif self.config.ann.index_type == "hnswlib" and HNSWLIB_AVAILABLE:
             self.ann_index = HNSWIndex(
@@ -89,6 +107,115 @@ class ModeAResolver:
         
         self.ann_index.build_index(entity_ids, embeddings)
     
+    def save(self, directory: str):
+        """
+        Persist the ANN index so other processes can load it.
+        
+        Args:
+            directory: Target directory
+        """
+        if not FAISS_AVAILABLE or not isinstance(self.ann_index, FaissIndex):
+            raise ValueError("Only a built Faiss ANN index can be saved")
+        
+        self.ann_index.save(directory)
+    
+    def load(self, directory: str, embedding_model: EmbeddingModel, mmap: bool = True):
+        """
+        Load a persisted ANN index instead of re-encoding all entities.
+        
+        The index must have been saved from the same storage contents.
+        
+        Args:
+            directory: Directory written by save()
+            embedding_model: Embedding model used to build the index
+            mmap: Memory-map the index (shared across worker processes)
+        """
+        if not FAISS_AVAILABLE:
+            raise ValueError("ANN index type 'faiss' not available")
+        
+        self.embedding_model = embedding_model
+        self.ann_index = FaissIndex.load(
+            directory,
+            mmap=mmap,
+            nprobe=self.config.ann.faiss_nprobe,
+            ef_search=self.config.ann.faiss_ef_search
+        )
+    
+    def add_entity_incremental(self, entity: Entity):
+        """
+        Index a newly stored entity without rebuilding all indices.
+        
+        The entity is embedded on its own and added to the existing ANN
+        index, if one has been built.
+        
+        Args:
+            entity: Entity already saved in storage
+        """
+        self.exact_matcher.add_entity(entity.id, entity.canonical_name, entity.aliases)
+        self._acronym_map.setdefault(create_acronym(entity.canonical_name), entity.id)
+        
+        if self.ann_index and self.embedding_model:
+            embedding = self.embedding_model.encode([entity.canonical_name])
+            self.ann_index.add([entity.id], embedding)
+    
+    def clear(self):
+        """Drop all indexed entities (after the storage has been cleared)."""
+        self.exact_matcher.clear()
+        self._acronym_map.clear()
+        self._fuzzy_names = None
+        self._fuzzy_choices = ()
+        self.ann_index = None
+    
+    def _fuzzy_choice_names(self) -> Sequence[Union[str, bytes]]:
+        """
+        Normalized entity names as RapidFuzz cdist choices.
+        
+        RapidFuzz scores ASCII bytes faster than str; names in other
+        scripts stay str so scores stay per code point. Re-encoded only
+        when the storage returns a new name list.
+        """
+        names = self.storage.normalized_names()
+        if names is not self._fuzzy_names:
+            encoded = [name.encode('utf-8') for name in names]
+            self._fuzzy_names = names
+            self._fuzzy_choices = encoded if all(name.isascii() for name in encoded) else names
+        return self._fuzzy_choices
+    
+    def resolve_batch(self, mentions: List[Mention]) -> List[MatchResult]:
+        """
+        Resolve multiple mentions, scoring the fuzzy step as one matrix.
+        
+        Token set ratios of every mention without an exact hit against every
+        entity come from a single RapidFuzz cdist call on all cores; each
+        mention then runs the sequential pipeline as in resolve().
+        
+        Args:
+            mentions: Mentions to resolve
+        
+        Returns:
+            Match results, in input order
+        """
+        entities = self.storage.get_all_entities()
+        pending = [
+            i for i, mention in enumerate(mentions)
+            if not self.exact_matcher.match_normalized(mention.normalized_text)
+        ]
+        
+        fuzzy_best: Dict[int, Tuple[Entity, float]] = {}
+        if entities and pending:
+            scores = token_set_ratio_matrix(
+                [mentions[i].normalized_text for i in pending],
+                self._fuzzy_choice_names()
+            )
+            best = scores.argmax(axis=1)
+            for row, i in enumerate(pending):
+                fuzzy_best[i] = (entities[best[row]], float(scores[row, best[row]]))
+        
+        return [
+            self._resolve(mention, entities, fuzzy_best.get(i))
+            for i, mention in enumerate(mentions)
+        ]
+    
     def resolve(self, mention: Mention) -> MatchResult:
         """
         Resolve mention using Mode A sequential pipeline.
@@ -104,13 +231,33 @@ class ModeAResolver:
         Args:
             mention: Mention to resolve
         
+        Returns:
+            Match result
+        """
+        return self._resolve(mention)
+    
+    def _resolve(
+        self,
+        mention: Mention,
+        entities: Optional[List[Entity]] = None,
+        fuzzy_best: Optional[Tuple[Entity, float]] = None
+    ) -> MatchResult:
+        """
+        Run the sequential pipeline for one mention.
+        
+        Args:
+            mention: Mention to resolve
+            entities: All stored entities, if already fetched
+            fuzzy_best: Precomputed (best entity, token set ratio) of the
+                fuzzy step
+        
         Returns:
             Match result
         """
         citations: List[Citation] = []
         
         # Step 2: Exact alias lookup
-        exact_result = self.exact_matcher.match(mention.text)
+        exact_result = self.exact_matcher.match_normalized(mention.normalized_text)
         if exact_result:
             entity_id, citation = exact_result
             entity = self.storage.get_entity(entity_id)
@@ -122,11 +269,12 @@ class ModeAResolver:
                     matched_entity=entity,
                     confidence=1.0,
                     citations=citations,
-                    next_steps=NextSteps.NONE
+                    next_steps=_NS_NONE
                 )
         
         # Get all entities for further checks
-        entities = self.storage.get_all_entities()
+        if entities is None:
+            entities = self.storage.get_all_entities()
         
         if not entities:
             # No entities to match against
@@ -135,43 +283,56 @@ class ModeAResolver:
                 matched_entity=None,
                 confidence=0.0,
                 citations=citations,
-                next_steps=NextSteps.NEW_ENTITY
+                next_steps=_NS_NEW
             )
         
-        # Step 3: Acronym check
-        for entity in entities:
-            if quick_acronym_check(
-                mention.text,
-                entity.canonical_name,
-                threshold=self.config.thresholds.high_acronym
-            ):
-                citation = Citation(
-                    source="Custom",
-                    method="acronym_match",
-                    component="acronym",
-                    confidence_contribution=1.0
-                )
-                citations.append(citation)
-                
-                return MatchResult(
-                    mention=mention,
-                    matched_entity=entity,
-                    confidence=self.config.thresholds.high_acronym,
-                    citations=citations,
-                    next_steps=NextSteps.NONE
-                )
+        # Step 3: Acronym check (the first entity, in scan order, whose
+        # acronym_score reaches high_acronym)
+        high_acronym = self.config.thresholds.high_acronym
+        if high_acronym > TOKEN_SUBSET_SCORE:
+            # Only a full acronym match can reach the threshold: look the
+            # mention up among the precomputed canonical name acronyms
+            entity = None
+            if high_acronym <= ACRONYM_MATCH_SCORE:
+                acronym_entity_id = self._acronym_map.get(mention.text.upper().strip())
+                if acronym_entity_id:
+                    entity = self.storage.get_entity(acronym_entity_id)
+        else:
+            # Token containment / partial acronym matches qualify too
+            entity = next(
+                (
+                    candidate for candidate in entities
+                    if quick_acronym_check(mention.text, candidate.canonical_name, threshold=high_acronym)
+                ),
+                None
+            )
         
-        # Step 4: Fuzzy matching
-        best_fuzzy_entity = None
-        best_fuzzy_score = 0.0
+        if entity:
+            citation = Citation(
+                source="Custom",
+                method="acronym_match",
+                component="acronym",
+                confidence_contribution=1.0
+            )
+            citations.append(citation)
+            
+            return MatchResult(
+                mention=mention,
+                matched_entity=entity,
+                confidence=self.config.thresholds.high_acronym,
+                citations=citations,
+                next_steps=_NS_NONE
+            )
         
-        for entity in entities:
-            score = quick_fuzzy_score(mention.normalized_text, entity.normalized_name)
-            if score > best_fuzzy_score:
-                best_fuzzy_score = score
-                best_fuzzy_entity = entity
+        # Step 4: Fuzzy matching (one RapidFuzz call over all entities; the
+        # first best-scoring entity wins, as in a scan)
+        if fuzzy_best is None:
+            fuzzy_scores = token_set_ratio_batch(mention.normalized_text, self._fuzzy_choice_names())
+            best_index = int(fuzzy_scores.argmax())
+            fuzzy_best = (entities[best_index], float(fuzzy_scores[best_index]))
+        best_fuzzy_entity, best_fuzzy_score = fuzzy_best
         
-        if best_fuzzy_score >= self.config.thresholds.high_fuzzy:
+        if best_fuzzy_score > 0.0 and best_fuzzy_score >= self.config.thresholds.high_fuzzy:
             citation = Citation(
                 source="RapidFuzz",
                 method="token_set_ratio",
@@ -185,7 +346,7 @@ class ModeAResolver:
                 matched_entity=best_fuzzy_entity,
                 confidence=best_fuzzy_score,
                 citations=citations,
-                next_steps=NextSteps.NONE
+                next_steps=_NS_NONE
             )
         
         # Step 5: ANN + semantic
@@ -204,6 +365,30 @@ class ModeAResolver:
                 best_entity_id = candidate_ids[0]
                 best_entity = self.storage.get_entity(best_entity_id)
                 
+                # With the cosine metric the ANN score is the raw cosine on
+                # normalized vectors; rescaled like semantic_similarity_score,
+                # a confident hit does not need a second embedding pass
+                # (the L2 score, 1 / (1 + d), is on another scale)
+                top_score = rescale_cosine(float(ann_scores[0]))
+                if (
+                    best_entity
+                    and self.config.ann.metric == "cosine"
+                    and top_score >= self.config.thresholds.auto_merge
+                ):
+                    citations.append(Citation(
+                        source="Faiss" if self.config.ann.index_type == "faiss" else "hnswlib",
+                        method="ANN_search",
+                        component="semantic",
+                        confidence_contribution=top_score
+                    ))
+                    return MatchResult(
+                        mention=mention,
+                        matched_entity=best_entity,
+                        confidence=top_score,
+                        citations=citations,
+                        next_steps=_NS_NONE
+                    )
+                
                 # Compute semantic similarity
                 if best_entity:
                     sem_score, sem_citation = semantic_similarity_score(
@@ -221,7 +406,7 @@ class ModeAResolver:
                             matched_entity=best_entity,
                             confidence=sem_score,
                             citations=citations,
-                            next_steps=NextSteps.NONE
+                            next_steps=_NS_NONE
                         )
                     elif sem_score >= self.config.thresholds.review_low:
                         # Send to review queue
@@ -230,7 +415,7 @@ class ModeAResolver:
                             matched_entity=best_entity,
                             confidence=sem_score,
                             citations=citations,
-                            next_steps=NextSteps.HUMAN_REVIEW
+                            next_steps=_NS_REVIEW
                         )
         
         # No match found
@@ -239,5 +424,5 @@ class ModeAResolver:
             matched_entity=None,
             confidence=0.0,
             citations=citations,
-            next_steps=NextSteps.NEW_ENTITY
+            next_steps=_NS_NEW
         )
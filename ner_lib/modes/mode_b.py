@@ -1,23 +1,67 @@
 """Mode B: Parallel signal aggregation."""
 
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import chain
+from typing import FrozenSet, List, Optional, Dict, Tuple
+import os
 import numpy as np
 
 from ner_lib.models.entity import Mention, Entity
-from ner_lib.models.candidate import MatchResult, Candidate, SameCandidate, NextSteps, Citation
+from ner_lib.models.candidate import (
+    MatchResult, Candidate, SameCandidate, Citation, _NS_NONE, _NS_REVIEW, _NS_NEW
+)
 from ner_lib.config import Config
 from ner_lib.storage import StorageBackend
+from ner_lib.normalization.text import create_acronym, token_set
 from ner_lib.signals import (
-    ExactMatcher, combined_fuzzy_score, acronym_score,
-    EmbeddingModel, semantic_similarity_score,
-    domain_consistency_boost, recency_boost
+    ExactMatcher, token_set_ratio, FuzzyKey, fuzzy_key, acronym_score,
+    PreparedQuery, token_set_citation,
+    EmbeddingModel, semantic_similarity_score, alias_centroid,
+    domain_key, domain_consistency_boost_fast, recency_boost
 )
 from ner_lib.candidate_generation import (
     HashMapLookup, CombinedBlocker,
     FaissIndex, HNSWIndex,
     FAISS_AVAILABLE, HNSWLIB_AVAILABLE
 )
-from ner_lib.scoring import WeightedAggregator
+from ner_lib.scoring import WeightedAggregator, SignalBuffer, SignalTable
+from ner_lib.scoring._kernels import cosine_rows
+from ner_lib.scoring.signal_buffer import (
+    EXACT_MATCH, EMBEDDING_COSINE, TOKEN_SET_RATIO, ACRONYM, CONTEXTUAL
+)
+
+
+def _unit_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize a vector or the rows of a matrix (float32 copy)."""
+    embeddings = np.array(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    embeddings /= np.maximum(norms, 1e-12)
+    return embeddings
+
+
+def _quantize_rows(embeddings: np.ndarray, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Store unit-normalized embedding rows at a reduced width.
+    
+    Args:
+        embeddings: (M, d) float32 matrix
+        dtype: 'fp32', 'fp16' or 'int8'
+    
+    Returns:
+        Tuple of (matrix, per-row scales); scales are only set for int8,
+        where row ~= matrix[row] * scales[row]
+    """
+    if dtype == "fp32":
+        return embeddings, None
+    if dtype == "fp16":
+        return embeddings.astype(np.float16), None
+    if dtype == "int8":
+        # Symmetric per-row scale
+        scales = np.maximum(np.abs(embeddings).max(axis=1), 1e-12) / 127.0
+        quantized = np.round(embeddings / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    raise ValueError(f"Unknown embedding dtype '{dtype}'. Must be 'fp32', 'fp16' or 'int8'")
 
 
 class ModeBResolver:
@@ -46,6 +90,14 @@ class ModeBResolver:
         self.blocker = CombinedBlocker()
         self.ann_index = None
         self.aggregator = WeightedAggregator(config.mode_b_weights)
+        self._emb_matrix: Optional[np.ndarray] = None  # (M, d) unit-normalized, config.ann.embedding_dtype
+        self._emb_scales: Optional[np.ndarray] = None  # per-row scales for int8
+        self._id_to_row: Dict[str, int] = {}  # entity_id -> row of _emb_matrix
+        self._executor: Optional[ThreadPoolExecutor] = None  # created on first use
+        self._entity_tokens: Dict[str, FrozenSet[str]] = {}  # entity_id -> canonical name tokens
+        self._entity_fuzzy: Dict[str, FuzzyKey] = {}  # entity_id -> normalized name fuzzy key
+        self._entity_domains: Dict[str, Tuple[str, Optional[str]]] = {}  # entity_id -> domain_key(metadata)
+        self._entity_acronyms: Dict[str, str] = {}  # entity_id -> canonical name acronym
         
         # Build indices
         self._build_indices()
@@ -54,20 +106,40 @@ class ModeBResolver:
         """Build search indices from storage."""
         entities = self.storage.get_all_entities()
         
+        # Exact matcher
+        self.exact_matcher.add_batch(entities)
+        
         for entity in entities:
-            # Exact matcher
-            self.exact_matcher.add_entity(
-                entity.id,
-                entity.canonical_name,
-                entity.aliases
-            )
-            
             # Blocker
             self.blocker.add_entity(
                 entity.id,
                 entity.canonical_name,
                 entity.aliases
             )
+            
+            # Canonical name tokens for the acronym/containment signal, and
+            # normalized name tokens for the fuzzy signal
+            self._entity_tokens[entity.id] = token_set(entity.canonical_name)
+            self._entity_fuzzy[entity.id] = fuzzy_key(entity.normalized_name)
+            self._entity_domains[entity.id] = domain_key(entity.metadata)
+            self._entity_acronyms[entity.id] = create_acronym(entity.canonical_name)
+    
+    def clear(self):
+        """
+        Drop all indexed entities (after the storage has been cleared).
+        
+        The thread pool, if started, is kept for reuse.
+        """
+        self.exact_matcher.clear()
+        self.blocker.clear()
+        self.ann_index = None
+        self._emb_matrix = None
+        self._emb_scales = None
+        self._id_to_row.clear()
+        self._entity_tokens.clear()
+        self._entity_fuzzy.clear()
+        self._entity_domains.clear()
+        self._entity_acronyms.clear()
     
     def build_ann_index(self, embedding_model: EmbeddingModel):
         """
@@ -83,16 +155,28 @@ class ModeBResolver:
             return
         
         # Generate embeddings
-        canonical_names = [e.canonical_name for e in entities]
         entity_ids = [e.id for e in entities]
+        scoring_rows, embeddings = self._embed_entities(entities, show_progress=True)
         
-        embeddings = embedding_model.encode(canonical_names, show_progress=True)
+        # Keep the scoring rows in one contiguous matrix so the semantic
+        # signal is a matmul instead of a model call per candidate
+        self._emb_matrix, self._emb_scales = _quantize_rows(scoring_rows, self.config.ann.embedding_dtype)
+        self._id_to_row = {entity_id: row for row, entity_id in enumerate(entity_ids)}
         
         # Create ANN index
         if self.config.ann.index_type == "faiss" and FAISS_AVAILABLE:
+            # Flat search is O(N*d) per query; use IVF / IVF-PQ for large KBs
             self.ann_index = FaissIndex(
                 embedding_dim=embedding_model.embedding_dim,
-                metric=self.config.ann.metric
+                index_type=FaissIndex.factory_string_for(
+                    len(entities),
+                    ivf_min_vectors=self.config.ann.faiss_ivf_min_entities,
+                    ivfpq_min_vectors=self.config.ann.faiss_ivfpq_min_entities,
+                    pq_m=self.config.ann.faiss_pq_m
+                ),
+                metric=self.config.ann.metric,
+                nprobe=self.config.ann.faiss_nprobe,
+                ef_search=self.config.ann.faiss_ef_search
             )
         elif self.config.ann.index_type == "hnswlib" and HNSWLIB_AVAILABLE:
             self.ann_index = HNSWIndex(
@@ -106,6 +190,97 @@ class ModeBResolver:
         
         self.ann_index.build_index(entity_ids, embeddings)
     
+    def add_entity_incremental(self, entity: Entity):
+        """
+        Index a newly stored entity without rebuilding all indices.
+        
+        The entity is embedded on its own and added to the existing ANN
+        index, if one has been built.
+        
+        Args:
+            entity: Entity already saved in storage
+        """
+        self.exact_matcher.add_entity(entity.id, entity.canonical_name, entity.aliases)
+        self.blocker.add_entity(entity.id, entity.canonical_name, entity.aliases)
+        self._entity_tokens[entity.id] = token_set(entity.canonical_name)
+        self._entity_fuzzy[entity.id] = fuzzy_key(entity.normalized_name)
+        self._entity_domains[entity.id] = domain_key(entity.metadata)
+        self._entity_acronyms[entity.id] = create_acronym(entity.canonical_name)
+        
+        if self.ann_index and self.embedding_model:
+            scoring_rows, embedding = self._embed_entities([entity])
+            self.ann_index.add([entity.id], embedding)
+            if self._emb_matrix is not None:
+                self._append_embeddings([entity.id], scoring_rows)
+    
+    def _embed_entities(
+        self,
+        entities: List[Entity],
+        show_progress: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Embed entities for the semantic signal and the ANN index.
+        
+        With semantic_pooling='mean', canonical name and aliases are encoded
+        in one batch and each entity is scored against its alias centroid,
+        so its dot product with a unit mention is the mean cosine over names.
+        
+        Args:
+            entities: Entities to embed
+            show_progress: Whether to show a progress bar
+        
+        Returns:
+            Tuple of (scoring rows, unit-normalized ANN rows), one row per entity
+        """
+        pooling = self.config.mode_b.semantic_pooling
+        if pooling == "canonical":
+            embeddings = _unit_rows(self.embedding_model.encode(
+                [e.canonical_name for e in entities], show_progress=show_progress
+            ))
+            return embeddings, embeddings
+        if pooling != "mean":
+            raise ValueError(f"Unknown semantic pooling '{pooling}'. Must be 'canonical' or 'mean'")
+        
+        names = [[e.canonical_name, *e.aliases] for e in entities]
+        flat = self.embedding_model.encode(
+            [name for group in names for name in group], show_progress=show_progress
+        )
+        bounds = np.cumsum([0] + [len(group) for group in names])
+        centroids = np.stack([
+            alias_centroid(flat[start:end]) for start, end in zip(bounds[:-1], bounds[1:])
+        ])
+        return centroids, _unit_rows(centroids)
+    
+    def _append_embeddings(self, entity_ids: List[str], embeddings: np.ndarray):
+        """
+        Append scoring rows to the cached embedding matrix.
+        
+        Capacity grows geometrically, so rows past len(_id_to_row) are unused.
+        
+        Args:
+            entity_ids: Entity IDs of the new rows
+            embeddings: (n, d) float32 scoring rows from _embed_entities
+        """
+        quantized, scales = _quantize_rows(embeddings, self.config.ann.embedding_dtype)
+        start = len(self._id_to_row)
+        end = start + len(entity_ids)
+        
+        if end > len(self._emb_matrix):
+            capacity = max(end, 2 * len(self._emb_matrix))
+            matrix = np.empty((capacity, self._emb_matrix.shape[1]), dtype=self._emb_matrix.dtype)
+            matrix[:start] = self._emb_matrix[:start]
+            self._emb_matrix = matrix
+            if self._emb_scales is not None:
+                grown_scales = np.empty(capacity, dtype=self._emb_scales.dtype)
+                grown_scales[:start] = self._emb_scales[:start]
+                self._emb_scales = grown_scales
+        
+        self._emb_matrix[start:end] = quantized
+        if scales is not None:
+            self._emb_scales[start:end] = scales
+        for row, entity_id in enumerate(entity_ids, start):
+            self._id_to_row[entity_id] = row
+    
     def resolve(self, mention: Mention) -> MatchResult:
         """
         Resolve mention using Mode B parallel signal aggregation.
@@ -123,10 +298,132 @@ class ModeBResolver:
         Returns:
             Match result
         """
-        all_citations: List[Citation] = []
+        # Exact lookup, shared by candidate generation and the exact signal
+        exact_result = self.exact_matcher.match_normalized(mention.normalized_text)
+        
+        if exact_result and self.config.mode_b.fast_path_exact:
+            result = self._resolve_exact(mention, exact_result)
+            if result is not None:
+                return result
+        
+        # Encode the mention once for ANN search and the semantic signal
+        mention_embedding = None
+        if self.ann_index and self.embedding_model:
+            mention_embedding = _unit_rows(self.embedding_model.encode(mention.text))
         
         # Step 2: Generate candidates
-        candidate_ids = self._generate_candidates(mention)
+        candidate_ids = self._generate_candidates(
+            mention, mention_embedding, exact_result=exact_result
+        )
+        
+        # Steps 3-5
+        return self._score_candidates(mention, candidate_ids, mention_embedding, exact_result)
+    
+    def resolve_batch(self, mentions: List[Mention]) -> List[MatchResult]:
+        """
+        Resolve multiple mentions, batching the embedding and ANN work.
+        
+        All mentions are encoded in one embedding call and searched with a
+        single ANN batch query; exact/blocking candidates and signal scoring
+        then run per mention as in resolve().
+        
+        Args:
+            mentions: Mentions to resolve
+        
+        Returns:
+            Match results, in input order
+        """
+        if not (mentions and self.ann_index and self.embedding_model):
+            return [self.resolve(mention) for mention in mentions]
+        
+        results: List[Optional[MatchResult]] = [None] * len(mentions)
+        exact_results = [
+            self.exact_matcher.match_normalized(mention.normalized_text) for mention in mentions
+        ]
+        
+        # Exact hits skip the embedding and ANN work entirely
+        if self.config.mode_b.fast_path_exact:
+            for i, (mention, exact_result) in enumerate(zip(mentions, exact_results)):
+                if exact_result:
+                    results[i] = self._resolve_exact(mention, exact_result)
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        embeddings = _unit_rows(self.embedding_model.encode([mentions[i].text for i in pending]))
+        ann_ids, _ = self.ann_index.batch_search(
+            embeddings,
+            top_k=self.config.ann.top_k
+        )
+        
+        for i, embedding, ids in zip(pending, embeddings, ann_ids):
+            candidate_ids = self._generate_candidates(
+                mentions[i], embedding, ids, exact_result=exact_results[i]
+            )
+            results[i] = self._score_candidates(
+                mentions[i], candidate_ids, embedding, exact_results[i]
+            )
+        
+        return results
+    
+    def _resolve_exact(
+        self,
+        mention: Mention,
+        exact_result: Tuple[str, Citation]
+    ) -> Optional[MatchResult]:
+        """
+        Resolve an exact hit by scoring only the matched entity.
+        
+        The semantic signal is skipped (no embedding forward pass): an
+        exact match already aggregates to 1.0.
+        
+        Args:
+            mention: Mention to resolve
+            exact_result: Result of the mention's exact lookup
+        
+        Returns:
+            Match result, or None if the full pipeline should run
+        """
+        candidate = self._score_one(
+            mention, exact_result[0], exact_result=exact_result, semantic=False
+        )
+        if candidate is None:
+            return None
+        
+        candidate.final_score = self.aggregator.aggregate(candidate)
+        if candidate.final_score < self.config.thresholds.mode_b_auto_merge:
+            return None
+        
+        return MatchResult(
+            mention=mention,
+            matched_entity=candidate.entity,
+            confidence=candidate.final_score,
+            citations=list(candidate.citations),
+            next_steps=_NS_NONE,
+            candidates=[candidate]
+        )
+    
+    def _score_candidates(
+        self,
+        mention: Mention,
+        candidate_ids: List[str],
+        mention_embedding: Optional[np.ndarray] = None,
+        exact_result: Optional[Tuple[str, Citation]] = None
+    ) -> MatchResult:
+        """
+        Score candidates and apply decision thresholds.
+        
+        Args:
+            mention: Mention to match
+            candidate_ids: Candidate entity IDs
+            mention_embedding: Unit-normalized mention embedding, if encoded
+            exact_result: Result of the mention's exact lookup
+        
+        Returns:
+            Match result
+        """
+        all_citations: List[Citation] = []
         
         if not candidate_ids:
             return MatchResult(
@@ -134,11 +431,13 @@ class ModeBResolver:
                 matched_entity=None,
                 confidence=0.0,
                 citations=all_citations,
-                next_steps=NextSteps.NEW_ENTITY
+                next_steps=_NS_NEW
             )
         
         # Step 3: Compute signals for all candidates
-        candidates = self._compute_signals(mention, candidate_ids)
+        candidates, signal_table = self._compute_signals(
+            mention, candidate_ids, mention_embedding, exact_result
+        )
         
         if not candidates:
             return MatchResult(
@@ -146,16 +445,18 @@ class ModeBResolver:
                 matched_entity=None,
                 confidence=0.0,
                 citations=all_citations,
-                next_steps=NextSteps.NEW_ENTITY
+                next_steps=_NS_NEW
             )
         
-        # Step 4: Aggregate scores
-        for candidate in candidates:
-            candidate.final_score = self.aggregator.aggregate(candidate)
+        # Step 4: Aggregate scores (one kernel call over all candidates)
+        scores = self.aggregator.aggregate_table(signal_table)
+        for candidate, score in zip(candidates, scores.tolist()):
+            candidate.final_score = score
         
-        # Sort by score
-        candidates.sort(key=lambda c: c.final_score, reverse=True)
-        best_candidate = candidates[0]
+        # Best candidate by argmax; the returned list is ordered by score
+        # with a stable argsort (ties keep candidate order)
+        best_candidate = candidates[int(scores.argmax())]
+        candidates = [candidates[i] for i in np.argsort(-scores, kind="stable")]
         
         # Get entity
         best_entity = self.storage.get_entity(best_candidate.entity_id)
@@ -166,13 +467,13 @@ class ModeBResolver:
         # Step 5: Apply thresholds
         if best_candidate.final_score >= self.config.thresholds.mode_b_auto_merge:
             # Very high confidence: auto-merge
-            next_steps = NextSteps.NONE
+            next_steps = _NS_NONE
         elif best_candidate.final_score >= self.config.thresholds.mode_b_auto_link:
             # High confidence: auto-link but audit
-            next_steps = NextSteps.NONE
+            next_steps = _NS_NONE
         elif best_candidate.final_score >= self.config.thresholds.mode_b_review:
             # Medium confidence: human review
-            next_steps = NextSteps.HUMAN_REVIEW
+            next_steps = _NS_REVIEW
         else:
             # Low confidence: new entity
             return MatchResult(
@@ -180,7 +481,7 @@ class ModeBResolver:
                 matched_entity=None,
                 confidence=best_candidate.final_score,
                 citations=all_citations,
-                next_steps=NextSteps.NEW_ENTITY,
+                next_steps=_NS_NEW,
                 candidates=candidates
             )
         
@@ -193,122 +494,321 @@ class ModeBResolver:
             candidates=candidates
         )
     
-    def _generate_candidates(self, mention: Mention) -> List[str]:
+    def _generate_candidates(
+        self,
+        mention: Mention,
+        mention_embedding: Optional[np.ndarray] = None,
+        ann_ids: Optional[List[str]] = None,
+        exact_result: Optional[Tuple[str, Citation]] = None
+    ) -> List[str]:
         """
         Generate candidate entity IDs from multiple sources.
         
         Args:
             mention: Mention to match
+            mention_embedding: Mention embedding for ANN search
+            ann_ids: Pre-fetched ANN results (skips the per-mention search)
+            exact_result: Result of the mention's exact lookup
         
         Returns:
-            Deduplicated list of candidate entity IDs
+            Deduplicated list of candidate entity IDs (first-seen order)
         """
-        candidate_ids = set()
-        
         # Exact lookup
-        exact_result = self.exact_matcher.match(mention.text)
-        if exact_result:
-            entity_id, _ = exact_result
-            candidate_ids.add(entity_id)
+        exact_ids = (exact_result[0],) if exact_result else ()
         
         # Blocking
         blocked_ids = self.blocker.get_candidates(mention.text)
-        candidate_ids.update(blocked_ids)
         
         # ANN search
-        if self.ann_index and self.embedding_model:
-            mention_embedding = self.embedding_model.encode(mention.text)
-            ann_ids, _ = self.ann_index.search(
-                mention_embedding,
-                top_k=self.config.ann.top_k
-            )
-            candidate_ids.update(ann_ids)
-        
-        return list(candidate_ids)
+        if ann_ids is None:
+            ann_ids = []
+            if self.ann_index and mention_embedding is not None:
+                ann_ids, _ = self.ann_index.search(
+                    mention_embedding,
+                    top_k=self.config.ann.top_k
+                )
+        
+        # Deduplicate all sources in a single pass
+        return list(dict.fromkeys(chain(exact_ids, blocked_ids, ann_ids)))
     
-    def _compute_signals(self, mention: Mention, candidate_ids: List[str]) -> List[Candidate]:
+    def _compute_signals(
+        self,
+        mention: Mention,
+        candidate_ids: List[str],
+        mention_embedding: Optional[np.ndarray] = None,
+        exact_result: Optional[Tuple[str, Citation]] = None
+    ) -> Tuple[List[Candidate], SignalTable]:
         """
         Compute all signals for candidates.
         
         Args:
             mention: Mention to match
             candidate_ids: List of candidate entity IDs
+            mention_embedding: Unit-normalized mention embedding, if encoded
+            exact_result: Result of the mention's exact lookup
         
         Returns:
-            List of candidates with computed signals
+            Tuple of (candidates with computed signals, SignalTable with one
+            entry per returned candidate)
         """
-        candidates = []
+        semantic_scores = self._batch_semantic_scores(candidate_ids, mention_embedding)
+        mention_tokens = token_set(mention.text)
+        query = PreparedQuery(mention.normalized_text)
+        mention_key = query.key
+        token_set_scores = self._batch_token_set_scores(query, candidate_ids)
+        mention_domain = domain_key(mention.metadata)
+        now = datetime.now()  # one clock read for every candidate's recency boost
+        buffer = SignalBuffer(len(candidate_ids))
+        
+        def score_one(i: int) -> Optional[Candidate]:
+            entity_id = candidate_ids[i]
+            return self._score_one(
+                mention, entity_id, semantic_scores.get(entity_id), mention_tokens,
+                exact_result, row=buffer.values[i], mention_key=mention_key,
+                mention_domain=mention_domain, token_set_score=token_set_scores.get(entity_id),
+                now=now
+            )
         
-        for entity_id in candidate_ids:
-            entity = self.storage.get_entity(entity_id)
-            if not entity:
-                continue
-            
-            candidate = Candidate(entity_id=entity_id, entity=entity)
-            
-            # Compute all signals
-            self._compute_exact_signal(mention, entity, candidate)
-            self._compute_fuzzy_signals(mention, entity, candidate)
-            self._compute_acronym_signal(mention, entity, candidate)
-            
-            if self.embedding_model:
-                self._compute_semantic_signal(mention, entity, candidate)
-            
-            self._compute_contextual_signals(mention, entity, candidate)
-            
-            candidates.append(candidate)
+        # Candidates are independent, so they can be scored on a thread pool
+        # (each writes its own buffer row). Token set and semantic scores are
+        # precomputed in batch above, which leaves GIL-bound Python per
+        # candidate; the pool is therefore opt-in.
+        min_parallel = self.config.mode_b.parallel_min_candidates
+        if min_parallel is not None and len(candidate_ids) >= min_parallel:
+            results = list(self._get_executor().map(score_one, range(len(candidate_ids))))
+        else:
+            results = [score_one(i) for i in range(len(candidate_ids))]
         
-        return candidates
+        kept = [i for i, candidate in enumerate(results) if candidate is not None]
+        candidates = [results[i] for i in kept]
+        return candidates, buffer.table([c.entity_id for c in candidates], kept)
     
-    def _compute_exact_signal(self, mention: Mention, entity: Entity, candidate: Candidate):
-        """Compute exact match signal."""
-        exact_result = self.exact_matcher.match(mention.text)
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the candidate scoring thread pool (created lazily)."""
+        if self._executor is None:
+            max_workers = self.config.mode_b.max_workers or 2 * (os.cpu_count() or 1)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        return self._executor
+    
+    def _score_one(
+        self,
+        mention: Mention,
+        entity_id: str,
+        semantic_score: Optional[float] = None,
+        mention_tokens: Optional[FrozenSet[str]] = None,
+        exact_result: Optional[Tuple[str, Citation]] = None,
+        semantic: bool = True,
+        row: Optional[np.ndarray] = None,
+        mention_key: Optional[FuzzyKey] = None,
+        mention_domain: Optional[Tuple[str, Optional[str]]] = None,
+        token_set_score: Optional[float] = None,
+        now: Optional[datetime] = None
+    ) -> Optional[Candidate]:
+        """
+        Compute all signals for a single candidate.
+        
+        Args:
+            mention: Mention to match
+            entity_id: Candidate entity ID
+            semantic_score: Precomputed semantic score, if available
+            mention_tokens: Precomputed token set of the mention text
+            exact_result: Result of the mention's exact lookup
+            semantic: Whether to compute the semantic signal
+            row: SignalBuffer row to write the signal scores to
+            mention_key: Precomputed fuzzy key of the normalized mention text
+            mention_domain: Precomputed domain_key of the mention metadata
+            token_set_score: Precomputed token set ratio of the normalized names
+            now: Current time for the recency boost (defaults to datetime.now())
+        
+        Returns:
+            Candidate with computed signals, or None if the entity is missing
+        """
+        entity = self.storage.get_entity(entity_id)
+        if not entity:
+            return None
+        
+        candidate = Candidate(entity_id=entity_id, entity=entity)
+        
+        # Compute all signals
+        exact = self._compute_exact_signal(mention, entity, candidate, exact_result)
+        fuzzy = self._compute_fuzzy_signals(mention, entity, candidate, mention_key, token_set_score)
+        acronym = self._compute_acronym_signal(mention, entity, candidate, mention_tokens)
+        
+        semantic_value = 0.0
+        if semantic and self.embedding_model:
+            semantic_value = self._compute_semantic_signal(mention, entity, candidate, semantic_score)
+        
+        contextual = self._compute_contextual_signals(mention, entity, candidate, mention_domain, now)
+        
+        if row is not None:
+            row[EXACT_MATCH] = exact
+            row[EMBEDDING_COSINE] = semantic_value
+            row[TOKEN_SET_RATIO] = fuzzy
+            row[ACRONYM] = acronym
+            row[CONTEXTUAL] = contextual
+        
+        return candidate
+    
+    def _compute_exact_signal(
+        self,
+        mention: Mention,
+        entity: Entity,
+        candidate: Candidate,
+        exact_result: Optional[Tuple[str, Citation]] = None
+    ) -> float:
+        """Compute exact match signal (exact_result is the mention's exact lookup)."""
         if exact_result and exact_result[0] == entity.id:
             citation = exact_result[1]
             candidate.add_signal('exact_match', 1.0, citation)
-        else:
-            candidate.add_signal('exact_match', 0.0)
+            return 1.0
+        
+        candidate.add_signal('exact_match', 0.0)
+        return 0.0
     
-    def _compute_fuzzy_signals(self, mention: Mention, entity: Entity, candidate: Candidate):
-        """Compute fuzzy string similarity signals."""
-        score, citations = combined_fuzzy_score(
-            mention.normalized_text,
-            entity.normalized_name
-        )
+    def _compute_fuzzy_signals(
+        self,
+        mention: Mention,
+        entity: Entity,
+        candidate: Candidate,
+        mention_key: Optional[FuzzyKey] = None,
+        token_set_score: Optional[float] = None
+    ) -> float:
+        """Compute fuzzy string similarity signals (token_set_score may be precomputed)."""
+        # Only the token set ratio is used, so the other combined_fuzzy_score
+        # metrics and citations are not computed
+        if token_set_score is None:
+            token_set_score = token_set_ratio(
+                mention_key or mention.normalized_text,
+                self._entity_fuzzy.get(entity.id) or entity.normalized_name
+            )
+        citation = token_set_citation(token_set_score)
         
         # Use token_set_ratio as the main fuzzy signal
-        for citation in citations:
-            if citation.method == "token_set_ratio":
-                candidate.add_signal('token_set_ratio', citation.confidence_contribution / self.config.mode_b_weights.token_set_ratio, citation)
-                break
+        score = citation.confidence_contribution / self.config.mode_b_weights.token_set_ratio
+        candidate.add_signal('token_set_ratio', score, citation)
+        return score
+    
+    def _batch_token_set_scores(self, query: PreparedQuery, candidate_ids: List[str]) -> Dict[str, float]:
+        """
+        Token set ratio of the mention against all indexed candidates in one call.
+        
+        Args:
+            query: Prepared normalized mention text
+            candidate_ids: Candidate entity IDs
         
-        if 'token_set_ratio' not in candidate.signals:
-            candidate.add_signal('token_set_ratio', score)
+        Returns:
+            Dict of entity_id -> token set ratio 0-1; candidates without a
+            cached normalized name are omitted
+        """
+        entity_fuzzy = self._entity_fuzzy
+        indexed_ids = [cid for cid in candidate_ids if cid in entity_fuzzy]
+        scores = query.token_set_ratio([entity_fuzzy[cid].text for cid in indexed_ids])
+        return dict(zip(indexed_ids, scores.tolist()))
     
-    def _compute_acronym_signal(self, mention: Mention, entity: Entity, candidate: Candidate):
+    def _compute_acronym_signal(
+        self,
+        mention: Mention,
+        entity: Entity,
+        candidate: Candidate,
+        mention_tokens: Optional[FrozenSet[str]] = None
+    ) -> float:
         """Compute acronym signal."""
-        score, citation = acronym_score(mention.text, entity.canonical_name)
+        score, citation = acronym_score(
+            mention.text,
+            entity.canonical_name,
+            mention_tokens=mention_tokens,
+            canonical_tokens=self._entity_tokens.get(entity.id),
+            canonical_acronym=self._entity_acronyms.get(entity.id)
+        )
         candidate.add_signal('acronym', score, citation)
+        return score
     
-    def _compute_semantic_signal(self, mention: Mention, entity: Entity, candidate: Candidate):
-        """Compute semantic similarity signal."""
-        if self.embedding_model:
+    def _batch_semantic_scores(
+        self,
+        candidate_ids: List[str],
+        mention_embedding: Optional[np.ndarray]
+    ) -> Dict[str, float]:
+        """
+        Score all cached candidate embeddings against the mention in one matmul.
+        
+        Args:
+            candidate_ids: Candidate entity IDs
+            mention_embedding: Unit-normalized mention embedding
+        
+        Returns:
+            Dict of entity_id -> cosine rescaled to [0, 1]; candidates without
+            a cached embedding are omitted
+        """
+        if mention_embedding is None or self._emb_matrix is None:
+            return {}
+        
+        id_to_row = self._id_to_row
+        cached_ids = [cid for cid in candidate_ids if cid in id_to_row]
+        if not cached_ids:
+            return {}
+        
+        rows = np.fromiter(
+            (id_to_row[cid] for cid in cached_ids), dtype=np.int64, count=len(cached_ids)
+        )
+        
+        # Rows and query are unit-normalized: cosine is a dot product,
+        # rescaled to [0, 1] like cosine_similarity
+        if self._emb_matrix.dtype == np.float32:
+            sims = cosine_rows(self._emb_matrix, rows, mention_embedding)
+        else:
+            # Only the gathered rows are widened, so fp16/int8 storage keeps
+            # the matmul on float32 BLAS
+            dots = self._emb_matrix[rows].astype(np.float32) @ mention_embedding
+            if self._emb_scales is not None:
+                dots *= self._emb_scales[rows]
+            sims = np.clip((dots + 1.0) / 2.0, 0.0, 1.0)
+        return dict(zip(cached_ids, sims.tolist()))
+    
+    def _compute_semantic_signal(
+        self,
+        mention: Mention,
+        entity: Entity,
+        candidate: Candidate,
+        score: Optional[float] = None
+    ) -> float:
+        """Compute semantic similarity signal (score may be precomputed)."""
+        if not self.embedding_model:
+            return 0.0
+        
+        if score is not None:
+            citation = Citation(
+                source="SentenceTransformers",
+                method=f"embedding_cosine ({self.embedding_model.model_name})",
+                component="semantic",
+                confidence_contribution=score
+            )
+        else:
+            # Entity added after the index was built
             score, citation = semantic_similarity_score(
                 mention.text,
                 entity.canonical_name,
                 self.embedding_model
             )
-            candidate.add_signal('embedding_cosine', score, citation)
+        candidate.add_signal('embedding_cosine', score, citation)
+        return score
     
-    def _compute_contextual_signals(self, mention: Mention, entity: Entity, candidate: Candidate):
+    def _compute_contextual_signals(
+        self,
+        mention: Mention,
+        entity: Entity,
+        candidate: Candidate,
+        mention_domain: Optional[Tuple[str, Optional[str]]] = None,
+        now: Optional[datetime] = None
+    ) -> float:
         """Compute contextual signals."""
         total_contextual = 0.0
         citations = []
         
-        # Domain consistency
-        boost, citation = domain_consistency_boost(
-            mention.metadata,
-            entity.metadata
+        # Domain consistency (domain keys are lowercased once per entity/mention)
+        entity_domain = self._entity_domains.get(entity.id)
+        boost, citation = domain_consistency_boost_fast(
+            mention_domain or domain_key(mention.metadata),
+            entity_domain or domain_key(entity.metadata)
         )
         if boost > 0:
             total_contextual += boost
@@ -316,10 +816,12 @@ class ModeBResolver:
                 citations.append(citation)
         
         # Recency
-        recency = recency_boost(entity)
+        recency = recency_boost(entity, now)
         total_contextual += recency
         
         if total_contextual > 0:
             candidate.add_signal('contextual', total_contextual, citations[0] if citations else None)
-        else:
-            candidate.add_signal('contextual', 0.0)
+            return total_contextual
+        
+        candidate.add_signal('contextual', 0.0)
+        return 0.0
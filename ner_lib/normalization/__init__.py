@@ -6,6 +6,7 @@ from ner_lib.normalization.text import (
     collapse_whitespace,
     create_acronym,
     get_tokens,
+    token_set,
     token_containment,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "collapse_whitespace",
     "create_acronym",
     "get_tokens",
+    "token_set",
     "token_containment",
 ]
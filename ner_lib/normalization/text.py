@@ -1,8 +1,20 @@
 """Text normalization utilities."""
 
+from functools import lru_cache
 import re
 import string
-from typing import List
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_TOKEN_RE = re.compile(r'\w+')
+# Whitespace-delimited words made only of letters (like str.isalpha)
+_ALPHA_WORD_RE = re.compile(r'(?<!\S)[^\W\d_]+(?!\S)')
+
+# Common stop words ignored when building acronyms
+_STOP_WORDS = frozenset({'the', 'of', 'and', 'a', 'an', 'in', 'on', 'at', 'to', 'for'})
+
+# Compiled legal-suffix patterns, keyed by the suffix list
+_SUFFIX_PATTERNS: Dict[Tuple[str, ...], Tuple[re.Pattern, ...]] = {}
 
 
 def normalize_entity_name(text: str, config=None) -> str:
@@ -38,7 +50,7 @@ def normalize_entity_name(text: str, config=None) -> str:
     # Strip punctuation
     if config.strip_punctuation:
         # Keep spaces and alphanumeric
-        result = re.sub(r'[^\w\s]', ' ', result)
+        result = _PUNCT_RE.sub(' ', result)
     
     # Collapse whitespace
     if config.collapse_whitespace:
@@ -58,34 +70,58 @@ def strip_legal_suffixes(text: str, suffixes: List[str]) -> str:
     Returns:
         Text with suffixes removed
     """
-    # Create pattern that matches suffixes at end of string
-    # Match with optional punctuation and whitespace before
-    for suffix in suffixes:
-        # Match suffix at end, potentially with comma, period, spaces
-        pattern = r'\s*[,.]?\s*\b' + re.escape(suffix) + r'\b\.?\s*$'
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    # One pass over the suffixes, in list order
+    for pattern in _suffix_patterns(suffixes):
+        text = pattern.sub('', text)
     
     return text
 
 
+def _suffix_patterns(suffixes: List[str]) -> Tuple[re.Pattern, ...]:
+    """
+    Get the compiled trailing-suffix pattern of each legal suffix.
+    
+    Args:
+        suffixes: List of suffixes (case-insensitive)
+    
+    Returns:
+        Compiled patterns in list order (cached per suffix list)
+    """
+    key = tuple(suffixes)
+    patterns = _SUFFIX_PATTERNS.get(key)
+    if patterns is None:
+        # Match suffix at end, potentially with comma, period, spaces
+        patterns = tuple(
+            re.compile(r'\s*[,.]?\s*\b' + re.escape(suffix) + r'\b\.?\s*$', re.IGNORECASE)
+            for suffix in key
+        )
+        _SUFFIX_PATTERNS[key] = patterns
+    return patterns
+
+
 def collapse_whitespace(text: str) -> str:
     """
     Collapse multiple whitespace characters into single space.
     
+    Leading and trailing whitespace is removed.
+    
     Args:
         text: Input text
     
     Returns:
         Text with normalized whitespace
     """
-    return re.sub(r'\s+', ' ', text)
+    # str.split() already splits on runs of whitespace, in C
+    return ' '.join(text.split())
 
 
+@lru_cache(maxsize=100_000)
 def create_acronym(text: str) -> str:
     """
     Create an acronym from entity name.
     
-    Takes first letter of each word (ignoring common stop words).
+    Takes first letter of each word (ignoring common stop words). Results
+    are cached, since the same canonical names are compared repeatedly.
     
     Args:
         text: Input text
@@ -97,15 +133,11 @@ def create_acronym(text: str) -> str:
         "International Business Machines" -> "IBM"
         "The United States of America" -> "USA"
     """
-    # Common stop words to ignore
-    stop_words = {'the', 'of', 'and', 'a', 'an', 'in', 'on', 'at', 'to', 'for'}
-    
-    # Split into words and filter
-    words = text.lower().split()
-    words = [w for w in words if w not in stop_words and w.isalpha()]
-    
-    # Take first letter of each word
-    acronym = ''.join(w[0] for w in words if w)
+    # Take first letter of each alphabetic, non-stop word in one scan
+    acronym = ''.join(
+        word[0] for word in _ALPHA_WORD_RE.findall(text)
+        if word.lower() not in _STOP_WORDS
+    )
     
     return acronym.upper()
 
@@ -120,24 +152,39 @@ def get_tokens(text: str) -> List[str]:
     Returns:
         List of lowercase tokens
     """
-    # Remove punctuation and split
-    text = re.sub(r'[^\w\s]', ' ', text.lower())
-    return [t for t in text.split() if t]
+    # Word-character runs, i.e. the text split on punctuation and whitespace
+    return _TOKEN_RE.findall(text.lower())
+
+
+def token_set(text: str) -> FrozenSet[str]:
+    """
+    Extract the set of tokens of a text.
+    
+    Args:
+        text: Input text
+    
+    Returns:
+        Frozenset of lowercase tokens
+    """
+    return frozenset(get_tokens(text))
 
 
-def token_containment(text1: str, text2: str) -> bool:
+def token_containment(
+    text1: Union[str, FrozenSet[str]],
+    text2: Union[str, FrozenSet[str]]
+) -> bool:
     """
     Check if tokens of one text are fully contained in the other.
     
     Args:
-        text1: First text
-        text2: Second text
+        text1: First text, or its precomputed token_set()
+        text2: Second text, or its precomputed token_set()
     
     Returns:
         True if one text's tokens are subset of the other
     """
-    tokens1 = set(get_tokens(text1))
-    tokens2 = set(get_tokens(text2))
+    tokens1 = token_set(text1) if isinstance(text1, str) else text1
+    tokens2 = token_set(text2) if isinstance(text2, str) else text2
     
     if not tokens1 or not tokens2:
         return False
@@ -1,5 +1,10 @@
 """Named Entity Recognition module for NER library."""
 
-from ner_lib.recognition.recognition import recognize_entities
+from ner_lib.recognition.recognition import (
+    recognize_entities,
+    recognize_entities_batch,
+    group_by_type,
+    entities_to_soa
+)
 
-__all__ = ["recognize_entities"]
+__all__ = ["recognize_entities", "recognize_entities_batch", "group_by_type", "entities_to_soa"]
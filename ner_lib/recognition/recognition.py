@@ -1,35 +1,37 @@
 """Named Entity Recognition using spaCy."""
 
-from typing import Dict, List
-from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from collections import Counter, defaultdict
 import logging
+import os
+import sys
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from spacy.language import Language
 
 logger = logging.getLogger(__name__)
 
 
-def recognize_entities(text: str, model_name: str = "en_core_web_lg") -> Dict:
+# Loaded spaCy pipelines, keyed by requested model name
+_NLP_CACHE: Dict[str, "Language"] = {}
+
+
+def _get_nlp(model_name: str = "en_core_web_lg") -> "Language":
     """
-    Extract named entities from text using spaCy.
+    Get a spaCy pipeline, loading it on first use.
     
     Args:
-        text: Input text to extract named entities from
-        model_name: spaCy model to use (default: en_core_web_lg)
+        model_name: Preferred spaCy model (falls back to lg > md > sm)
     
     Returns:
-        Dictionary containing:
-        - entities: List of dicts with entity info (text, type, count)
-        - total_entities: Total number of entities found
-        - entity_types: Count of entities by type
-    
-    Example:
-        >>> result = recognize_entities("Apple Inc. was founded by Steve Jobs in Cupertino")
-        >>> print(result['entities'])
-        [
-            {'text': 'Apple Inc.', 'type': 'ORG', 'count': 1},
-            {'text': 'Steve Jobs', 'type': 'PERSON', 'count': 1},
-            {'text': 'Cupertino', 'type': 'GPE', 'count': 1}
-        ]
+        Loaded spaCy pipeline (cached per model_name)
     """
+    nlp = _NLP_CACHE.get(model_name)
+    if nlp is not None:
+        return nlp
+    
     try:
         import spacy
     except ImportError:
@@ -39,7 +41,6 @@ def recognize_entities(text: str, model_name: str = "en_core_web_lg") -> Dict:
         )
     
     # Load spaCy model - prioritize larger models for better NER
-    nlp = None
     # Try models in order of quality for NER: lg > md > sm
     models_to_try = ["en_core_web_lg", "en_core_web_md", "en_core_web_sm"]
     
@@ -67,31 +68,37 @@ def recognize_entities(text: str, model_name: str = "en_core_web_lg") -> Dict:
     # Log which model we're using
     print(f"[NER] Using spaCy model: {loaded_model}")
     
-    # Process text
-    doc = nlp(text)
-    
-    # Count occurrences of each entity
-    entity_counter = Counter()
-    entity_types_map = {}
+    _NLP_CACHE[model_name] = nlp
+    return nlp
+
+
+def _summarize_entities(ents: Iterable) -> Dict:
+    """Build the recognize_entities result for the entity spans of a Doc."""
+    # Build entity entries and count occurrences in a single pass
+    # (the last label seen for a text wins)
+    # Labels are interned so every entry (across documents too) shares one
+    # string per type and type comparisons hit the identity fast path
+    entries: Dict[str, Dict] = {}
     
-    for ent in doc.ents:
-        entity_counter[ent.text] += 1
-        entity_types_map[ent.text] = ent.label_
+    for ent in ents:
+        text = ent.text
+        entry = entries.get(text)
+        if entry is None:
+            entries[text] = {"text": text, "type": sys.intern(ent.label_), "count": 1}
+        else:
+            entry["type"] = sys.intern(ent.label_)
+            entry["count"] += 1
     
-    # Build entity list
-    entities = []
-    for entity_text, count in entity_counter.items():
-        entities.append({
-            "text": entity_text,
-            "type": entity_types_map[entity_text],
-            "count": count
-        })
+    # Repeated entity texts are likely to recur in other documents too
+    for entry in entries.values():
+        if entry["count"] >= 2:
+            entry["text"] = sys.intern(entry["text"])
     
     # Sort by occurrence count (descending), then alphabetically
-    entities.sort(key=lambda x: (-x['count'], x['text']))
+    entities = sorted(entries.values(), key=lambda x: (-x['count'], x['text']))
     
     # Count entities by type
-    entity_type_counts = Counter([e['type'] for e in entities])
+    entity_type_counts = Counter(e['type'] for e in entities)
     
     return {
         "entities": entities,
@@ -100,6 +107,123 @@ def recognize_entities(text: str, model_name: str = "en_core_web_lg") -> Dict:
     }
 
 
+def recognize_entities(
+    text: str,
+    model_name: str = "en_core_web_lg",
+    nlp: Optional["Language"] = None
+) -> Dict:
+    """
+    Extract named entities from text using spaCy.
+    
+    The spaCy model is loaded once per process and reused across calls.
+    
+    Args:
+        text: Input text to extract named entities from
+        model_name: spaCy model to use (default: en_core_web_lg)
+        nlp: Already-loaded spaCy pipeline to use instead of model_name
+    
+    Returns:
+        Dictionary containing:
+        - entities: List of dicts with entity info (text, type, count)
+        - total_entities: Total number of entities found
+        - entity_types: Count of entities by type
+    
+    Example:
+        >>> result = recognize_entities("Apple Inc. was founded by Steve Jobs in Cupertino")
+        >>> print(result['entities'])
+        [
+            {'text': 'Apple Inc.', 'type': 'ORG', 'count': 1},
+            {'text': 'Steve Jobs', 'type': 'PERSON', 'count': 1},
+            {'text': 'Cupertino', 'type': 'GPE', 'count': 1}
+        ]
+    """
+    # Blank text has no entities; skip loading and running the pipeline
+    if not text or text.isspace():
+        return _summarize_entities(())
+    
+    if nlp is None:
+        nlp = _get_nlp(model_name)
+    
+    # Process text
+    return _summarize_entities(nlp(text).ents)
+
+
+def recognize_entities_batch(
+    texts: List[str],
+    model_name: str = "en_core_web_lg",
+    batch_size: Optional[int] = None,
+    n_process: int = 1,
+    nlp: Optional["Language"] = None
+) -> List[Dict]:
+    """
+    Extract named entities from many texts with nlp.pipe.
+    
+    Args:
+        texts: Input texts
+        model_name: spaCy model to use (default: en_core_web_lg)
+        batch_size: Number of texts per spaCy batch (default: the
+            NER_BATCH_SIZE environment variable, or 64)
+        n_process: Number of worker processes (-1 for all CPUs)
+        nlp: Already-loaded spaCy pipeline to use instead of model_name
+    
+    Returns:
+        List of recognize_entities results, one per text
+    """
+    if nlp is None:
+        nlp = _get_nlp(model_name)
+    
+    if batch_size is None:
+        batch_size = int(os.environ.get("NER_BATCH_SIZE", 64))
+    
+    return [
+        _summarize_entities(doc.ents)
+        for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+    ]
+
+
+def group_by_type(entities: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Bucket recognized entities by type in a single pass.
+    
+    Args:
+        entities: The 'entities' list of a recognize_entities result
+    
+    Returns:
+        Dict of entity type -> entities of that type, in input order
+        (missing types map to an empty list)
+    
+    Example:
+        >>> buckets = group_by_type(recognize_entities(text)['entities'])
+        >>> orgs = buckets['ORG']
+    """
+    buckets: Dict[str, List[Dict]] = defaultdict(list)
+    for entity in entities:
+        buckets[entity['type']].append(entity)
+    return buckets
+
+
+def entities_to_soa(entities: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Column (structure-of-arrays) view of recognized entities.
+    
+    Args:
+        entities: The 'entities' list of a recognize_entities result
+    
+    Returns:
+        Dict of parallel arrays 'texts' (object), 'types' (str) and
+        'counts' (int32), in input order
+    
+    Example:
+        >>> soa = entities_to_soa(recognize_entities(text)['entities'])
+        >>> orgs = soa['texts'][soa['types'] == 'ORG']
+    """
+    return {
+        "texts": np.array([e['text'] for e in entities], dtype=object),
+        "types": np.array([e['type'] for e in entities], dtype=str),
+        "counts": np.array([e['count'] for e in entities], dtype=np.int32)
+    }
+
+
 def get_entity_types() -> List[str]:
     """
     Get list of entity types recognized by spaCy.
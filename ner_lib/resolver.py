@@ -1,6 +1,6 @@
 """Main EntityResolver API."""
 
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Union
 from ner_lib.config import Config, DEFAULT_CONFIG
 from ner_lib.storage import StorageBackend, MemoryStorage
 from ner_lib.models.entity import Entity, Alias, Mention
@@ -83,14 +83,21 @@ class EntityResolver:
             from ner_lib.signals import EmbeddingModel as EM
             self._embedding_model = EM(
                 model_name=self.config.models.sentence_transformer_model,
-                device=self.config.models.device
+                device=self.config.models.device,
+                backend=self.config.models.backend,
+                precision=self.config.models.precision,
+                batch_size=self.config.models.encode_batch_size,
+                # Unit vectors leave cosine scores unchanged; l2 indexes
+                # keep the raw embedding distances
+                normalize=self.config.ann.metric == "cosine",
+                model_file=self.config.models.model_file
             )
         return self._embedding_model
     
     def add_entity(
         self,
         canonical_name: str,
-        aliases: Optional[List[str]] = None,
+        aliases: Optional[Iterable[str]] = None,
         metadata: Optional[dict] = None
     ) -> str:
         """
@@ -98,7 +105,8 @@ class EntityResolver:
         
         Args:
             canonical_name: Canonical name of the entity
-            aliases: Optional list of aliases
+            aliases: Optional aliases (any iterable, e.g. a generator or
+                itertools.islice; consumed once)
             metadata: Optional metadata dict
         
         Returns:
@@ -115,15 +123,19 @@ class EntityResolver:
         """
         entity = Entity(
             canonical_name=canonical_name,
-            aliases=aliases or [],
+            aliases=list(aliases) if aliases is not None else [],
             metadata=metadata or {}
         )
         
         entity_id = self.storage.create_entity(entity)
         
-        # Rebuild indices
+        # Index the new entity in place; fall back to a full rebuild when
+        # that is not possible (e.g. a memory-mapped ANN index)
         if self._resolver:
-            self._initialize_resolver()
+            try:
+                self._resolver.add_entity_incremental(entity)
+            except ValueError:
+                self._initialize_resolver()
         
         return entity_id
     
@@ -164,6 +176,37 @@ class EntityResolver:
         if hasattr(self._resolver, 'build_ann_index'):
             self._resolver.build_ann_index(self.embedding_model)
     
+    def save_semantic_index(self, directory: str):
+        """
+        Persist the semantic (ANN) index to a directory.
+        
+        Args:
+            directory: Target directory
+        """
+        if not hasattr(self._resolver, 'save'):
+            raise ValueError(f"Saving the semantic index is not supported in mode {self.mode}")
+        
+        self._resolver.save(directory)
+    
+    def load_semantic_index(self, directory: str, mmap: bool = True):
+        """
+        Load a semantic index written by save_semantic_index().
+        
+        Worker processes can share one memory-mapped index instead of each
+        re-encoding every entity.
+        
+        Args:
+            directory: Directory written by save_semantic_index()
+            mmap: Memory-map the index files
+        """
+        if not self._resolver:
+            self._initialize_resolver()
+        
+        if not hasattr(self._resolver, 'load'):
+            raise ValueError(f"Loading the semantic index is not supported in mode {self.mode}")
+        
+        self._resolver.load(directory, self.embedding_model, mmap=mmap)
+    
     def resolve(self, mention: Union[str, Mention]) -> MatchResult:
         """
         Resolve a single entity mention.
@@ -221,7 +264,20 @@ class EntityResolver:
                     print(f"{result.mention.text} -> {result.matched_entity.canonical_name}")
             ```
         """
-        return [self.resolve(mention) for mention in mentions]
+        mentions = [
+            Mention(text=mention) if isinstance(mention, str) else mention
+            for mention in mentions
+        ]
+        
+        # Initialize resolver if needed
+        if not self._resolver:
+            self._initialize_resolver()
+        
+        # Mode B batches embedding + ANN work across mentions
+        if hasattr(self._resolver, 'resolve_batch'):
+            return self._resolver.resolve_batch(mentions)
+        
+        return [self._resolver.resolve(mention) for mention in mentions]
     
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get entity by ID."""
@@ -243,6 +299,18 @@ class EntityResolver:
         """
         return self.storage.get_review_queue(status)
     
+    def clear(self):
+        """
+        Remove all entities, aliases and review items.
+        
+        The resolver keeps its components (and a loaded embedding model), so
+        one instance can be reused instead of constructing a new one.
+        """
+        self.storage.clear()
+        
+        if self._resolver:
+            self._resolver.clear()
+    
     def rebuild_indices(self):
         """
         Rebuild all indices.
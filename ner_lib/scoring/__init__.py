@@ -1,5 +1,6 @@
 """Scoring package."""
 
 from ner_lib.scoring.aggregation import WeightedAggregator
+from ner_lib.scoring.signal_buffer import SignalBuffer, SignalTable
 
-__all__ = ["WeightedAggregator"]
+__all__ = ["WeightedAggregator", "SignalBuffer", "SignalTable"]
@@ -0,0 +1,90 @@
+"""Numeric kernels for Mode B scoring (Numba-compiled when available)."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Column order of the (n_candidates, 5) signal matrices passed to aggregate_rows
+SIGNAL_COLUMNS = ("exact_match", "embedding_cosine", "token_set_ratio", "acronym", "contextual")
+
+
+def _cosine_rows_numpy(matrix: np.ndarray, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """NumPy implementation of cosine_rows."""
+    return np.clip((matrix[rows] @ query + 1.0) / 2.0, 0.0, 1.0)
+
+
+def _aggregate_rows_numpy(signals: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """NumPy implementation of aggregate_rows."""
+    scores = np.clip(signals @ weights, 0.0, 1.0)
+    scores[signals[:, 0] == 1.0] = 1.0
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _cosine_rows_jit(matrix, rows, query):
+        n = rows.shape[0]
+        d = query.shape[0]
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            row = rows[i]
+            acc = np.float32(0.0)
+            for j in range(d):
+                acc += matrix[row, j] * query[j]
+            out[i] = min(1.0, max(0.0, (acc + 1.0) / 2.0))
+        return out
+    
+    @njit(cache=True, fastmath=True)
+    def _aggregate_rows_jit(signals, weights):
+        n, k = signals.shape
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            # Exact match overrides everything
+            if signals[i, 0] == 1.0:
+                out[i] = 1.0
+                continue
+            acc = 0.0
+            for j in range(k):
+                acc += signals[i, j] * weights[j]
+            out[i] = min(1.0, max(0.0, acc))
+        return out
+
+
+def cosine_rows(matrix: np.ndarray, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Cosine of selected unit-normalized rows against a unit query.
+    
+    Args:
+        matrix: (M, d) float32 matrix of unit-normalized rows
+        rows: int64 row indices to score
+        query: (d,) float32 unit-normalized query
+    
+    Returns:
+        float32 array of cosines rescaled to [0, 1]
+    """
+    if NUMBA_AVAILABLE:
+        return _cosine_rows_jit(matrix, rows, query)
+    return _cosine_rows_numpy(matrix, rows, query)
+
+
+def aggregate_rows(signals: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Weighted Mode B aggregation for many candidates at once.
+    
+    Rows with exact_match == 1.0 score 1.0; the rest are the weighted sum
+    clipped to [0, 1], as in WeightedAggregator.aggregate.
+    
+    Args:
+        signals: (n, 5) float64 matrix in SIGNAL_COLUMNS order
+        weights: (5,) float64 weights in SIGNAL_COLUMNS order
+    
+    Returns:
+        float64 array of final scores
+    """
+    if NUMBA_AVAILABLE:
+        return _aggregate_rows_jit(signals, weights)
+    return _aggregate_rows_numpy(signals, weights)
@@ -1,8 +1,12 @@
 """Score aggregation for Mode B."""
 
 from typing import Dict, List
+import numpy as np
+
 from ner_lib.models.candidate import Candidate, Citation
 from ner_lib.config import ModeBWeights
+from ner_lib.scoring._kernels import SIGNAL_COLUMNS, aggregate_rows
+from ner_lib.scoring.signal_buffer import SignalTable
 
 
 class WeightedAggregator:
@@ -20,6 +24,15 @@ class WeightedAggregator:
             weights = DEFAULT_CONFIG.mode_b_weights
         
         self.weights = weights
+        
+        # Weight vector in SIGNAL_COLUMNS order for batch aggregation
+        self._w = np.array([
+            weights.exact_match,
+            weights.embedding_cosine,
+            weights.token_set_ratio,
+            weights.acronym,
+            weights.contextual_boost
+        ])
     
     def aggregate(self, candidate: Candidate) -> float:
         """
@@ -53,6 +66,46 @@ class WeightedAggregator:
         
         return score
     
+    def aggregate_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        """
+        Aggregate signals for many candidates at once.
+        
+        Args:
+            candidates: Candidates with signals
+        
+        Returns:
+            Array of final scores, same values as aggregate() per candidate
+        """
+        signals = np.array([
+            [candidate.signals.get(name, 0.0) for name in SIGNAL_COLUMNS]
+            for candidate in candidates
+        ]).reshape(len(candidates), len(SIGNAL_COLUMNS))
+        return self.aggregate_matrix(signals)
+    
+    def aggregate_matrix(self, signals: np.ndarray) -> np.ndarray:
+        """
+        Aggregate a precomputed signal matrix.
+        
+        Args:
+            signals: (n, 5) float64 matrix in SIGNAL_COLUMNS order
+        
+        Returns:
+            Array of final scores
+        """
+        return aggregate_rows(signals, self._w)
+    
+    def aggregate_table(self, table: SignalTable) -> np.ndarray:
+        """
+        Aggregate a columnar SignalTable.
+        
+        Args:
+            table: Signal columns for n candidates
+        
+        Returns:
+            Array of final scores, in table order
+        """
+        return self.aggregate_matrix(table.as_matrix())
+    
     def aggregate_with_details(self, candidate: Candidate) -> tuple[float, Dict[str, float]]:
         """
         Aggregate signals and return detailed breakdown.
@@ -0,0 +1,91 @@
+"""Structure-of-arrays signal storage for Mode B scoring."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+import numpy as np
+
+from ner_lib.scoring._kernels import SIGNAL_COLUMNS
+
+# Column indices into SignalBuffer.values (SIGNAL_COLUMNS order)
+EXACT_MATCH, EMBEDDING_COSINE, TOKEN_SET_RATIO, ACRONYM, CONTEXTUAL = range(len(SIGNAL_COLUMNS))
+
+
+@dataclass
+class SignalTable:
+    """Columnar signal scores for a set of candidates (one entry per candidate)."""
+    
+    entity_ids: List[str]
+    exact_match: np.ndarray
+    embedding_cosine: np.ndarray
+    token_set_ratio: np.ndarray
+    acronym: np.ndarray
+    contextual: np.ndarray
+    _matrix: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+    
+    def as_matrix(self) -> np.ndarray:
+        """
+        Get the signals as an (n, 5) matrix in SIGNAL_COLUMNS order.
+        
+        Returns:
+            The backing buffer when the table was built by SignalBuffer,
+            otherwise a stacked copy of the columns
+        """
+        if self._matrix is not None:
+            return self._matrix
+        return np.column_stack([
+            self.exact_match, self.embedding_cosine, self.token_set_ratio,
+            self.acronym, self.contextual
+        ])
+
+
+class SignalBuffer:
+    """Signal scores for all candidates of a mention, one row per candidate."""
+    
+    def __init__(self, n_candidates: int):
+        """
+        Initialize a zero-filled buffer.
+        
+        Args:
+            n_candidates: Number of candidate rows
+        """
+        # Column-major, so each signal column is contiguous
+        self.values = np.zeros((n_candidates, len(SIGNAL_COLUMNS)), order="F")
+    
+    def rows(self, indices: List[int]) -> np.ndarray:
+        """
+        Get the signal matrix restricted to some candidate rows.
+        
+        Args:
+            indices: Row indices to keep, in order
+        
+        Returns:
+            (len(indices), n_signals) column-major matrix
+        """
+        if len(indices) == len(self.values):
+            return self.values
+        return np.asfortranarray(self.values[indices])
+    
+    def table(self, entity_ids: List[str], indices: List[int]) -> SignalTable:
+        """
+        Get a SignalTable view of some candidate rows.
+        
+        Args:
+            entity_ids: Entity IDs of the kept rows
+            indices: Row indices to keep, in order
+        
+        Returns:
+            SignalTable whose columns are views of one column-major block
+        """
+        matrix = self.rows(indices)
+        return SignalTable(
+            entity_ids,
+            matrix[:, EXACT_MATCH],
+            matrix[:, EMBEDDING_COSINE],
+            matrix[:, TOKEN_SET_RATIO],
+            matrix[:, ACRONYM],
+            matrix[:, CONTEXTUAL],
+            _matrix=matrix
+        )
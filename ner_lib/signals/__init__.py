@@ -8,11 +8,19 @@ from ner_lib.signals.deterministic import (
 )
 from ner_lib.signals.string_similarity import (
     token_set_ratio,
+    token_set_ratio_batch,
+    token_set_ratio_matrix,
+    token_set_citation,
     partial_ratio,
     levenshtein_similarity,
     jaro_winkler_similarity,
     combined_fuzzy_score,
+    combined_fuzzy_score_batch,
+    PreparedQuery,
     quick_fuzzy_score,
+    clear_fuzzy_cache,
+    FuzzyKey,
+    fuzzy_key,
 )
 from ner_lib.signals.acronym import (
     is_acronym_match,
@@ -26,21 +34,35 @@ try:
     from ner_lib.signals.semantic import (
         EmbeddingModel,
         cosine_similarity,
+        cosine_similarity_raw,
+        rescale_cosine,
         batch_cosine_similarity,
+        batch_cosine_similarity_prenormed,
         semantic_similarity_score,
+        alias_centroid,
+        semantic_similarity_to_entity,
     )
     SEMANTIC_AVAILABLE = True
 except (ImportError, AttributeError) as e:
     SEMANTIC_AVAILABLE = False
     EmbeddingModel = None
     cosine_similarity = None
+    cosine_similarity_raw = None
+    rescale_cosine = None
     batch_cosine_similarity = None
+    batch_cosine_similarity_prenormed = None
     semantic_similarity_score = None
+    alias_centroid = None
+    semantic_similarity_to_entity = None
 
 from ner_lib.signals.contextual import (
     recency_boost,
     domain_consistency_boost,
     shared_context_boost,
+    context_key,
+    domain_key,
+    domain_consistency_boost_fast,
+    shared_context_boost_fast,
 )
 
 __all__ = [
@@ -51,11 +73,19 @@ __all__ = [
     "DomainMatcher",
     # String similarity
     "token_set_ratio",
+    "token_set_ratio_batch",
+    "token_set_ratio_matrix",
+    "token_set_citation",
     "partial_ratio",
     "levenshtein_similarity",
     "jaro_winkler_similarity",
     "combined_fuzzy_score",
+    "combined_fuzzy_score_batch",
+    "PreparedQuery",
     "quick_fuzzy_score",
+    "clear_fuzzy_cache",
+    "FuzzyKey",
+    "fuzzy_key",
     # Acronym
     "is_acronym_match",
     "check_token_containment",
@@ -64,12 +94,21 @@ __all__ = [
     # Semantic
     "EmbeddingModel",
     "cosine_similarity",
+    "cosine_similarity_raw",
+    "rescale_cosine",
     "batch_cosine_similarity",
+    "batch_cosine_similarity_prenormed",
     "semantic_similarity_score",
+    "alias_centroid",
+    "semantic_similarity_to_entity",
     # Contextual
     "recency_boost",
     "domain_consistency_boost",
     "shared_context_boost",
+    "context_key",
+    "domain_key",
+    "domain_consistency_boost_fast",
+    "shared_context_boost_fast",
     # Status flags
     "SEMANTIC_AVAILABLE",
 ]
@@ -1,17 +1,27 @@
 """Acronym detection and token containment."""
 
-from typing import Optional, Tuple
-from ner_lib.normalization.text import create_acronym, token_containment, get_tokens
+from typing import FrozenSet, Optional, Tuple
+from ner_lib.normalization.text import create_acronym, token_containment, token_set
 from ner_lib.models.candidate import Citation
 
+# acronym_score results for a full acronym match and for the mention's
+# tokens being a subset of the canonical name's
+ACRONYM_MATCH_SCORE = 0.95
+TOKEN_SUBSET_SCORE = 0.85
 
-def is_acronym_match(mention: str, canonical_name: str) -> bool:
+
+def is_acronym_match(
+    mention: str,
+    canonical_name: str,
+    canonical_acronym: Optional[str] = None
+) -> bool:
     """
     Check if mention is an acronym of the canonical name.
     
     Args:
         mention: Mention text (potentially an acronym)
         canonical_name: Canonical entity name
+        canonical_acronym: Precomputed create_acronym(canonical_name)
     
     Returns:
         True if mention matches acronym of canonical name
@@ -20,7 +30,7 @@ def is_acronym_match(mention: str, canonical_name: str) -> bool:
         is_acronym_match("IBM", "International Business Machines") -> True
     """
     # Generate acronym from canonical name
-    acronym = create_acronym(canonical_name)
+    acronym = canonical_acronym if canonical_acronym is not None else create_acronym(canonical_name)
     
     # Check if mention (uppercased) matches acronym
     mention_upper = mention.upper().strip()
@@ -48,7 +58,10 @@ def check_token_containment(text1: str, text2: str) -> bool:
 def acronym_score(
     mention: str,
     canonical_name: str,
-    threshold: float = 0.5
+    threshold: float = 0.5,
+    mention_tokens: Optional[FrozenSet[str]] = None,
+    canonical_tokens: Optional[FrozenSet[str]] = None,
+    canonical_acronym: Optional[str] = None
 ) -> Tuple[float, Optional[Citation]]:
     """
     Compute acronym/containment score.
@@ -61,6 +74,9 @@ def acronym_score(
         mention: Mention text
         canonical_name: Canonical entity name
         threshold: Minimum threshold for positive match
+        mention_tokens: Precomputed token_set(mention)
+        canonical_tokens: Precomputed token_set(canonical_name)
+        canonical_acronym: Precomputed create_acronym(canonical_name)
     
     Returns:
         Tuple of (score, citation)
@@ -68,22 +84,23 @@ def acronym_score(
     score = 0.0
     reason = None
     
-    # Check acronym match (highest confidence)
-    if is_acronym_match(mention, canonical_name):
-        score = 0.95
+    # Check acronym match (highest confidence) before tokenizing anything
+    if is_acronym_match(mention, canonical_name, canonical_acronym):
+        score = ACRONYM_MATCH_SCORE
         reason = "acronym_match"
     
-    # Check token containment
-    elif check_token_containment(mention, canonical_name):
+    # Check token containment, tokenizing each text once (or reusing
+    # precomputed token sets)
+    elif token_containment(
+        mention_tokens if mention_tokens is not None else (mention_tokens := token_set(mention)),
+        canonical_tokens if canonical_tokens is not None else (canonical_tokens := token_set(canonical_name))
+    ):
         # Calculate how much overlap
-        tokens1 = set(get_tokens(mention))
-        tokens2 = set(get_tokens(canonical_name))
-        
-        if tokens1.issubset(tokens2):
+        if mention_tokens.issubset(canonical_tokens):
             # Mention tokens all in canonical
-            score = 0.85
+            score = TOKEN_SUBSET_SCORE
             reason = "token_subset"
-        elif tokens2.issubset(tokens1):
+        elif canonical_tokens.issubset(mention_tokens):
             # Canonical tokens all in mention
             score = 0.80
             reason = "token_superset"
@@ -93,14 +110,11 @@ def acronym_score(
         mention_clean = mention.upper().strip().replace(' ', '')
         canonical_words = [w for w in canonical_name.split() if w.isalpha()]
         
-        if len(canonical_words) >= len(mention_clean):
-            # Check if mention letters match first letters of consecutive words
-            matches = 0
-            for i, char in enumerate(mention_clean):
-                if i < len(canonical_words) and canonical_words[i][0].upper() == char:
-                    matches += 1
-            
-            if matches == len(mention_clean) and matches >= 2:
+        if len(canonical_words) >= len(mention_clean) >= 2:
+            # Mention letters must match the first letters of the leading
+            # words; one string comparison instead of a per-character loop
+            first_letters = ''.join([w[0].upper() for w in canonical_words[:len(mention_clean)]])
+            if first_letters == mention_clean:
                 score = 0.70
                 reason = "partial_acronym"
     
@@ -117,7 +131,12 @@ def acronym_score(
     return score, citation
 
 
-def quick_acronym_check(mention: str, canonical_name: str, threshold: float = 0.9) -> bool:
+def quick_acronym_check(
+    mention: str,
+    canonical_name: str,
+    threshold: float = 0.9,
+    canonical_acronym: Optional[str] = None
+) -> bool:
     """
     Quick check for high-confidence acronym match (for Mode A early stopping).
     
@@ -125,9 +144,10 @@ def quick_acronym_check(mention: str, canonical_name: str, threshold: float = 0.
         mention: Mention text
         canonical_name: Canonical entity name
         threshold: High confidence threshold
+        canonical_acronym: Precomputed create_acronym(canonical_name)
     
     Returns:
         True if high confidence match
     """
-    score, _ = acronym_score(mention, canonical_name)
+    score, _ = acronym_score(mention, canonical_name, canonical_acronym=canonical_acronym)
     return score >= threshold
@@ -32,7 +32,7 @@ def recency_boost(
         current_time = datetime.now()
     
     # Calculate time since last seen
-    time_delta = current_time - entity.last_seen
+    time_delta = current_time - entity.last_seen_dt
     
     # Apply exponential decay
     if time_delta.days <= recency_window_days:
@@ -44,27 +44,62 @@ def recency_boost(
     return 0.0
 
 
-def domain_consistency_boost(
-    mention_metadata: Dict,
-    entity_metadata: Dict,
+# Metadata fields compared by shared_context_boost
+_SHARED_FIELDS = ('industry', 'location', 'category', 'type')
+
+
+def context_key(metadata: Dict) -> Tuple[str, ...]:
+    """
+    Lowercased shared-context fields of a metadata dict.
+    
+    Compute once per entity (or once per mention) and compare with
+    shared_context_boost_fast instead of re-lowercasing per pair.
+    
+    Args:
+        metadata: Entity or mention metadata
+    
+    Returns:
+        Tuple of industry, location, category, type ('' when missing)
+    """
+    return tuple(metadata.get(field, '').lower() for field in _SHARED_FIELDS)
+
+
+def domain_key(metadata: Dict) -> Tuple[str, Optional[str]]:
+    """
+    Lowercased domain and email domain of a metadata dict.
+    
+    Args:
+        metadata: Entity or mention metadata
+    
+    Returns:
+        Tuple of (domain or '', email domain or None when there is no email
+        address)
+    """
+    email = metadata.get('email', '')
+    email_domain = email.split('@')[1].lower() if email and '@' in email else None
+    return metadata.get('domain', '').lower(), email_domain
+
+
+def domain_consistency_boost_fast(
+    mention_key: Tuple[str, Optional[str]],
+    entity_key: Tuple[str, Optional[str]],
     boost_value: float = 0.2
 ) -> Tuple[float, Optional[Citation]]:
     """
-    Boost if domain/website/email matches.
+    domain_consistency_boost on precomputed domain_key() tuples.
     
     Args:
-        mention_metadata: Mention metadata
-        entity_metadata: Entity metadata
+        mention_key: domain_key(mention metadata)
+        entity_key: domain_key(entity metadata)
         boost_value: Boost to apply on match
     
     Returns:
         Tuple of (boost, citation)
     """
-    # Check domain match
-    mention_domain = mention_metadata.get('domain', '').lower()
-    entity_domain = entity_metadata.get('domain', '').lower()
+    mention_domain, mention_email_domain = mention_key
+    entity_domain, entity_email_domain = entity_key
     
-    if mention_domain and entity_domain and mention_domain == entity_domain:
+    if mention_domain and mention_domain == entity_domain:
         citation = Citation(
             source="Custom",
             method="domain_match",
@@ -73,27 +108,41 @@ def domain_consistency_boost(
         )
         return boost_value, citation
     
-    # Check email domain match
-    mention_email = mention_metadata.get('email', '')
-    entity_email = entity_metadata.get('email', '')
-    
-    if mention_email and entity_email:
-        if '@' in mention_email and '@' in entity_email:
-            mention_email_domain = mention_email.split('@')[1].lower()
-            entity_email_domain = entity_email.split('@')[1].lower()
-            
-            if mention_email_domain == entity_email_domain:
-                citation = Citation(
-                    source="Custom",
-                    method="email_domain_match",
-                    component="contextual",
-                    confidence_contribution=boost_value
-                )
-                return boost_value, citation
+    if mention_email_domain is not None and mention_email_domain == entity_email_domain:
+        citation = Citation(
+            source="Custom",
+            method="email_domain_match",
+            component="contextual",
+            confidence_contribution=boost_value
+        )
+        return boost_value, citation
     
     return 0.0, None
 
 
+def domain_consistency_boost(
+    mention_metadata: Dict,
+    entity_metadata: Dict,
+    boost_value: float = 0.2
+) -> Tuple[float, Optional[Citation]]:
+    """
+    Boost if domain/website/email matches.
+    
+    Args:
+        mention_metadata: Mention metadata
+        entity_metadata: Entity metadata
+        boost_value: Boost to apply on match
+    
+    Returns:
+        Tuple of (boost, citation)
+    """
+    return domain_consistency_boost_fast(
+        domain_key(mention_metadata),
+        domain_key(entity_metadata),
+        boost_value
+    )
+
+
 def shared_context_boost(
     mention_metadata: Dict,
     entity_metadata: Dict,
@@ -112,14 +161,32 @@ def shared_context_boost(
     Returns:
         Total boost
     """
-    boost = 0.0
-    shared_fields = ['industry', 'location', 'category', 'type']
+    return shared_context_boost_fast(
+        context_key(mention_metadata),
+        context_key(entity_metadata),
+        boost_value
+    )
+
+
+def shared_context_boost_fast(
+    mention_key: Tuple[str, ...],
+    entity_key: Tuple[str, ...],
+    boost_value: float = 0.1
+) -> float:
+    """
+    shared_context_boost on precomputed context_key() tuples.
     
-    for field in shared_fields:
-        mention_value = mention_metadata.get(field, '').lower()
-        entity_value = entity_metadata.get(field, '').lower()
-        
-        if mention_value and entity_value and mention_value == entity_value:
+    Args:
+        mention_key: context_key(mention metadata)
+        entity_key: context_key(entity metadata)
+        boost_value: Boost per matching field
+    
+    Returns:
+        Total boost
+    """
+    boost = 0.0
+    for mention_value, entity_value in zip(mention_key, entity_key):
+        if mention_value and mention_value == entity_value:
             boost += boost_value
     
     return min(boost, boost_value * 2)  # Cap at 2x boost
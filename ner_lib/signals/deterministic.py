@@ -1,11 +1,15 @@
 """Deterministic matching signals."""
 
-from typing import Dict, List, Optional, Set
+from collections import defaultdict
+import sys
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
 import spacy
 from spacy.matcher import PhraseMatcher
 from flashtext import KeywordProcessor
 
 from ner_lib.models.candidate import Citation
+from ner_lib.models.entity import Entity
 from ner_lib.normalization.text import normalize_entity_name
 
 
@@ -35,20 +39,53 @@ class ExactMatcher:
                 normalized_alias = normalize_entity_name(alias)
                 self.entity_map[normalized_alias] = entity_id
     
+    def clear(self):
+        """Remove all entities from the matcher."""
+        self.entity_map.clear()
+    
+    def add_batch(self, entities: Iterable[Entity]):
+        """
+        Add many entities in one pass.
+        
+        Equivalent to calling add_entity for each entity in order.
+        
+        Args:
+            entities: Entities to index
+        """
+        entity_map = self.entity_map
+        for entity in entities:
+            entity_id = entity.id
+            entity_map[normalize_entity_name(entity.canonical_name)] = entity_id
+            for alias in entity.aliases:
+                entity_map[normalize_entity_name(alias)] = entity_id
+    
     def match(self, mention: str) -> Optional[tuple[str, Citation]]:
         """
         Check for exact match.
         
         Args:
-            mention: Normalized mention text
+            mention: Mention text (normalized before lookup)
         
         Returns:
             Tuple of (entity_id, citation) if match found, None otherwise
         """
-        normalized = normalize_entity_name(mention)
+        return self.match_normalized(normalize_entity_name(mention))
+    
+    def match_normalized(self, normalized: str) -> Optional[tuple[str, Citation]]:
+        """
+        Check for exact match of already-normalized text.
         
-        if normalized in self.entity_map:
-            entity_id = self.entity_map[normalized]
+        Use with Mention.normalized_text to skip normalizing twice.
+        
+        Args:
+            normalized: Output of normalize_entity_name
+        
+        Returns:
+            Tuple of (entity_id, citation) if match found, None otherwise
+        """
+        entity_id = self.entity_map.get(normalized)
+        
+        if entity_id is not None:
             citation = Citation(
                 source="Custom",
                 method="exact_normalized_match",
@@ -60,21 +97,32 @@ class ExactMatcher:
         return None
 
 
+# Pipeline components PhraseMatcherLookup never needs
+_NON_TOKENIZER_PIPES = ["tok2vec", "tagger", "parser", "ner", "lemmatizer", "attribute_ruler", "senter"]
+
+
 class PhraseMatcherLookup:
     """spaCy PhraseMatcher for fast multi-alias lookup."""
     
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    def __init__(self, model_name: Optional[str] = None):
         """
         Initialize PhraseMatcher.
         
+        LOWER matching only needs a tokenizer, so a blank English pipeline
+        is used unless a model is requested explicitly.
+        
         Args:
-            model_name: spaCy model name
+            model_name: Optional spaCy model whose tokenizer to use (loaded
+                without its tagger/parser/NER components)
         """
-        try:
-            self.nlp = spacy.load(model_name)
-        except OSError:
-            # Model not found, create blank
+        if model_name is None:
             self.nlp = spacy.blank("en")
+        else:
+            try:
+                self.nlp = spacy.load(model_name, exclude=_NON_TOKENIZER_PIPES)
+            except OSError:
+                # Model not found, create blank
+                self.nlp = spacy.blank("en")
         
         self.matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
         self.entity_map: Dict[str, str] = {}  # pattern_id -> entity_id
@@ -101,6 +149,22 @@ class PhraseMatcherLookup:
         self.matcher.add(pattern_id, patterns)
         self.entity_map[pattern_id] = entity_id
     
+    def add_batch(self, entities: Iterable[Entity]):
+        """
+        Add many entities, tokenizing all names in one batch.
+        
+        Args:
+            entities: Entities to index
+        """
+        entities = list(entities)
+        names = [[entity.canonical_name, *entity.aliases] for entity in entities]
+        docs = iter(self.nlp.tokenizer.pipe(name for group in names for name in group))
+        
+        for entity, group in zip(entities, names):
+            pattern_id = f"entity_{entity.id}"
+            self.matcher.add(pattern_id, [next(docs) for _ in group])
+            self.entity_map[pattern_id] = entity.id
+    
     def match(self, mention: str) -> Optional[tuple[str, Citation]]:
         """
         Find exact phrase match.
@@ -111,7 +175,27 @@ class PhraseMatcherLookup:
         Returns:
             Tuple of (entity_id, citation) if match found, None otherwise
         """
-        doc = self.nlp(mention)
+        # LOWER matching only needs tokens, not the tagger/parser/NER pipes
+        return self._match_doc(self.nlp.make_doc(mention))
+    
+    def match_batch(self, mentions: Iterable[str], batch_size: int = 256) -> List[Optional[tuple[str, Citation]]]:
+        """
+        Find exact phrase matches for many mentions.
+        
+        Args:
+            mentions: Mention texts
+            batch_size: Tokenizer batch size
+        
+        Returns:
+            One match() result per mention, in order
+        """
+        return [
+            self._match_doc(doc)
+            for doc in self.nlp.tokenizer.pipe(mentions, batch_size=batch_size)
+        ]
+    
+    def _match_doc(self, doc) -> Optional[tuple[str, Citation]]:
+        """Run the PhraseMatcher on a tokenized mention."""
         matches = self.matcher(doc)
         
         if matches:
@@ -142,26 +226,38 @@ class FlashTextLookup:
         """
         self.processor = KeywordProcessor(case_sensitive=case_sensitive)
         self.entity_map: Dict[str, str] = {}  # keyword -> entity_id
+        self._pending: Dict[str, List[str]] = defaultdict(list)  # entity_id -> keywords not yet in the trie
     
     def add_entity(self, entity_id: str, canonical_name: str, aliases: List[str] = None):
         """
         Add entity with aliases.
         
+        Keywords are buffered and inserted into the trie by finalize(),
+        which match() calls automatically.
+        
         Args:
             entity_id: Entity ID
             canonical_name: Canonical name
             aliases: Optional list of aliases
         """
+        pending = self._pending[entity_id]
+        
         # Add canonical name
-        self.processor.add_keyword(canonical_name, entity_id)
+        pending.append(canonical_name)
         self.entity_map[canonical_name] = entity_id
         
         # Add aliases
         if aliases:
             for alias in aliases:
-                self.processor.add_keyword(alias, entity_id)
+                pending.append(alias)
                 self.entity_map[alias] = entity_id
     
+    def finalize(self):
+        """Insert all buffered keywords into the trie in one pass."""
+        if self._pending:
+            self.processor.add_keywords_from_dict(self._pending)
+            self._pending = defaultdict(list)
+    
     def match(self, mention: str) -> Optional[tuple[str, Citation]]:
         """
         Find exact keyword match.
@@ -172,6 +268,7 @@ class FlashTextLookup:
         Returns:
             Tuple of (entity_id, citation) if match found, None otherwise
         """
+        self.finalize()
         keywords_found = self.processor.extract_keywords(mention, span_info=False)
         
         if keywords_found:
@@ -187,6 +284,11 @@ class FlashTextLookup:
         return None
 
 
+def _domain_key(domain: str) -> str:
+    """Normalized, interned dict key for a domain."""
+    return sys.intern(domain.strip().lower())
+
+
 class DomainMatcher:
     """Match entities by domain/website/email."""
     
@@ -209,19 +311,18 @@ class DomainMatcher:
         email = metadata.get('email')
         
         if domain:
-            self.domain_map[domain.lower()] = entity_id
+            self.domain_map[_domain_key(domain)] = entity_id
         
         if website:
             # Extract domain from URL
             domain = self._extract_domain(website)
             if domain:
-                self.domain_map[domain] = entity_id
+                self.domain_map[sys.intern(domain)] = entity_id
         
         if email:
             # Extract domain from email
             if '@' in email:
-                domain = email.split('@')[1].lower()
-                self.email_map[domain] = entity_id
+                self.email_map[_domain_key(email.split('@')[1])] = entity_id
     
     def match(self, mention: str, metadata: Dict) -> Optional[tuple[str, Citation]]:
         """
@@ -236,8 +337,8 @@ class DomainMatcher:
         """
         # Check domain
         domain = metadata.get('domain')
-        if domain and domain.lower() in self.domain_map:
-            entity_id = self.domain_map[domain.lower()]
+        entity_id = self.domain_map.get(_domain_key(domain)) if domain else None
+        if entity_id is not None:
             citation = Citation(
                 source="Custom",
                 method="domain_match",
@@ -249,9 +350,8 @@ class DomainMatcher:
         # Check email
         email = metadata.get('email')
         if email and '@' in email:
-            email_domain = email.split('@')[1].lower()
-            if email_domain in self.email_map:
-                entity_id = self.email_map[email_domain]
+            entity_id = self.email_map.get(_domain_key(email.split('@')[1]))
+            if entity_id is not None:
                 citation = Citation(
                     source="Custom",
                     method="email_domain_match",
@@ -264,10 +364,11 @@ class DomainMatcher:
     
     @staticmethod
     def _extract_domain(url: str) -> Optional[str]:
-        """Extract domain from URL."""
-        import re
-        # Simple domain extraction
-        match = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', url)
-        if match:
-            return match.group(1).lower()
-        return None
+        """Extract domain from URL (scheme optional, 'www.' and port dropped)."""
+        try:
+            host = urlsplit(url if '://' in url else '//' + url).hostname
+        except ValueError:
+            return None
+        if not host:
+            return None
+        return host.removeprefix('www.') or None
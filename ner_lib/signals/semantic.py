@@ -1,11 +1,20 @@
 """Semantic similarity using SentenceTransformers."""
 
 from typing import List, Optional, Tuple
+import logging
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
 from ner_lib.models.candidate import Citation
 
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingModel:
     """Wrapper for SentenceTransformer embedding model."""
@@ -13,7 +22,12 @@ class EmbeddingModel:
     def __init__(
         self,
         model_name: str = "all-MiniLM-L6-v2",
-        device: str = "cpu"
+        device: str = "cpu",
+        backend: str = "torch",
+        precision: str = "fp32",
+        batch_size: int = 64,
+        normalize: bool = False,
+        model_file: Optional[str] = None
     ):
         """
         Initialize embedding model.
@@ -21,9 +35,27 @@ class EmbeddingModel:
         Args:
             model_name: SentenceTransformer model name
             device: 'cpu' or 'cuda'
+            backend: 'torch', 'onnx' (ONNX Runtime) or 'openvino'; the
+                latter two need sentence-transformers>=3.2 with the
+                matching optimum extra, and fall back to torch if loading fails
+            precision: 'fp32' or 'fp16'; fp16 halves weights on CUDA
+            batch_size: Default batch size for encode()
+            normalize: Return unit-normalized embeddings, so cosine
+                similarity is a plain dot product (off by default, so
+                encode() returns the model's raw embeddings)
+            model_file: Exported model file for the onnx/openvino backends,
+                e.g. 'onnx/model_O3.onnx' or 'onnx/model_qint8_avx512_vnni.onnx'
         """
+        if backend not in ("torch", "onnx", "openvino"):
+            raise ValueError(f"Unknown embedding backend: {backend}")
+        
         self.model_name = model_name
         self.device = device
+        self.backend = backend
+        self.precision = precision
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self.model_file = model_file
         self._model: Optional[SentenceTransformer] = None
         self._embedding_dim: Optional[int] = None
     
@@ -31,11 +63,37 @@ class EmbeddingModel:
     def model(self) -> SentenceTransformer:
         """Lazy load the model."""
         if self._model is None:
-            self._model = SentenceTransformer(self.model_name, device=self.device)
+            if self.backend != "torch":
+                try:
+                    self._model = self._load_exported()
+                except (ImportError, TypeError, ValueError, OSError) as e:
+                    logger.warning(f"{self.backend} backend unavailable ({e}); falling back to torch")
+                    self.backend = "torch"
+            
+            if self.backend == "torch":
+                self._model = SentenceTransformer(self.model_name, device=self.device)
+                if self.precision == "fp16" and self.device.startswith("cuda"):
+                    self._model.half()
+            
             # Get embedding dimension
             self._embedding_dim = self._model.get_sentence_embedding_dimension()
         return self._model
     
+    def _load_exported(self) -> SentenceTransformer:
+        """Load the model on the ONNX Runtime or OpenVINO backend."""
+        model_kwargs = {}
+        if self.model_file:
+            model_kwargs["file_name"] = self.model_file
+        if self.backend == "onnx" and self.device.startswith("cuda"):
+            model_kwargs["provider"] = "CUDAExecutionProvider"
+        
+        return SentenceTransformer(
+            self.model_name,
+            device=self.device,
+            backend=self.backend,
+            model_kwargs=model_kwargs
+        )
+    
     @property
     def embedding_dim(self) -> int:
         """Get embedding dimension."""
@@ -46,15 +104,18 @@ class EmbeddingModel:
     def encode(
         self,
         texts: List[str] | str,
-        batch_size: int = 32,
+        batch_size: Optional[int] = None,
         show_progress: bool = False
     ) -> np.ndarray:
         """
         Generate embeddings for texts.
         
+        Prefer passing a list: one batched call is much cheaper than many
+        single-text calls.
+        
         Args:
             texts: Single text or list of texts
-            batch_size: Batch size for encoding
+            batch_size: Batch size for encoding (defaults to self.batch_size)
             show_progress: Whether to show progress bar
         
         Returns:
@@ -68,10 +129,11 @@ class EmbeddingModel:
         
         embeddings = self.model.encode(
             texts,
-            batch_size=batch_size,
+            batch_size=batch_size or self.batch_size,
             show_progress_bar=show_progress,
-            convert_to_numpy=True
-        )
+            convert_to_numpy=True,
+            normalize_embeddings=self.normalize
+        ).astype(np.float32, copy=False)
         
         if return_single:
             return embeddings[0]
@@ -91,6 +153,17 @@ def cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
     
     Citation: SentenceTransformers
     """
+    if SIMSIMD_AVAILABLE:
+        embedding1 = np.ascontiguousarray(embedding1, dtype=np.float32)
+        embedding2 = np.ascontiguousarray(embedding2, dtype=np.float32)
+        # simsimd reports a zero vector as distance 1 (score 0.5), so
+        # return the NumPy path's 0.0 for it first
+        if not embedding1.any() or not embedding2.any():
+            return 0.0
+        # Fused SIMD dot + norms; returns cosine distance
+        similarity = 1.0 - simsimd.cosine(embedding1, embedding2)
+        return min(1.0, max(0.0, (similarity + 1.0) / 2.0))
+    
     # Normalize vectors
     norm1 = np.linalg.norm(embedding1)
     norm2 = np.linalg.norm(embedding2)
@@ -108,6 +181,37 @@ def cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
     return float(np.clip(similarity, 0.0, 1.0))
 
 
+def cosine_similarity_raw(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+    """
+    Cosine similarity of two unit-normalized embeddings, in [-1, 1].
+    
+    No norms, zero check or rescale: it is a plain dot product, which
+    ranks candidates the same as cosine_similarity. Apply
+    rescale_cosine() once to the score that is kept.
+    
+    Args:
+        embedding1: First unit-normalized embedding
+        embedding2: Second unit-normalized embedding
+    
+    Returns:
+        Raw cosine similarity
+    """
+    return float(np.inner(embedding1, embedding2))
+
+
+def rescale_cosine(similarity: float) -> float:
+    """
+    Map a raw cosine from [-1, 1] to the [0, 1] score used by the signals.
+    
+    Args:
+        similarity: Raw cosine similarity
+    
+    Returns:
+        Similarity score 0-1
+    """
+    return min(1.0, max(0.0, (similarity + 1.0) / 2.0))
+
+
 def batch_cosine_similarity(
     query_embedding: np.ndarray,
     candidate_embeddings: np.ndarray
@@ -123,20 +227,109 @@ def batch_cosine_similarity(
         Similarity scores of shape (n,)
     """
     # Normalize query
-    query_norm = query_embedding / np.linalg.norm(query_embedding)
+    query_unit = query_embedding / np.linalg.norm(query_embedding)
     
-    # Normalize candidates
-    candidate_norms = candidate_embeddings / np.linalg.norm(
-        candidate_embeddings, axis=1, keepdims=True
-    )
+    # Divide the dot products by the row norms instead of normalizing the
+    # candidate matrix, so no (n, embedding_dim) temporary is created
+    similarities = candidate_embeddings @ query_unit
+    similarities /= np.sqrt(np.einsum('ij,ij->i', candidate_embeddings, candidate_embeddings))
+    
+    return _rescale_cosine_inplace(similarities)
+
+
+# Rows of a float16 candidate matrix widened to float32 at a time
+_FP16_BLOCK_ROWS = 4096
+
+
+def batch_cosine_similarity_prenormed(
+    query_unit: np.ndarray,
+    candidate_units: np.ndarray
+) -> np.ndarray:
+    """
+    Cosine similarity for unit-normalized embeddings.
     
-    # Compute dot products
-    similarities = np.dot(candidate_norms, query_norm)
+    Use this when the candidate matrix is normalized once up front (e.g.
+    encoded with normalize=True) and scored against many queries; the only
+    pass over the matrix is one matrix-vector product (BLAS gemv).
     
-    # Convert from [-1, 1] to [0, 1]
-    similarities = (similarities + 1.0) / 2.0
+    A float16 candidate matrix halves the bytes read per query. It is
+    widened to float32 in blocks, so the products accumulate in float32
+    without materializing a full float32 copy.
+    
+    Args:
+        query_unit: Unit-normalized query of shape (embedding_dim,)
+        candidate_units: Unit-normalized candidates of shape (n, embedding_dim)
+    
+    Returns:
+        Similarity scores of shape (n,), rescaled to [0, 1]
+    """
+    if candidate_units.dtype != np.float16:
+        return _rescale_cosine_inplace(candidate_units @ query_unit)
+    
+    query_unit = np.asarray(query_unit, dtype=np.float32)
+    similarities = np.empty(len(candidate_units), dtype=np.float32)
+    for start in range(0, len(candidate_units), _FP16_BLOCK_ROWS):
+        block = candidate_units[start:start + _FP16_BLOCK_ROWS]
+        similarities[start:start + len(block)] = block.astype(np.float32) @ query_unit
+    return _rescale_cosine_inplace(similarities)
+
+
+def _rescale_cosine_inplace(similarities: np.ndarray) -> np.ndarray:
+    """Map cosines from [-1, 1] to [0, 1] in place."""
+    similarities += 1.0
+    similarities *= 0.5
+    return np.clip(similarities, 0.0, 1.0, out=similarities)
+
+
+def alias_centroid(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Mean of the unit-normalized embeddings of an entity's names.
+    
+    The centroid is deliberately not re-normalized: for a unit query u,
+    <u, mean(v_i / |v_i|)> equals mean(cos(u, v_i)), so one dot product
+    replaces one per alias.
+    
+    Args:
+        embeddings: (k, embedding_dim) embeddings of canonical name and aliases
+    
+    Returns:
+        Centroid of shape (embedding_dim,)
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return (embeddings / np.maximum(norms, 1e-12)).mean(axis=0)
+
+
+def semantic_similarity_to_entity(
+    mention_embedding: np.ndarray,
+    entity_embedding: np.ndarray,
+    pooling: str = "mean"
+) -> float:
+    """
+    Semantic similarity of a mention to all names of an entity.
+    
+    Args:
+        mention_embedding: Mention embedding of shape (embedding_dim,)
+        entity_embedding: alias_centroid() output for pooling='mean', or
+            (k, embedding_dim) alias embeddings for pooling='max'
+        pooling: 'mean' (mean cosine over names) or 'max' (best name)
+    
+    Returns:
+        Similarity score 0-1
+    """
+    if pooling not in ("mean", "max"):
+        raise ValueError(f"Unknown pooling '{pooling}'. Must be 'mean' or 'max'")
+    
+    # A zero embedding matches nothing, as in cosine_similarity
+    mention_norm = float(np.linalg.norm(mention_embedding))
+    if mention_norm == 0.0:
+        return 0.0
+    mention_unit = mention_embedding / mention_norm
     
-    return np.clip(similarities, 0.0, 1.0)
+    if pooling == "mean":
+        similarity = float(np.dot(mention_unit, entity_embedding))
+        return min(1.0, max(0.0, (similarity + 1.0) / 2.0))
+    return float(batch_cosine_similarity(mention_unit, np.atleast_2d(entity_embedding)).max())
 
 
 def semantic_similarity_score(
@@ -158,8 +351,11 @@ def semantic_similarity_score(
     # Generate embeddings
     embeddings = embedding_model.encode([mention, canonical_name])
     
-    # Compute similarity
-    score = cosine_similarity(embeddings[0], embeddings[1])
+    # Compute similarity (a dot product when the model returns unit vectors)
+    if getattr(embedding_model, "normalize", False):
+        score = rescale_cosine(cosine_similarity_raw(embeddings[0], embeddings[1]))
+    else:
+        score = cosine_similarity(embeddings[0], embeddings[1])
     
     # Create citation
     citation = Citation(
@@ -1,29 +1,137 @@
-"""String similarity signals using RapidFuzz and jellyfish."""
+"""String similarity signals using RapidFuzz."""
 
-from typing import Dict
-from rapidfuzz import fuzz
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Optional, Sequence, Union
+import numpy as np
+from rapidfuzz import fuzz, process
 from rapidfuzz.distance import Levenshtein, JaroWinkler
 
 from ner_lib.models.candidate import Citation
 
 
-def token_set_ratio(text1: str, text2: str) -> float:
+class FuzzyKey(NamedTuple):
+    """A text with its whitespace tokens precomputed for repeated fuzzy scoring."""
+    
+    text: str
+    tokens: FrozenSet[str]
+
+
+def fuzzy_key(text: str) -> FuzzyKey:
+    """
+    Precompute the token set of a text that is scored many times.
+    
+    Args:
+        text: Text (usually a normalized name)
+    
+    Returns:
+        FuzzyKey accepted by token_set_ratio and combined_fuzzy_score
+    """
+    return FuzzyKey(text, frozenset(text.split()))
+
+
+# Shared citation templates (Citation is frozen)
+_CIT_TOKEN_SET = Citation("RapidFuzz", "token_set_ratio", "fuzzy_matching")
+_CIT_PARTIAL = Citation("RapidFuzz", "partial_ratio", "fuzzy_matching")
+_CIT_LEV = Citation("RapidFuzz", "levenshtein_similarity", "fuzzy_matching")
+_CIT_JW = Citation("RapidFuzz", "jaro_winkler", "fuzzy_matching")
+
+_DEFAULT_FUZZY_WEIGHTS = {
+    'token_set': 0.4,
+    'partial': 0.2,
+    'levenshtein': 0.2,
+    'jaro_winkler': 0.2,
+}
+
+
+def _token_set_shortcut(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> Optional[float]:
+    """Token set ratio when it follows from the sets alone (else None)."""
+    if not tokens1 or not tokens2:
+        return 0.0
+    # One token set contains the other (same rule as RapidFuzz)
+    if tokens1 <= tokens2 or tokens2 <= tokens1:
+        return 1.0
+    return None
+
+
+def token_set_ratio(text1: Union[str, FuzzyKey], text2: Union[str, FuzzyKey]) -> float:
     """
     Compute token set ratio using RapidFuzz.
     
-    Ignores word order and duplicates.
+    Ignores word order and duplicates. When both sides are FuzzyKeys, the
+    empty and subset cases are answered from the token sets without calling
+    RapidFuzz.
     
     Args:
-        text1: First text
-        text2: Second text
+        text1: First text or FuzzyKey
+        text2: Second text or FuzzyKey
     
     Returns:
         Similarity score 0-1
     
     Citation: RapidFuzz
     """
-    score = fuzz.token_set_ratio(text1, text2)
-    return score / 100.0  # Normalize to 0-1
+    if isinstance(text1, FuzzyKey) and isinstance(text2, FuzzyKey):
+        shortcut = _token_set_shortcut(text1.tokens, text2.tokens)
+        if shortcut is not None:
+            return shortcut
+    
+    if isinstance(text1, FuzzyKey):
+        text1 = text1.text
+    if isinstance(text2, FuzzyKey):
+        text2 = text2.text
+    
+    # The ratio is symmetric, so both argument orders share one cache entry
+    if text2 < text1:
+        text1, text2 = text2, text1
+    return _cached_token_set(text1, text2)
+
+
+@lru_cache(maxsize=4096)
+def _cached_token_set(text1: str, text2: str) -> float:
+    """RapidFuzz token set ratio 0-1, memoized for repeated pairs."""
+    return fuzz.token_set_ratio(text1, text2) / 100.0
+
+
+def clear_fuzzy_cache():
+    """Clear the memoized token set ratios (e.g. between test runs)."""
+    _cached_token_set.cache_clear()
+
+
+def token_set_ratio_batch(text: str, choices: Sequence[str], workers: int = 1) -> np.ndarray:
+    """
+    Token set ratio of one text against many, in a single RapidFuzz call.
+    
+    Args:
+        text: Query text
+        choices: Texts to compare against
+        workers: RapidFuzz worker threads (-1 for all cores; only pays off
+            for large choice lists)
+    
+    Returns:
+        float64 array of similarity scores 0-1, same values as token_set_ratio
+    
+    Citation: RapidFuzz
+    """
+    if not choices:
+        return np.zeros(0)
+    scores = process.cdist([text], choices, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers)[0]
+    return scores / 100.0
+
+
+def token_set_citation(score: float, weight: float = None) -> Citation:
+    """
+    Citation for a token set ratio, as produced by combined_fuzzy_score.
+    
+    Args:
+        score: token_set_ratio score 0-1
+        weight: Token set weight (defaults to combined_fuzzy_score's)
+    
+    Returns:
+        Citation
+    """
+    if weight is None:
+        weight = _DEFAULT_FUZZY_WEIGHTS['token_set']
+    return _CIT_TOKEN_SET.with_contribution(score * weight)
 
 
 def partial_ratio(text1: str, text2: str) -> float:
@@ -45,13 +153,15 @@ def partial_ratio(text1: str, text2: str) -> float:
     return score / 100.0
 
 
-def levenshtein_similarity(text1: str, text2: str) -> float:
+def levenshtein_similarity(text1: str, text2: str, score_cutoff: Optional[float] = None) -> float:
     """
     Compute normalized Levenshtein similarity.
     
     Args:
         text1: First text
         text2: Second text
+        score_cutoff: Optional minimum score 0-1; lower scores return 0.0
+            and let RapidFuzz stop early
     
     Returns:
         Similarity score 0-1
@@ -61,16 +171,12 @@ def levenshtein_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     
-    distance = Levenshtein.distance(text1, text2)
-    max_len = max(len(text1), len(text2))
-    
-    if max_len == 0:
-        return 1.0
-    
-    return 1.0 - (distance / max_len)
+    # ASCII str objects are already stored one byte per character and RapidFuzz
+    # reads them as such; encoding to bytes first only adds a copy
+    return Levenshtein.normalized_similarity(text1, text2, score_cutoff=score_cutoff)
 
 
-def jaro_winkler_similarity(text1: str, text2: str) -> float:
+def jaro_winkler_similarity(text1: str, text2: str, score_cutoff: Optional[float] = None) -> float:
     """
     Compute Jaro-Winkler similarity.
     
@@ -79,6 +185,8 @@ def jaro_winkler_similarity(text1: str, text2: str) -> float:
     Args:
         text1: First text
         text2: Second text
+        score_cutoff: Optional minimum score 0-1; lower scores return 0.0
+            and let RapidFuzz stop early
     
     Returns:
         Similarity score 0-1
@@ -88,79 +196,241 @@ def jaro_winkler_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     
-    return JaroWinkler.similarity(text1, text2) / 100.0
+    # rapidfuzz.distance scorers are already on a 0-1 scale
+    return JaroWinkler.normalized_similarity(text1, text2, score_cutoff=score_cutoff)
+
+
+def _metric_cutoff(min_score: Optional[float], accumulated: float, weight: float, rest: float) -> Optional[float]:
+    """
+    Smallest metric score that can still lift the weighted total to min_score.
+    
+    Args:
+        min_score: Target combined score (None disables the cutoff)
+        accumulated: Weighted score of the metrics computed so far
+        weight: Weight of the metric about to be computed
+        rest: Maximum weighted score of the metrics after it
+    
+    Returns:
+        score_cutoff for RapidFuzz, or None when any score could still count
+    """
+    if min_score is None or weight <= 0:
+        return None
+    cutoff = (min_score - accumulated - rest) / weight
+    if cutoff <= 0:
+        return None
+    return min(cutoff, 1.0)
 
 
 def combined_fuzzy_score(
-    text1: str,
-    text2: str,
-    weights: Dict[str, float] = None
-) -> tuple[float, list[Citation]]:
+    text1: Union[str, FuzzyKey, "PreparedQuery"],
+    text2: Union[str, FuzzyKey],
+    weights: Dict[str, float] = None,
+    token_set_floor: Optional[float] = None,
+    min_score: Optional[float] = None,
+    return_citations: bool = True
+) -> tuple[float, Dict[str, Citation]]:
     """
     Compute combined fuzzy similarity score.
     
+    The cheap token set and partial ratios are computed first. The
+    Levenshtein and Jaro-Winkler edit similarities are skipped (scored 0.0)
+    when the token set ratio is below token_set_floor, and are given a
+    RapidFuzz score_cutoff when min_score is set, so a metric that can no
+    longer lift the total to min_score is scored 0.0. Totals below
+    min_score are then lower bounds.
+    
     Args:
-        text1: First text
-        text2: Second text
+        text1: First text, or its FuzzyKey / PreparedQuery when scored repeatedly
+        text2: Second text, or its FuzzyKey when scored repeatedly
         weights: Optional weights for each metric
+        token_set_floor: Optional token set ratio below which the edit
+            similarities are skipped
+        min_score: Optional combined score the caller is looking for
+        return_citations: Build the per-metric citations (an empty dict is
+            returned otherwise)
     
     Returns:
-        Tuple of (combined_score, citations)
+        Tuple of (combined_score, citations keyed by method)
     """
     if weights is None:
-        weights = {
-            'token_set': 0.4,
-            'partial': 0.2,
-            'levenshtein': 0.2,
-            'jaro_winkler': 0.2,
-        }
+        weights = _DEFAULT_FUZZY_WEIGHTS
+    
+    w_ts, w_pa, w_lv, w_jw = (
+        weights['token_set'], weights['partial'], weights['levenshtein'], weights['jaro_winkler']
+    )
     
-    citations = []
+    if isinstance(text1, PreparedQuery):
+        text1 = text1.key
     
-    # Compute individual scores
+    # Compute individual (weighted) scores
     token_set_score = token_set_ratio(text1, text2)
-    partial_score = partial_ratio(text1, text2)
-    lev_score = levenshtein_similarity(text1, text2)
-    jw_score = jaro_winkler_similarity(text1, text2)
-    
-    # Create citations
-    citations.append(Citation(
-        source="RapidFuzz",
-        method="token_set_ratio",
-        component="fuzzy_matching",
-        confidence_contribution=token_set_score * weights['token_set']
-    ))
-    
-    citations.append(Citation(
-        source="RapidFuzz",
-        method="partial_ratio",
-        component="fuzzy_matching",
-        confidence_contribution=partial_score * weights['partial']
-    ))
-    
-    citations.append(Citation(
-        source="RapidFuzz",
-        method="levenshtein_similarity",
-        component="fuzzy_matching",
-        confidence_contribution=lev_score * weights['levenshtein']
-    ))
-    
-    citations.append(Citation(
-        source="RapidFuzz",
-        method="jaro_winkler",
-        component="fuzzy_matching",
-        confidence_contribution=jw_score * weights['jaro_winkler']
-    ))
+    ts_w = token_set_score * w_ts
+    if isinstance(text1, FuzzyKey):
+        text1 = text1.text
+    if isinstance(text2, FuzzyKey):
+        text2 = text2.text
+    pa_w = partial_ratio(text1, text2) * w_pa
+    
+    lv_w = jw_w = 0.0
+    if token_set_floor is None or token_set_score >= token_set_floor:
+        lv_w = levenshtein_similarity(
+            text1, text2, score_cutoff=_metric_cutoff(min_score, ts_w + pa_w, w_lv, w_jw)
+        ) * w_lv
+        jw_w = jaro_winkler_similarity(
+            text1, text2, score_cutoff=_metric_cutoff(min_score, ts_w + pa_w + lv_w, w_jw, 0.0)
+        ) * w_jw
     
     # Weighted combination
+    combined = ts_w + pa_w + lv_w + jw_w
+    
+    if not return_citations:
+        return combined, {}
+    
+    citations = {
+        "token_set_ratio": _CIT_TOKEN_SET.with_contribution(ts_w),
+        "partial_ratio": _CIT_PARTIAL.with_contribution(pa_w),
+        "levenshtein_similarity": _CIT_LEV.with_contribution(lv_w),
+        "jaro_winkler": _CIT_JW.with_contribution(jw_w),
+    }
+    
+    return combined, citations
+
+
+def combined_fuzzy_score_batch(
+    query: str,
+    choices: Sequence[str],
+    weights: Dict[str, float] = None,
+    workers: int = 1
+) -> tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Combined fuzzy similarity of one text against many.
+    
+    Each metric is computed for all choices in one RapidFuzz cdist call
+    instead of four calls per pair.
+    
+    Args:
+        query: Query text
+        choices: Texts to compare against
+        weights: Optional weights for each metric (as in combined_fuzzy_score)
+        workers: RapidFuzz worker threads (-1 for all cores)
+    
+    Returns:
+        Tuple of (combined scores, per-metric score arrays keyed by weight
+        name), all float64 arrays with the same values as combined_fuzzy_score
+    
+    Citation: RapidFuzz
+    """
+    if weights is None:
+        weights = _DEFAULT_FUZZY_WEIGHTS
+    
+    if not choices:
+        empty = np.zeros(0)
+        return empty, {name: empty for name in weights}
+    
+    def cdist(scorer) -> np.ndarray:
+        return process.cdist([query], choices, scorer=scorer, dtype=np.float64, workers=workers)[0]
+    
+    scores = {
+        'token_set': cdist(fuzz.token_set_ratio) / 100.0,
+        'partial': cdist(fuzz.partial_ratio) / 100.0,
+        'levenshtein': cdist(Levenshtein.normalized_similarity),
+        'jaro_winkler': cdist(JaroWinkler.normalized_similarity),
+    }
+    
+    # Edit similarities of empty strings are 0.0, as in the pairwise helpers
+    if not query:
+        scores['levenshtein'][:] = 0.0
+        scores['jaro_winkler'][:] = 0.0
+    else:
+        empty = np.fromiter((not choice for choice in choices), dtype=bool, count=len(choices))
+        scores['levenshtein'][empty] = 0.0
+        scores['jaro_winkler'][empty] = 0.0
+    
     combined = (
-        token_set_score * weights['token_set'] +
-        partial_score * weights['partial'] +
-        lev_score * weights['levenshtein'] +
-        jw_score * weights['jaro_winkler']
+        scores['token_set'] * weights['token_set'] +
+        scores['partial'] * weights['partial'] +
+        scores['levenshtein'] * weights['levenshtein'] +
+        scores['jaro_winkler'] * weights['jaro_winkler']
     )
     
-    return combined, citations
+    return combined, scores
+
+
+def token_set_ratio_matrix(queries: Sequence[str], choices: Sequence[str], workers: int = -1) -> np.ndarray:
+    """
+    Token set ratio of every query against every choice, in one RapidFuzz call.
+    
+    Args:
+        queries: Query texts
+        choices: Texts to compare against
+        workers: RapidFuzz worker threads (-1 for all cores)
+    
+    Returns:
+        float64 (len(queries), len(choices)) matrix of scores 0-1, same
+        values as token_set_ratio
+    
+    Citation: RapidFuzz
+    """
+    if not queries or not choices:
+        return np.zeros((len(queries), len(choices)))
+    scores = process.cdist(queries, choices, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers)
+    scores /= 100.0
+    return scores
+
+
+class PreparedQuery:
+    """
+    A query text prepared once for scoring against many choices.
+    
+    RapidFuzz only caches a query's preprocessed (bit-parallel) form inside
+    its rapidfuzz.process functions, so all scoring here goes through
+    cdist: the query is preprocessed once per call rather than once per
+    choice.
+    """
+    
+    __slots__ = ('text', 'key')
+    
+    def __init__(self, text: str):
+        """
+        Prepare a query.
+        
+        Args:
+            text: Query text (usually a normalized mention)
+        """
+        self.text = text
+        self.key = fuzzy_key(text)
+    
+    def token_set_ratio(self, choices: Sequence[str], workers: int = 1) -> np.ndarray:
+        """
+        Token set ratio against many choices (see token_set_ratio_batch).
+        
+        Args:
+            choices: Texts to compare against
+            workers: RapidFuzz worker threads
+        
+        Returns:
+            float64 array of similarity scores 0-1
+        """
+        return token_set_ratio_batch(self.text, choices, workers=workers)
+    
+    def combined(
+        self,
+        choices: Sequence[str],
+        weights: Dict[str, float] = None,
+        workers: int = 1
+    ) -> tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Combined fuzzy score against many choices (see combined_fuzzy_score_batch).
+        
+        Args:
+            choices: Texts to compare against
+            weights: Optional weights for each metric
+            workers: RapidFuzz worker threads
+        
+        Returns:
+            Tuple of (combined scores, per-metric score arrays)
+        """
+        return combined_fuzzy_score_batch(self.text, choices, weights, workers=workers)
 
 
 def quick_fuzzy_score(text1: str, text2: str) -> float:
@@ -44,6 +44,14 @@ class StorageBackend(ABC):
         """Add alias for an entity."""
         pass
     
+    def normalized_names(self) -> List[str]:
+        """
+        Normalized canonical names, aligned with get_all_entities().
+        
+        Backends may return a cached list; callers must not modify it.
+        """
+        return [entity.normalized_name for entity in self.get_all_entities()]
+    
     @abstractmethod
     def get_entity_by_alias(self, alias_name: str) -> Optional[Entity]:
         """Find entity by alias name."""
@@ -58,3 +66,23 @@ class StorageBackend(ABC):
     def get_review_queue(self, status: str = "pending") -> List[SameCandidate]:
         """Get review queue items by status."""
         pass
+    
+    def move_review_item(self, review_item: SameCandidate, new_status: str):
+        """
+        Change the status of a saved review item.
+        
+        The default sets the status and saves the item again; backends that
+        index items by status should override it.
+        """
+        review_item.status = new_status
+        self.save_review_item(review_item)
+    
+    def clear(self):
+        """
+        Remove all entities and their aliases.
+        
+        The default deletes entities one by one; backends should override it
+        with a bulk operation (and also drop review items).
+        """
+        for entity in self.get_all_entities():
+            self.delete_entity(entity.id)
@@ -1,12 +1,27 @@
 """In-memory storage implementation."""
 
-from typing import Dict, List, Optional
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
 from ner_lib.storage.interface import StorageBackend
 from ner_lib.models.entity import Entity, Alias, Mention
 from ner_lib.models.candidate import SameCandidate
 from ner_lib.normalization.text import normalize_entity_name
 
 
+@lru_cache(maxsize=4096)
+def _norm(name: str) -> str:
+    """
+    Memoized, interned normalize_entity_name for alias keys and lookups.
+    
+    Stored keys and lookup keys are the same interned object, so alias_map
+    hits compare by identity.
+    """
+    return sys.intern(normalize_entity_name(name))
+
+
 class MemoryStorage(StorageBackend):
     """In-memory storage using Python dictionaries."""
     
@@ -15,7 +30,15 @@ class MemoryStorage(StorageBackend):
         self.entities: Dict[str, Entity] = {}
         self.aliases: Dict[str, List[Alias]] = {}  # entity_id -> List[Alias]
         self.alias_map: Dict[str, str] = {}  # normalized_alias -> entity_id
-        self.review_queue: List[SameCandidate] = []
+        self._entity_to_norms: Dict[str, Set[str]] = {}  # entity_id -> normalized aliases
+        self._alias_owners: Dict[str, List[str]] = {}  # normalized_alias -> entity_ids, latest last
+        self.review_queue_by_status: Dict[str, List[SameCandidate]] = defaultdict(list)
+        self._review_items: List[SameCandidate] = []  # every saved item, in save order
+        
+        # Normalized canonical names (in entity order), rebuilt lazily
+        # after entities change
+        self._names: List[str] = []
+        self._names_dirty = False
     
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get entity by ID."""
@@ -28,10 +51,10 @@ class MemoryStorage(StorageBackend):
     def create_entity(self, entity: Entity) -> str:
         """Create new entity."""
         self.entities[entity.id] = entity
+        self._names_dirty = True
         
         # Add to alias map
-        normalized = normalize_entity_name(entity.canonical_name)
-        self.alias_map[normalized] = entity.id
+        self._map_alias(_norm(entity.canonical_name), entity.id)
         
         # Add provided aliases
         if entity.aliases:
@@ -49,6 +72,7 @@ class MemoryStorage(StorageBackend):
         """Update existing entity."""
         if entity.id in self.entities:
             self.entities[entity.id] = entity
+            self._names_dirty = True
         else:
             raise ValueError(f"Entity {entity.id} not found")
     
@@ -56,17 +80,30 @@ class MemoryStorage(StorageBackend):
         """Delete entity."""
         if entity_id in self.entities:
             del self.entities[entity_id]
+            self._names_dirty = True
             
-            # Remove from alias map
-            self.alias_map = {
-                k: v for k, v in self.alias_map.items()
-                if v != entity_id
-            }
+            # Release this entity's aliases; a key shared with other
+            # entities falls back to the latest remaining owner
+            for normalized in self._entity_to_norms.pop(entity_id, ()):
+                owners = self._alias_owners[normalized]
+                owners.remove(entity_id)
+                if owners:
+                    self.alias_map[normalized] = owners[-1]
+                else:
+                    del self._alias_owners[normalized]
+                    del self.alias_map[normalized]
             
             # Remove aliases
             if entity_id in self.aliases:
                 del self.aliases[entity_id]
     
+    def normalized_names(self) -> List[str]:
+        """Normalized canonical names, aligned with get_all_entities() (cached)."""
+        if self._names_dirty:
+            self._names = [entity.normalized_name for entity in self.entities.values()]
+            self._names_dirty = False
+        return self._names
+    
     def get_aliases(self, entity_id: str) -> List[Alias]:
         """Get all aliases for an entity."""
         return self.aliases.get(entity_id, [])
@@ -83,30 +120,70 @@ class MemoryStorage(StorageBackend):
         self.aliases[alias.entity_id].append(alias)
         
         # Add to alias map
-        normalized = normalize_entity_name(alias.name)
-        self.alias_map[normalized] = alias.entity_id
+        self._map_alias(_norm(alias.name), alias.entity_id)
+    
+    def _map_alias(self, normalized: str, entity_id: str):
+        """Point a normalized alias at an entity and record it for deletes."""
+        self.alias_map[normalized] = entity_id
+        self._entity_to_norms.setdefault(entity_id, set()).add(normalized)
+        
+        owners = self._alias_owners.setdefault(normalized, [])
+        if entity_id in owners:
+            owners.remove(entity_id)
+        owners.append(entity_id)
     
     def get_entity_by_alias(self, alias_name: str) -> Optional[Entity]:
         """Find entity by alias name."""
-        normalized = normalize_entity_name(alias_name)
-        entity_id = self.alias_map.get(normalized)
+        entity_id = self.alias_map.get(_norm(alias_name))
         
         if entity_id:
             return self.entities.get(entity_id)
         
         return None
     
+    @property
+    def review_queue(self) -> List[SameCandidate]:
+        """All saved review items in save order (a copy; use move_review_item to change status)."""
+        return list(self._review_items)
+    
     def save_review_item(self, review_item: SameCandidate):
         """Save item to review queue."""
-        self.review_queue.append(review_item)
+        self.review_queue_by_status[review_item.status].append(review_item)
+        self._review_items.append(review_item)
     
     def get_review_queue(self, status: str = "pending") -> List[SameCandidate]:
         """Get review queue items by status."""
-        return [item for item in self.review_queue if item.status == status]
+        return list(self.review_queue_by_status.get(status, ()))
+    
+    def move_review_item(self, review_item: SameCandidate, new_status: str):
+        """
+        Change the status of a saved review item.
+        
+        Items are bucketed by status, so status changes must go through
+        this method rather than assigning review_item.status directly.
+        
+        Args:
+            review_item: Item previously passed to save_review_item
+            new_status: New status ('pending', 'approved', 'rejected')
+        """
+        bucket = self.review_queue_by_status[review_item.status]
+        for i, item in enumerate(bucket):
+            if item is review_item:
+                del bucket[i]
+                break
+        else:
+            raise ValueError("Review item not found in the review queue")
+        
+        review_item.status = new_status
+        self.review_queue_by_status[new_status].append(review_item)
     
     def clear(self):
         """Clear all data (useful for testing)."""
         self.entities.clear()
         self.aliases.clear()
         self.alias_map.clear()
-        self.review_queue.clear()
+        self._entity_to_norms.clear()
+        self._alias_owners.clear()
+        self.review_queue_by_status.clear()
+        self._review_items.clear()
+        self._names_dirty = True
@@ -1,17 +1,8 @@
 """Citation tracking for transparency."""
 
-from dataclasses import dataclass
 from typing import List
 
-
-@dataclass
-class Citation:
-    """Citation for a signal or method used."""
-    
-    source: str  # Library name
-    method: str  # Method/component name
-    component: str  # Signal component
-    confidence_contribution: float = 0.0
+from ner_lib.models.candidate import Citation
 
 
 class CitationTracker:
@@ -40,17 +31,18 @@ class CitationTracker:
         self.citations.clear()
 
 
-# Pre-defined citation templates
+# Pre-defined citation templates (Citation is frozen, so these are shared;
+# use .with_contribution() to attach a score)
 CITATIONS = {
-    "spacy_phrase_matcher": lambda: Citation("spaCy", "PhraseMatcher", "exact_lookup"),
-    "rapidfuzz_token_set": lambda: Citation("RapidFuzz", "token_set_ratio", "fuzzy_matching"),
-    "rapidfuzz_partial": lambda: Citation("RapidFuzz", "partial_ratio", "fuzzy_matching"),
-    "jellyfish_levenshtein": lambda: Citation("jellyfish", "levenshtein_distance", "string_similarity"),
-    "jellyfish_jaro_winkler": lambda: Citation("jellyfish", "jaro_winkler_similarity", "string_similarity"),
-    "sentence_transformers": lambda: Citation("SentenceTransformers", "embedding_cosine", "semantic_similarity"),
-    "faiss_ann": lambda: Citation("Faiss", "ANN_search", "candidate_generation"),
-    "hnswlib_ann": lambda: Citation("hnswlib", "ANN_search", "candidate_generation"),
-    "flashtext": lambda: Citation("FlashText", "KeywordProcessor", "exact_lookup"),
-    "custom_acronym": lambda: Citation("Custom", "acronym_detection", "string_similarity"),
-    "custom_normalization": lambda: Citation("Custom", "text_normalization", "preprocessing"),
+    "spacy_phrase_matcher": Citation("spaCy", "PhraseMatcher", "exact_lookup"),
+    "rapidfuzz_token_set": Citation("RapidFuzz", "token_set_ratio", "fuzzy_matching"),
+    "rapidfuzz_partial": Citation("RapidFuzz", "partial_ratio", "fuzzy_matching"),
+    "rapidfuzz_levenshtein": Citation("RapidFuzz", "levenshtein_similarity", "fuzzy_matching"),
+    "rapidfuzz_jaro_winkler": Citation("RapidFuzz", "jaro_winkler", "fuzzy_matching"),
+    "sentence_transformers": Citation("SentenceTransformers", "embedding_cosine", "semantic_similarity"),
+    "faiss_ann": Citation("Faiss", "ANN_search", "candidate_generation"),
+    "hnswlib_ann": Citation("hnswlib", "ANN_search", "candidate_generation"),
+    "flashtext": Citation("FlashText", "KeywordProcessor", "exact_lookup"),
+    "custom_acronym": Citation("Custom", "acronym_detection", "string_similarity"),
+    "custom_normalization": Citation("Custom", "text_normalization", "preprocessing"),
 }
@@ -42,11 +42,29 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.3.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.4.0",
             "isort>=5.12.0",
         ],
+        "serialization": [
+            "msgspec>=0.18.0",
+        ],
+        "speedups": [
+            "numba>=0.58.0",
+            "simsimd>=4.0.0",
+            "marisa-trie>=1.1.0",
+        ],
+        "onnx": [
+            "sentence-transformers[onnx]>=3.2.0",
+        ],
+        "openvino": [
+            "sentence-transformers[openvino]>=3.2.0",
+        ],
+        "gpu": [
+            "spacy[cuda12x,transformers]>=3.7.0",
+        ],
         "docs": [
             "sphinx>=7.0.0",
             "sphinx-rtd-theme>=1.3.0",
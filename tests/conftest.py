@@ -0,0 +1,64 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--gpu", action="store_true", default=False, help="run tests marked gpu")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--gpu"):
+        return
+    skip_gpu = pytest.mark.skip(reason="needs --gpu")
+    for item in items:
+        if "gpu" in item.keywords:
+            item.add_marker(skip_gpu)
+
+
+@pytest.fixture(scope="session")
+def nlp():
+    """
+    spaCy pipeline loaded once per test session.
+    
+    Under pytest-xdist every worker is its own session, so each worker
+    process loads the pipeline once.
+    """
+    from ner_lib.recognition.recognition import _get_nlp
+    
+    return _get_nlp()
+
+
+@pytest.fixture(scope="session")
+def _session_resolver():
+    from ner_lib import EntityResolver
+    
+    return EntityResolver(mode='A')
+
+
+@pytest.fixture
+def resolver(_session_resolver):
+    """Mode A resolver shared by the session, emptied for each test."""
+    _session_resolver.clear()
+    return _session_resolver
+
+
+@pytest.fixture(scope="session")
+def gpu_nlp():
+    """Transformer spaCy pipeline on the GPU, loaded once per test session."""
+    spacy = pytest.importorskip("spacy")
+    
+    spacy.require_gpu()
+    try:
+        return spacy.load("en_core_web_trf")
+    except OSError:
+        pytest.skip("en_core_web_trf is not installed")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def clear_alias_caches():
+    """Start each test module with empty alias / synonym caches."""
+    from ner_lib.aliases import clear_caches
+    
+    clear_caches()
+    yield
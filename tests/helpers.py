@@ -0,0 +1,24 @@
+"""Assertion helpers shared by the test modules."""
+
+import re
+from typing import Any, Dict, Iterable
+
+
+def assert_contains_any(entities: Iterable[Dict[str, Any]], keywords: Iterable[str]):
+    """
+    Assert that some entity text contains at least one of the keywords.
+    
+    The keywords are compiled into one regex alternation, so each entity
+    text is scanned once however many keywords there are.
+    
+    Args:
+        entities: Entity dicts as returned by recognize_entities()
+        keywords: Substrings to look for
+    """
+    keywords = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    texts = [entity['text'] for entity in entities]
+    
+    assert any(pattern.search(text) for text in texts), (
+        f"None of {keywords} found in entity texts {texts}"
+    )
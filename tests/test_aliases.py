@@ -65,5 +65,40 @@ def test_clear_caches():
     assert True
 
 
+def test_wordnet_synonyms_are_memoized():
+    """Test repeated synonym lookups hit the cache and return fresh lists."""
+    from ner_lib.aliases.alias_retrieval import _cached_synonyms
+    
+    clear_caches()
+    first = get_aliases("run", input_type="relationship")
+    first['aliases'].append("mutated")
+    second = get_aliases("run", input_type="relationship")
+    
+    assert _cached_synonyms.cache_info().hits == 1
+    assert "mutated" not in second['aliases']
+    
+    clear_caches()
+    assert _cached_synonyms.cache_info().currsize == 0
+
+
+def test_synonym_trie_lookup(tmp_path):
+    """Test synonyms served from a memory-mapped marisa-trie."""
+    marisa_trie = pytest.importorskip("marisa_trie")
+    from ner_lib.aliases.synonym_provider import SynonymProvider, _trie_key
+    
+    path = str(tmp_path / "synonyms.marisa")
+    marisa_trie.BytesTrie([
+        (_trie_key("rely on", "v"), "bank\trely on\ttrust".encode('utf-8')),
+        (_trie_key("Car", None), "auto\tcar".encode('utf-8')),
+    ]).save(path)
+    
+    provider = SynonymProvider(use_spacy_wordnet=False, trie_path=path)
+    
+    assert sorted(provider.get_synonyms("rely_on", pos_tag="VERB")) == ["bank", "rely on", "trust"]
+    assert provider.get_synonyms("car") == ["auto"]
+    if not provider.nltk_available:
+        assert provider.get_synonyms("unknownword") == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
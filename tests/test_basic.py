@@ -18,6 +18,13 @@ def test_normalization():
     assert normalize_entity_name("Meta Platforms, Inc.") == "meta platforms"
 
 
+def test_legal_suffixes_stripped_in_list_order():
+    """Test each legal suffix is stripped once, in suffix-list order."""
+    assert normalize_entity_name("Apple Inc. Ltd") == "apple inc"
+    assert normalize_entity_name("The Corp Company") == "the corp"
+    assert normalize_entity_name("Acme Ltd") == "acme"
+
+
 def test_acronym_generation():
     """Test acronym generation."""
     assert create_acronym("International Business Machines") == "IBM"
@@ -32,10 +39,8 @@ def test_token_containment():
     assert token_containment("microsoft corp", "microsoft") == True
 
 
-def test_mode_a_exact_match():
+def test_mode_a_exact_match(resolver):
     """Test Mode A with exact match."""
-    resolver = EntityResolver(mode='A')
-    
     # Add entity
     resolver.add_entity("Apple Inc.", aliases=["Apple", "AAPL"])
     
@@ -47,10 +52,8 @@ def test_mode_a_exact_match():
     assert result.next_steps == NextSteps.NONE
 
 
-def test_mode_a_alias_match():
+def test_mode_a_alias_match(resolver):
     """Test Mode A with alias match."""
-    resolver = EntityResolver(mode='A')
-    
     resolver.add_entity("Apple Inc.", aliases=["AAPL"])
     
     result = resolver.resolve("aapl")
@@ -59,10 +62,8 @@ def test_mode_a_alias_match():
     assert result.confidence == 1.0
 
 
-def test_mode_a_no_match():
+def test_mode_a_no_match(resolver):
     """Test Mode A with no match."""
-    resolver = EntityResolver(mode='A')
-    
     resolver.add_entity("Apple Inc.")
     
     result = resolver.resolve("microsoft")
@@ -70,6 +71,32 @@ def test_mode_a_no_match():
     assert result.next_steps == NextSteps.NEW_ENTITY
 
 
+def test_mode_a_acronym_threshold():
+    """Test the acronym step honours every acronym_score tier above high_acronym."""
+    from ner_lib.config import Config
+    
+    resolver = EntityResolver(mode='A')
+    ibm_id = resolver.add_entity("International Business Machines")
+    resolver.add_entity("Apple Computer")
+    
+    result = resolver.resolve("IBM")
+    assert result.matched_entity.id == ibm_id
+    assert result.confidence == resolver.config.thresholds.high_acronym
+    assert resolver.resolve("apple").confidence != resolver.config.thresholds.high_acronym
+    
+    config = Config()
+    config.thresholds.high_acronym = 0.8
+    resolver = EntityResolver(mode='A', config=config)
+    resolver.add_entity("International Business Machines")
+    apple_id = resolver.add_entity("Apple Computer")
+    
+    # "apple" is a token subset of "Apple Computer" (acronym_score 0.85)
+    result = resolver.resolve("apple")
+    assert result.matched_entity.id == apple_id
+    assert result.confidence == 0.8
+    assert result.citations[-1].method == "acronym_match"
+
+
 def test_mode_b_signal_aggregation():
     """Test Mode B with multiple signals."""
     resolver = EntityResolver(mode='B')
@@ -97,10 +124,50 @@ def test_mode_b_signal_aggregation():
     assert result.confidence > 0.7  # Should be high with exact match + domain boost
 
 
-def test_batch_resolution():
-    """Test batch resolution."""
-    resolver = EntityResolver(mode='A')
+def test_mode_a_semantic_confidence_is_monotonic():
+    """Test the ANN early exit and the semantic fallback report one scale."""
+    import numpy as np
+    pytest.importorskip("sentence_transformers")
+    from ner_lib.config import Config
+    from ner_lib.modes import ModeAResolver
+    from ner_lib.storage import MemoryStorage
+    
+    class FakeModel:
+        normalize = True
+        model_name = "fake"
+        
+        def __init__(self, cosine):
+            self.cosine = cosine
+        
+        def encode(self, texts):
+            if isinstance(texts, str):
+                return np.array([1.0, 0.0], dtype=np.float32)
+            return np.array([[1.0, 0.0], [self.cosine, np.sqrt(1 - self.cosine ** 2)]], dtype=np.float32)
+    
+    class FakeIndex:
+        def __init__(self, entity_id, cosine):
+            self.entity_id, self.cosine = entity_id, cosine
+        
+        def search(self, query, top_k):
+            return [self.entity_id], [self.cosine]
     
+    storage = MemoryStorage()
+    entity_id = storage.create_entity(Entity(canonical_name="Apple Inc."))
+    resolver = ModeAResolver(config=Config(), storage=storage)
+    
+    confidences = []
+    for cosine in [0.3, 0.5, 0.69, 0.71, 0.84, 0.86, 0.95]:
+        resolver.embedding_model = FakeModel(cosine)
+        resolver.ann_index = FakeIndex(entity_id, cosine)
+        result = resolver.resolve(Mention(text="zzz qqq"))
+        confidences.append(result.confidence if result.matched_entity else 0.0)
+    
+    assert confidences == sorted(confidences)
+    assert confidences[-1] == pytest.approx((0.95 + 1) / 2)
+
+
+def test_batch_resolution(resolver):
+    """Test batch resolution."""
     resolver.add_entity("Apple Inc.", aliases=["Apple"])
     resolver.add_entity("Microsoft Corporation", aliases=["Microsoft"])
     resolver.add_entity("IBM", aliases=["International Business Machines"])
@@ -115,10 +182,8 @@ def test_batch_resolution():
     assert results[2].matched_entity.canonical_name == "IBM"
 
 
-def test_add_and_retrieve_entity():
+def test_add_and_retrieve_entity(resolver):
     """Test entity storage."""
-    resolver = EntityResolver()
-    
     entity_id = resolver.add_entity(
         "Test Company",
         aliases=["TC"],
@@ -130,6 +195,434 @@ def test_add_and_retrieve_entity():
     assert entity.canonical_name == "Test Company"
     assert "TC" in entity.aliases
     assert entity.metadata["domain"] == "test.com"
+    
+    # Aliases may be any iterable, e.g. a generator
+    entity_id = resolver.add_entity("Other Company", aliases=(a for a in ["OC", "Other Co"]))
+    assert resolver.get_entity(entity_id).aliases == ["OC", "Other Co"]
+    assert resolver.resolve("other co").matched_entity.id == entity_id
+
+
+def test_delete_entity_aliases():
+    """Test deleting an entity releases its aliases to remaining owners."""
+    from ner_lib.storage import MemoryStorage
+    
+    storage = MemoryStorage()
+    apple = Entity(canonical_name="Apple Inc.", aliases=["AAPL"])
+    apple_two = Entity(canonical_name="Apple", aliases=["Apple Computer"])
+    storage.create_entity(apple)
+    storage.create_entity(apple_two)
+    
+    storage.delete_entity(apple.id)
+    assert storage.get_entity_by_alias("AAPL") is None
+    assert storage.get_entity_by_alias("Apple Inc.").id == apple_two.id
+    
+    # A shared key falls back to the entity that still has it
+    apple_three = Entity(canonical_name="Apple Corp")
+    storage.create_entity(apple_three)
+    assert storage.get_entity_by_alias("Apple").id == apple_three.id
+    storage.delete_entity(apple_three.id)
+    assert storage.get_entity_by_alias("Apple").id == apple_two.id
+
+
+def test_cached_entity_names():
+    """Test the cached normalized-name list follows entity changes."""
+    from ner_lib.storage import MemoryStorage
+    
+    storage = MemoryStorage()
+    apple = Entity(canonical_name="Apple Inc.")
+    storage.create_entity(apple)
+    storage.create_entity(Entity(canonical_name="Société Générale"))
+    
+    names = storage.normalized_names()
+    assert names == ["apple", "société générale"]
+    assert storage.normalized_names() is names
+    
+    storage.delete_entity(storage.get_all_entities()[1].id)
+    assert storage.normalized_names() == ["apple"]
+
+
+def test_review_queue_status_buckets():
+    """Test review items are listed by status and moved between statuses."""
+    from ner_lib.models.candidate import SameCandidate
+    from ner_lib.storage import MemoryStorage
+    
+    storage = MemoryStorage()
+    items = [SameCandidate(mention=Mention(text=f"Company {i}"), candidates=[]) for i in range(3)]
+    for item in items:
+        storage.save_review_item(item)
+    
+    storage.move_review_item(items[1], "approved")
+    assert storage.get_review_queue() == [items[0], items[2]]
+    assert storage.get_review_queue("approved") == [items[1]]
+    assert items[1].status == "approved"
+    assert storage.get_review_queue("rejected") == []
+    assert storage.review_queue == items
+
+
+def test_storage_backend_default_move_review_item():
+    """Test the StorageBackend fallback for moving a review item."""
+    from unittest.mock import Mock
+    from ner_lib.models.candidate import SameCandidate
+    from ner_lib.storage import StorageBackend
+    
+    backend = Mock()
+    item = SameCandidate(mention=Mention(text="Company"), candidates=[])
+    StorageBackend.move_review_item(backend, item, "approved")
+    
+    assert item.status == "approved"
+    backend.save_review_item.assert_called_once_with(item)
+
+
+def test_storage_backend_default_clear():
+    """Test the StorageBackend fallback for clearing all entities."""
+    from unittest.mock import Mock
+    from ner_lib.storage import StorageBackend
+    
+    entities = [Entity(canonical_name="Apple Inc."), Entity(canonical_name="IBM")]
+    backend = Mock()
+    backend.get_all_entities.return_value = entities
+    StorageBackend.clear(backend)
+    
+    assert [call.args[0] for call in backend.delete_entity.call_args_list] == [e.id for e in entities]
+
+
+def test_add_entity_after_resolve():
+    """Test entities added after resolving are indexed incrementally."""
+    resolver = EntityResolver(mode='B')
+    resolver.add_entity("Apple Inc.", aliases=["AAPL"])
+    assert resolver.resolve("aapl").matched_entity is not None
+    
+    msft_id = resolver.add_entity("Microsoft Corporation", aliases=["MSFT"])
+    result = resolver.resolve("msft")
+    
+    assert result.matched_entity is not None
+    assert result.matched_entity.id == msft_id
+    assert result.confidence == 1.0
+
+
+@pytest.mark.parametrize("mode", ["A", "B"])
+def test_resolver_clear(mode):
+    """Test a cleared resolver forgets every entity and can be reused."""
+    resolver = EntityResolver(mode=mode)
+    resolver.add_entity("Apple Inc.", aliases=["AAPL"])
+    assert resolver.resolve("aapl").matched_entity is not None
+    
+    resolver.clear()
+    assert resolver.get_all_entities() == []
+    assert resolver.resolve("aapl").matched_entity is None
+    
+    msft_id = resolver.add_entity("Microsoft Corporation", aliases=["MSFT"])
+    assert resolver.resolve("msft").matched_entity.id == msft_id
+    assert resolver.resolve("aapl").matched_entity is None
+
+
+def test_package_import_is_lazy():
+    """Test importing ner_lib defers spaCy / resolver imports to first use."""
+    import subprocess
+    import sys
+    
+    code = (
+        "import sys, ner_lib\n"
+        "assert 'spacy' not in sys.modules and 'ner_lib.resolver' not in sys.modules\n"
+        "assert ner_lib.EntityResolver.__module__ == 'ner_lib.resolver'\n"
+        "assert set(ner_lib.__all__) <= set(dir(ner_lib))\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_entity_times_are_epoch_nanoseconds():
+    """Test creation / last-seen times are int nanoseconds with datetime views."""
+    from datetime import datetime
+    
+    entity = Entity(canonical_name="Apple Inc.", last_seen=1_700_000_000 * 10**9)
+    
+    assert isinstance(entity.created_at, int)
+    assert isinstance(entity.created_at_dt, datetime)
+    assert entity.last_seen_dt == datetime.fromtimestamp(1_700_000_000)
+    assert Entity(canonical_name="Apple Inc.").last_seen_dt is None
+
+
+def test_entity_ids_unique():
+    """Test internal entity IDs are unique and UUIDs are opt-in."""
+    import uuid
+    
+    ids = {Entity(canonical_name=f"Company {i}").id for i in range(100)}
+    assert len(ids) == 100
+    
+    entity = Entity.with_uuid(canonical_name="External Co")
+    assert str(uuid.UUID(entity.id)) == entity.id
+
+
+def test_match_result_wire_roundtrip(resolver):
+    """Test MatchResult JSON serialization via msgspec."""
+    pytest.importorskip("msgspec")
+    from ner_lib.models.wire import encode_match_result, decode_match_result
+    
+    entity_id = resolver.add_entity("Apple Inc.", aliases=["AAPL"])
+    result = resolver.resolve("aapl")
+    
+    wire = decode_match_result(encode_match_result(result))
+    assert wire.entity_id == entity_id
+    assert wire.confidence == 1.0
+    assert wire.next_steps == "none"
+    assert wire.citations[0].method == "exact_normalized_match"
+
+
+def test_aggregate_rows_matches_aggregator():
+    """Test the batched scoring kernel against WeightedAggregator."""
+    import numpy as np
+    from ner_lib.models.candidate import Candidate
+    from ner_lib.scoring import WeightedAggregator, SignalTable
+    from ner_lib.scoring._kernels import SIGNAL_COLUMNS, aggregate_rows
+    
+    aggregator = WeightedAggregator()
+    weights = aggregator.weights
+    weight_vector = np.array([
+        weights.exact_match, weights.embedding_cosine, weights.token_set_ratio,
+        weights.acronym, weights.contextual_boost
+    ])
+    
+    rows = [
+        [1.0, 0.2, 0.3, 0.0, 0.0],
+        [0.0, 0.9, 0.8, 0.95, 0.5],
+        [0.0, 0.6, 0.4, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0, 0.0],
+    ]
+    scores = aggregate_rows(np.array(rows), weight_vector)
+    
+    candidates = []
+    for row, score in zip(rows, scores):
+        candidate = Candidate(entity_id="e")
+        for name, value in zip(SIGNAL_COLUMNS, row):
+            candidate.add_signal(name, value)
+        assert score == pytest.approx(aggregator.aggregate(candidate))
+        candidates.append(candidate)
+    
+    assert aggregator.aggregate_batch(candidates) == pytest.approx(scores)
+    
+    columns = np.array(rows).T
+    table = SignalTable(["e"] * len(rows), *columns)
+    assert aggregator.aggregate_table(table) == pytest.approx(scores)
+
+
+def test_fuzzy_key_matches_text():
+    """Test precomputed fuzzy keys score the same as plain text."""
+    from ner_lib.signals.string_similarity import combined_fuzzy_score, fuzzy_key
+    
+    pairs = [
+        ("apple", "apple"),
+        ("apple", "apple computer"),
+        ("micro soft", "microsoft"),
+        ("", "apple"),
+    ]
+    
+    for text1, text2 in pairs:
+        expected, _ = combined_fuzzy_score(text1, text2)
+        score, _ = combined_fuzzy_score(fuzzy_key(text1), fuzzy_key(text2))
+        assert score == expected
+
+
+def test_token_set_ratio_batch():
+    """Test the batched token set ratio against the scalar one."""
+    from ner_lib.signals.string_similarity import token_set_ratio, token_set_ratio_batch
+    
+    choices = ["apple", "apple computer", "microsoft", ""]
+    scores = token_set_ratio_batch("apple inc", choices)
+    
+    assert scores.tolist() == [token_set_ratio("apple inc", choice) for choice in choices]
+    assert len(token_set_ratio_batch("apple", [])) == 0
+
+
+def test_token_set_ratio_matrix():
+    """Test the mention x entity score matrix against the pairwise scores."""
+    from ner_lib.signals.string_similarity import token_set_ratio, token_set_ratio_matrix
+    
+    queries = ["apple inc", "", "bank"]
+    choices = ["apple", "apple computer", "", "bank of america"]
+    
+    token_set = token_set_ratio_matrix(queries, choices)
+    for i, query in enumerate(queries):
+        for j, choice in enumerate(choices):
+            assert token_set[i, j] == token_set_ratio(query, choice)
+
+
+def test_combined_fuzzy_score_cutoffs():
+    """Test combined_fuzzy_score's early-exit options."""
+    from ner_lib.signals.string_similarity import combined_fuzzy_score
+    
+    full, _ = combined_fuzzy_score("apple inc", "apple incorporated")
+    assert combined_fuzzy_score("apple inc", "apple incorporated", min_score=0.5)[0] == full
+    assert combined_fuzzy_score("apple inc", "apple incorporated", token_set_floor=0.3)[0] == full
+    
+    # Dissimilar pairs skip the edit similarities
+    score, citations = combined_fuzzy_score("apple", "zebra", token_set_floor=0.3)
+    assert citations["levenshtein_similarity"].confidence_contribution == 0.0
+    assert citations["jaro_winkler"].confidence_contribution == 0.0
+    assert score <= combined_fuzzy_score("apple", "zebra")[0] < 0.5
+    assert combined_fuzzy_score("apple", "zebra", min_score=0.9)[0] < 0.5
+
+
+def test_combined_fuzzy_score_batch():
+    """Test the batched combined fuzzy score against the pairwise one."""
+    from ner_lib.signals.string_similarity import combined_fuzzy_score, combined_fuzzy_score_batch
+    
+    choices = ["apple", "apple computer", "microsoft", ""]
+    scores, components = combined_fuzzy_score_batch("apple inc", choices)
+    
+    expected = [combined_fuzzy_score("apple inc", choice)[0] for choice in choices]
+    assert scores.tolist() == pytest.approx(expected)
+    assert set(components) == {"token_set", "partial", "levenshtein", "jaro_winkler"}
+
+
+def test_token_set_ratio_fuzzy_key_shortcuts():
+    """Test the token-set shortcuts for FuzzyKeys agree with RapidFuzz."""
+    from ner_lib.signals.string_similarity import fuzzy_key, token_set_ratio
+    
+    names = ["apple inc", "apple", "bank of america", "america bank corp", "international business machines", ""]
+    for text1 in names:
+        for text2 in names:
+            score = token_set_ratio(fuzzy_key(text1), fuzzy_key(text2))
+            assert score == pytest.approx(token_set_ratio(text1, text2))
+
+
+def test_edit_similarities_are_unit_scaled():
+    """Test Levenshtein and Jaro-Winkler similarities are on a 0-1 scale."""
+    from ner_lib.signals.string_similarity import levenshtein_similarity, jaro_winkler_similarity
+    
+    assert jaro_winkler_similarity("apple", "apple") == 1.0
+    assert jaro_winkler_similarity("martha", "marhta") == pytest.approx(0.9611, abs=1e-4)
+    assert levenshtein_similarity("kitten", "sitting") == pytest.approx(1 - 3 / 7)
+    
+    # Scores below the cutoff are reported as 0.0
+    assert jaro_winkler_similarity("apple", "zebra", score_cutoff=0.9) == 0.0
+    assert levenshtein_similarity("kitten", "sitting", score_cutoff=0.9) == 0.0
+
+
+@pytest.mark.parametrize("use_simsimd", [True, False])
+def test_cosine_similarity_zero_vector(monkeypatch, use_simsimd):
+    """Test a zero vector scores 0.0 with and without simsimd."""
+    import numpy as np
+    pytest.importorskip("sentence_transformers")
+    from ner_lib.signals import semantic
+    
+    if use_simsimd and not semantic.SIMSIMD_AVAILABLE:
+        pytest.skip("simsimd is not installed")
+    monkeypatch.setattr(semantic, "SIMSIMD_AVAILABLE", use_simsimd)
+    
+    vector = np.array([0.6, 0.8], dtype=np.float32)
+    zero = np.zeros(2, dtype=np.float32)
+    assert semantic.cosine_similarity(vector, zero) == 0.0
+    assert semantic.cosine_similarity(zero, vector) == 0.0
+    assert semantic.cosine_similarity(vector, vector) == pytest.approx(1.0)
+
+
+def test_batch_cosine_similarity_prenormed():
+    """Test the unit-normalized batch path matches batch_cosine_similarity."""
+    import numpy as np
+    pytest.importorskip("sentence_transformers")
+    from ner_lib.signals.semantic import batch_cosine_similarity, batch_cosine_similarity_prenormed
+    
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal(16).astype(np.float32)
+    candidates = rng.standard_normal((50, 16)).astype(np.float32)
+    
+    query_unit = query / np.linalg.norm(query)
+    candidate_units = candidates / np.linalg.norm(candidates, axis=1, keepdims=True)
+    
+    np.testing.assert_allclose(
+        batch_cosine_similarity_prenormed(query_unit, candidate_units),
+        batch_cosine_similarity(query, candidates),
+        rtol=1e-5, atol=1e-6
+    )
+
+
+def test_batch_cosine_similarity_prenormed_fp16_blocks():
+    """Test a float16 candidate matrix spanning several blocks matches float32."""
+    import numpy as np
+    pytest.importorskip("sentence_transformers")
+    from ner_lib.signals import semantic
+    
+    rng = np.random.default_rng(0)
+    n = 2 * semantic._FP16_BLOCK_ROWS + 3
+    candidates = rng.standard_normal((n, 8)).astype(np.float32)
+    candidate_units = (candidates / np.linalg.norm(candidates, axis=1, keepdims=True)).astype(np.float16)
+    query_unit = candidate_units[-1].astype(np.float32)
+    
+    scores = semantic.batch_cosine_similarity_prenormed(query_unit, candidate_units)
+    expected = semantic.batch_cosine_similarity_prenormed(query_unit, candidate_units.astype(np.float32))
+    
+    assert scores.dtype == np.float32
+    assert scores.shape == (n,)
+    np.testing.assert_allclose(scores, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_semantic_similarity_to_entity_mean_pooling():
+    """Test mean pooling over the alias centroid equals the mean per-alias score."""
+    import numpy as np
+    pytest.importorskip("sentence_transformers")
+    from ner_lib.signals.semantic import alias_centroid, cosine_similarity, semantic_similarity_to_entity
+    
+    rng = np.random.default_rng(0)
+    mention = rng.standard_normal(16).astype(np.float32)
+    aliases = rng.standard_normal((4, 16)).astype(np.float32)
+    
+    expected = np.mean([cosine_similarity(mention, alias) for alias in aliases])
+    assert semantic_similarity_to_entity(mention, alias_centroid(aliases), pooling="mean") == pytest.approx(expected, abs=1e-6)
+    
+    # A zero mention embedding scores 0.0, as in cosine_similarity
+    zero = np.zeros(16, dtype=np.float32)
+    assert semantic_similarity_to_entity(zero, alias_centroid(aliases)) == 0.0
+    assert semantic_similarity_to_entity(zero, aliases, pooling="max") == 0.0
+
+
+def test_phrase_matcher_match_batch():
+    """Test PhraseMatcherLookup.match_batch equals match() per mention."""
+    from ner_lib.signals.deterministic import PhraseMatcherLookup
+    
+    lookup = PhraseMatcherLookup()
+    lookup.add_batch([
+        Entity(id="apple", canonical_name="Apple Inc.", aliases=["AAPL"]),
+        Entity(id="msft", canonical_name="Microsoft Corporation", aliases=["MSFT"]),
+    ])
+    mentions = ["Apple Inc.", "msft", "Google", "", "shares of AAPL"]
+    
+    results = lookup.match_batch(mentions, batch_size=2)
+    
+    assert results == [lookup.match(mention) for mention in mentions]
+    assert [result and result[0] for result in results] == ["apple", "msft", None, None, "apple"]
+
+
+def test_flashtext_lookup_finalize():
+    """Test FlashTextLookup matches the same before and after finalize()."""
+    from ner_lib.signals.deterministic import FlashTextLookup
+    
+    lookup = FlashTextLookup()
+    lookup.add_entity("apple", "Apple Inc.", aliases=["AAPL"])
+    
+    # match() finalizes pending keywords itself
+    assert lookup.match("shares of aapl")[0] == "apple"
+    
+    lookup.add_entity("msft", "Microsoft", aliases=["MSFT"])
+    lookup.finalize()
+    lookup.finalize()  # nothing pending: no-op
+    
+    assert lookup.match("msft earnings")[0] == "msft"
+    assert lookup.match("Apple Inc. and Microsoft")[0] == "apple"
+    assert lookup.match("Google") is None
+
+
+@pytest.mark.parametrize("metric, normalize", [("cosine", True), ("l2", False)])
+def test_embedding_model_normalization_opt_in(metric, normalize):
+    """Test encode() stays raw by default and the resolver opts in for cosine."""
+    pytest.importorskip("sentence_transformers")
+    from ner_lib.config import Config
+    from ner_lib.signals import EmbeddingModel
+    
+    assert EmbeddingModel().normalize is False
+    
+    config = Config()
+    config.ann.metric = metric
+    assert EntityResolver(mode='A', config=config).embedding_model.normalize is normalize
 
 
 if __name__ == "__main__":
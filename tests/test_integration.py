@@ -1,24 +1,30 @@
 """Integration tests for NER library enhancements."""
 
+from itertools import islice
+
 import pytest
 from ner_lib import (
     recognize_entities,
+    recognize_entities_batch,
+    group_by_type,
     get_aliases,
-    canonicalize_entity,
-    EntityResolver
+    canonicalize_entity
 )
 
+# Entity types the resolution workflow picks up
+_ENT_TYPES = frozenset({'ORG', 'PERSON'})
+
 
-def test_ner_to_aliases_workflow():
+def test_ner_to_aliases_workflow(nlp):
     """Test workflow from NER to alias retrieval."""
     # Step 1: Extract entities
     text = "Microsoft was founded by Bill Gates."
-    ner_result = recognize_entities(text)
+    ner_result = recognize_entities(text, nlp=nlp)
     
     assert ner_result['total_entities'] > 0
     
     # Step 2: Get aliases for first entity (if any ORG found)
-    org_entities = [e for e in ner_result['entities'] if e['type'] == 'ORG']
+    org_entities = group_by_type(ner_result['entities'])['ORG']
     
     if org_entities:
         entity = org_entities[0]['text']
@@ -38,14 +44,18 @@ def test_aliases_to_canonicalization_workflow():
         assert isinstance(alias_result['aliases'], list)
 
 
-def test_full_ner_canonicalization_resolution_workflow():
+def test_full_ner_canonicalization_resolution_workflow(nlp, resolver):
     """Test full workflow: NER → Canonicalization → Resolution."""
     # Setup
-    text = "Apple Inc. makes great products."
+    texts = [
+        "Apple Inc. makes great products.",
+        "Microsoft was founded by Bill Gates.",
+    ]
     
-    # Step 1: NER
-    ner_result = recognize_entities(text)
-    entities = [e for e in ner_result['entities'] if e['type'] in ['ORG', 'PERSON']]
+    # Step 1: NER (all texts in one nlp.pipe pass)
+    entities = []
+    for ner_result in recognize_entities_batch(texts, nlp=nlp):
+        entities.extend(e for e in ner_result['entities'] if e['type'] in _ENT_TYPES)
     
     if not entities:
         pytest.skip("No ORG/PERSON entities found in test text")
@@ -59,12 +69,10 @@ def test_full_ner_canonicalization_resolution_workflow():
     assert 'normalized_name' in canon_result
     
     # Step 3: Add to knowledge base and resolve
-    resolver = EntityResolver(mode='A')
-    
     # Add entity
     resolver.add_entity(
         canon_result['canonical_name'],
-        aliases=canon_result.get('aliases', [])[:3]
+        aliases=islice(canon_result.get('aliases', ()), 3)
     )
     
     # Resolve
@@ -74,17 +82,49 @@ def test_full_ner_canonicalization_resolution_workflow():
     assert result is not None
 
 
+def test_alias_lookup_matches_linear_scan(resolver):
+    """Test hashed alias resolution against a linear alias scan (10k aliases)."""
+    from ner_lib.normalization.text import normalize_entity_name
+    
+    names = {}
+    for i in range(2500):
+        aliases = [f"EW{i}", f"Widgets Entity{i}", f"Entity Number {i}"]
+        entity_id = resolver.add_entity(f"Entity{i} Widgets", aliases=aliases)
+        names[entity_id] = [f"Entity{i} Widgets"] + aliases
+    
+    def scan(query):
+        normalized = normalize_entity_name(query)
+        match = None
+        for entity_id, entity_names in names.items():
+            if any(normalize_entity_name(name) == normalized for name in entity_names):
+                match = entity_id  # later entities win, as in the index
+        return match
+    
+    queries = ["ew7", "WIDGETS ENTITY1234", "entity number 2499", "Entity42 Widgets", "ew9999"]
+    for query in queries:
+        expected = scan(query)
+        result = resolver.resolve(query)
+        if expected is None:
+            assert result.confidence < 1.0
+        else:
+            assert result.matched_entity.id == expected
+            assert result.confidence == 1.0
+
+
 def test_multiple_canonicalization_types():
     """Test using multiple canonicalization functions together."""
-    from ner_lib import canonicalize_relationship, canonicalize_property_name
+    from ner_lib import canonicalize_batch
     
-    # Canonicalize a verb
-    verb_result = canonicalize_relationship("executing")
+    # Canonicalize a verb and an adjective in one spaCy pass
+    verb_result, adj_result = canonicalize_batch(
+        ["executing", "fastest"],
+        ["relationship", "property-name"]
+    )
     assert 'lemma' in verb_result
-    
-    # Canonicalize an adjective
-    adj_result = canonicalize_property_name("fastest")
     assert 'lemma' in adj_result
+    
+    with pytest.raises(ValueError):
+        canonicalize_batch(["executing"], ["verb"])
 
 
 if __name__ == "__main__":
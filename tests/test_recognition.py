@@ -1,63 +1,155 @@
 """Tests for Named Entity Recognition module."""
 
+import json
+import numpy as np
 import pytest
-from ner_lib import recognize_entities
+from ner_lib import recognize_entities, recognize_entities_batch, group_by_type, entities_to_soa
+from tests.helpers import assert_contains_any
 
 
-def test_recognize_entities_basic():
+# Texts shared by the recognition tests, recognized in one nlp.pipe pass
+CASES = {
+    "basic": "Apple Inc. was founded by Steve Jobs in Cupertino, California.",
+    "types": "Microsoft is based in Seattle. Bill Gates founded it.",
+    "counting": "Apple makes the iPhone. Apple also makes the iPad. Apple is innovative.",
+    "empty_text": "",
+    "no_entities": "The quick brown fox jumps over the lazy dog.",
+}
+
+
+@pytest.fixture(scope="module")
+def results(nlp):
+    """recognize_entities results for CASES, keyed by case name."""
+    return dict(zip(CASES, recognize_entities_batch(list(CASES.values()), nlp=nlp)))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_recognize_entities_result_shape(results, case):
+    """Test every result lists its entities with type, text and count."""
+    result = results[case]
+    
+    assert isinstance(result['entities'], list)
+    assert result['total_entities'] == len(result['entities'])
+    assert all(
+        {'type', 'text', 'count'} <= entity.keys() and entity['count'] >= 1
+        for entity in result['entities']
+    )
+
+
+def test_recognize_entities_basic(results):
     """Test basic entity recognition."""
-    text = "Apple Inc. was founded by Steve Jobs in Cupertino, California."
-    result = recognize_entities(text)
+    result = results["basic"]
     
     assert result['total_entities'] > 0
-    assert 'entities' in result
-    assert len(result['entities']) > 0
     
     # Check that we found some expected entities
-    entity_texts = [e['text'] for e in result['entities']]
-    assert any('Apple' in text for text in entity_texts)
-
-
-def test_recognize_entities_types():
-    """Test entity type detection."""
-    text = "Microsoft is based in Seattle. Bill Gates founded it."
-    result = recognize_entities(text)
-    
-    # Check entity types are present
-    for entity in result['entities']:
-        assert 'type' in entity
-        assert 'text' in entity
-        assert 'count' in entity
-        assert entity['count'] >= 1
+    assert_contains_any(result['entities'], ['Apple'])
 
 
-def test_recognize_entities_counting():
+def test_recognize_entities_counting(results):
     """Test occurrence counting."""
-    text = "Apple makes the iPhone. Apple also makes the iPad. Apple is innovative."
-    result = recognize_entities(text)
-    
     # Find Apple in entities
-    apple_entities = [e for e in result['entities'] if 'Apple' in e['text']]
+    apple_entities = [e for e in results["counting"]['entities'] if 'Apple' in e['text']]
     if apple_entities:
         # Should count Apple multiple times
         assert apple_entities[0]['count'] >= 1
 
 
-def test_recognize_entities_empty_text():
+def test_recognize_entities_empty_text(results):
     """Test with empty text."""
-    result = recognize_entities("")
+    assert results["empty_text"]['total_entities'] == 0
+
+
+def test_recognize_entities_blank_text_skips_pipeline():
+    """Test blank text returns an empty result without running spaCy."""
+    for text in ["", "   ", "\n\t"]:
+        result = recognize_entities(text, model_name="no_such_model")
+        
+        assert result['entities'] == []
+        assert result['total_entities'] == 0
+        assert result['entity_types'] == {}
+        json.dumps(result)
+
+
+def test_recognize_entities_batch(nlp):
+    """Test batch recognition matches single-text results."""
+    texts = [
+        "Apple Inc. was founded by Steve Jobs in Cupertino, California.",
+        "Microsoft is based in Seattle. Bill Gates founded it.",
+    ]
+    results = recognize_entities_batch(texts, nlp=nlp)
     
-    assert'entities' in result
-    assert result['total_entities'] == 0
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        assert result == recognize_entities(text, nlp=nlp)
 
 
-def test_recognize_entities_no_entities():
-    """Test text with no named entities."""
-    text = "The quick brown fox jumps over the lazy dog."
-    result = recognize_entities(text)
+def test_entities_to_soa():
+    """Test the column (SoA) view of recognized entities."""
+    entities = [
+        {'text': 'Apple Inc.', 'type': 'ORG', 'count': 2},
+        {'text': 'Steve Jobs', 'type': 'PERSON', 'count': 1},
+        {'text': 'Mona Lisa', 'type': 'WORK_OF_ART', 'count': 1},
+        {'text': 'Microsoft', 'type': 'ORG', 'count': 1},
+    ]
+    soa = entities_to_soa(entities)
     
-    # May find 0 or few entities
-    assert isinstance(result['entities'], list)
+    assert soa['texts'].tolist() == [e['text'] for e in entities]
+    assert soa['types'].tolist() == [e['type'] for e in entities]
+    assert soa['counts'].tolist() == [e['count'] for e in entities]
+    assert soa['counts'].dtype == np.int32
+    
+    orgs = soa['texts'][soa['types'] == 'ORG']
+    assert orgs.tolist() == [e['text'] for e in group_by_type(entities)['ORG']]
+    assert len(entities_to_soa([])['texts']) == 0
+
+
+@pytest.mark.gpu
+def test_recognize_entities_batch_gpu(gpu_nlp):
+    """Test batch recognition with the transformer pipeline on the GPU."""
+    texts = [
+        "Apple Inc. was founded by Steve Jobs in Cupertino, California.",
+        "Microsoft is based in Seattle. Bill Gates founded it.",
+    ] * 64
+    # Transformer pipelines want large outer batches on the GPU
+    results = recognize_entities_batch(texts, nlp=gpu_nlp, batch_size=128)
+    
+    assert len(results) == len(texts)
+    assert_contains_any(results[0]['entities'], ['Apple'])
+    assert results[0]['entities'] == results[2]['entities']
+
+
+def test_entity_strings_are_interned():
+    """Test entity types and repeated entity texts are shared across results."""
+    import spacy
+    from spacy.tokens import Span
+    from ner_lib.recognition.recognition import _summarize_entities
+    
+    blank = spacy.blank("en")
+    summaries = []
+    for text in ["Apple makes Apple things", "Apple and Apple"]:
+        doc = blank(text)
+        doc.ents = [Span(doc, 0, 1, "ORG"), Span(doc, 2, 3, "ORG")]
+        summaries.append(_summarize_entities(doc.ents)['entities'][0])
+    
+    first, second = summaries
+    assert first == {"text": "Apple", "type": "ORG", "count": 2}
+    assert first['text'] is second['text']
+    assert first['type'] is second['type']
+
+
+def test_group_by_type():
+    """Test single-pass bucketing of entities by type."""
+    entities = [
+        {"text": "Apple", "type": "ORG", "count": 2},
+        {"text": "Steve Jobs", "type": "PERSON", "count": 1},
+        {"text": "Microsoft", "type": "ORG", "count": 1},
+    ]
+    buckets = group_by_type(entities)
+    
+    assert [e["text"] for e in buckets["ORG"]] == ["Apple", "Microsoft"]
+    assert [e["text"] for e in buckets["PERSON"]] == ["Steve Jobs"]
+    assert buckets["GPE"] == []
 
 
 if __name__ == "__main__":